@@ -0,0 +1,47 @@
+"""Memory footprint of the reification targets on a large formula: clingo
+facts, syntax.Formula objects and FormulaArrays.
+
+Usage: python -m benchmarks.array_memory [number of conjuncts]
+"""
+
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+from ltlf2asp.parser import (
+    FormulaContext,
+    parse_formula,
+    parse_formula_arrays,
+    parse_formula_object,
+)
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+
+def measure(name, build) -> None:
+    tracemalloc.start()
+    start = perf_counter()
+    result = build()
+    elapsed = perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{:<16} {:>8.2f} MiB {:>8.3f}s".format(name, size / 2**20, elapsed))
+    return result
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    lines = CORPUS.read_text().splitlines()[:n]
+    formula = " & ".join("({})".format(x) for x in lines)
+
+    measure("facts", lambda: parse_formula(formula))
+    measure("syntax.Formula", lambda: parse_formula_object(formula, FormulaContext()))
+    arrays = measure("FormulaArrays", lambda: parse_formula_arrays(formula))
+    print("{} nodes, {} bytes of arrays".format(len(arrays), arrays.nbytes()))
+
+    measure("arrays -> facts", arrays.to_facts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Progression automata against the explicit-state tableau on corpus
+formulas: with a cold cache for each formula, with the automata cached by a
+first pass, and on variants of each formula (conjoined with small
+constraints), each of which gets an automaton of its own.
+
+Usage: python -m benchmarks.automata [number of formulas]
+"""
+
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from ltlf2asp.parser import parse_formula_object
+from ltlf2asp.parser.syntax import Conjunction
+from ltlf2asp.solve import explicit_tableaux
+from ltlf2asp.solve.automata import Automata
+from ltlf2asp.solve.decode_model import SolveStatus
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+VARIATIONS = ["p0", "F(p1)", "G(p2 -> X p3)", "~p4 U p5"]
+
+
+def measure(name: str, solve, formulas) -> None:
+    latencies, answers = [], []
+    for f in formulas:
+        start = perf_counter()
+        answers.append(solve(f))
+        latencies.append(1000 * (perf_counter() - start))
+
+    q = statistics.quantiles(latencies, n=100)
+    print(
+        "{:<22} {:>4} sat {:>4} unsat  p50 {:>7.2f}ms  p99 {:>8.1f}ms  "
+        "total {:>7.2f}s".format(
+            name,
+            answers.count(SolveStatus.SATISFIABLE),
+            answers.count(SolveStatus.UNSATISFIABLE),
+            q[49],
+            q[98],
+            sum(latencies) / 1000,
+        )
+    )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    formulas = [parse_formula_object(x) for x in CORPUS.read_text().splitlines()[:n]]
+    variations = [parse_formula_object(x) for x in VARIATIONS]
+    variants = [Conjunction([f, g]) for f in formulas for g in variations]
+
+    measure("explicit", lambda f: explicit_tableaux.solve(f).status, formulas)
+    measure("automata cold", lambda f: Automata().solve(f).status, formulas)
+    shared = Automata()
+    for f in formulas:
+        shared.solve(f)
+    measure("automata warm", lambda f: shared.solve(f).status, formulas)
+
+    measure("explicit variants", lambda f: explicit_tableaux.solve(f).status, variants)
+    measure("automata variants", lambda f: shared.solve(f).status, variants)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Time to first ground of a large formula: parsing into a set of symbols and
+copying it into the backend vs. parsing straight into the backend.
+
+Usage: python -m benchmarks.backend_reification [number of conjuncts]
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import clingo
+
+from ltlf2asp.parser import parse_formula, parse_formula_into_backend
+from ltlf2asp.parser.reify_as_atoms import add_facts
+from ltlf2asp.solve import SOLVE_INCREMENTAL
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+
+def ground(add) -> float:
+    start = perf_counter()
+    ctl = clingo.Control()
+    with ctl.backend() as backend:
+        add(backend)
+    ctl.load(SOLVE_INCREMENTAL)
+    ctl.ground([("base", []), ("formula", [])])
+    return perf_counter() - start
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    lines = CORPUS.read_text().splitlines()[:n]
+    formula = " & ".join("({})".format(x) for x in lines)
+
+    facts = parse_formula(formula)
+    print("{} conjuncts, {} facts".format(len(lines), len(facts)))
+
+    via_set = ground(lambda b: add_facts(b, parse_formula(formula)))
+    streamed = ground(lambda b: parse_formula_into_backend(formula, b))
+    print("set of symbols, then backend: {:.3f}s".format(via_set))
+    print("straight into backend:        {:.3f}s".format(streamed))
+
+
+if __name__ == "__main__":
+    main()
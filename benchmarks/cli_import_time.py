@@ -0,0 +1,76 @@
+"""Import time of each CLI subcommand, as reported by `python -X importtime`,
+and wall time of the whole process.
+
+Usage: python -m benchmarks.cli_import_time [runs]
+"""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+RUN = "import sys; from ltlf2asp.cli import run; sys.argv = sys.argv[:1] + {!r}; run()"
+
+TRACE = '{"model": {"states": [{"a": "true", "b": "false"}]}}'
+
+
+def subcommands(tmp: Path):
+    formula = tmp / "formula.ltl"
+    formula.write_text("G(a -> X b) & F(c)")
+    (tmp / "trace.json").write_text(TRACE)
+    yield "parse -o", ["parse", str(formula), "-o", str(tmp / "formula.bin")]
+    yield (
+        "parse -o -e pratt",
+        [
+            "parse",
+            str(formula),
+            "-o",
+            str(tmp / "formula.bin"),
+            "-e",
+            "pratt",
+        ],
+    )
+    yield "parse", ["parse", str(formula), "-m", "dag"]
+    yield "solve", ["solve", str(formula), "4", "-q"]
+    yield "solve (formula file)", ["solve", str(tmp / "formula.bin"), "4", "-q"]
+    yield "solve -e pratt", ["solve", str(formula), "4", "-q", "-e", "pratt"]
+    yield "check", ["check", str(tmp / "trace.json"), str(formula)]
+    yield "reynolds", ["reynolds", str(formula), "4"]
+    yield "hybrid", ["hybrid", str(formula), "8"]
+
+
+def importtime(argv):
+    """Total import time (us) and names of the modules imported."""
+    command = [sys.executable, "-X", "importtime", "-c", RUN.format(argv)]
+    start = perf_counter()
+    p = subprocess.run(command, capture_output=True, text=True, check=True)
+    wall = perf_counter() - start
+
+    total, modules = 0, set()
+    for line in p.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        total += int(self_us)
+        modules.add(name.strip())
+    return total, modules, wall
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, argv in subcommands(Path(tmp)):
+            samples = [importtime(argv) for _ in range(runs)]
+            total = min(x[0] for x in samples)
+            wall = min(x[2] for x in samples)
+            loaded = [x for x in ("clingo", "lark") if x in samples[0][1]]
+            print(
+                "{:<22} imports {:>7.1f} ms  process {:>7.1f} ms  loads {}".format(
+                    name, total / 1000, wall * 1000, ", ".join(loaded) or "-"
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Per-formula latency of the hybrid solver, alternating the model search and
+the tableaux or running them concurrently in two threads, on the formulas of
+the Reynolds tests and on a sample of the random corpus.
+
+Usage: python -m benchmarks.concurrent_hybrid [number of formulas] [horizon]
+"""
+
+import os
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from ltlf2asp.parser import parse_formula, parse_formula_object, tableaux_reify
+from ltlf2asp.solve.hybrid_solve import solve, solve_concurrent
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+REYNOLDS = [
+    "a",
+    "~a",
+    "a & b",
+    "WX a",
+    "X b",
+    "(a U b) & (~a) & X(~a)",
+    "F(a) & F(~a)",
+    "G(a) & F(a)",
+    "G(WX(a))",
+    "a & (a -> G(~b)) & F(b)",
+    "~a & a",
+    "X(True) & (WX a) & G(a -> X(a))",
+    "G(X(a))",
+    "G(a -> X a) & F(a)",
+    "F(false)",
+    "G(true)",
+    "G(a -> X b) & G(b -> X a) & F(a)",
+]
+
+SOLVERS = {"alternating": solve, "concurrent": solve_concurrent}
+
+
+def measure(name: str, formulas, horizon: int) -> None:
+    for solver, solve_hybrid in SOLVERS.items():
+        latencies = []
+        for f, g in formulas:
+            start = perf_counter()
+            solve_hybrid(f, g, horizon)
+            latencies.append(1000 * (perf_counter() - start))
+
+        q = statistics.quantiles(latencies, n=100)
+        print(
+            "{:<8} {:<12} p50 {:>7.1f}ms  p90 {:>7.1f}ms  max {:>7.1f}ms  "
+            "total {:>6.2f}s".format(
+                name, solver, q[49], q[89], max(latencies), sum(latencies) / 1000
+            )
+        )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    horizon = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+
+    def load(strings):
+        return [
+            (parse_formula(x), tableaux_reify(parse_formula_object(x).to_nnf()))
+            for x in strings
+        ]
+
+    print("{} cpus".format(os.cpu_count()))
+    measure("reynolds", load(REYNOLDS), horizon)
+    measure("corpus", load(CORPUS.read_text().splitlines()[:n]), horizon)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Solve time of the incremental loop and of the Reynolds tableaux on corpus
+formulas, for each clasp configuration preset and thread count.
+
+Usage: python -m benchmarks.configurations [number of formulas] [horizon] [threads]
+"""
+
+import os
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from ltlf2asp.parser import parse_formula, parse_formula_object, tableaux_reify
+from ltlf2asp.solve.configuration import PRESETS, SolverConfiguration
+from ltlf2asp.solve.solver_interface import Solver
+from ltlf2asp.solve.tableaux import Reynolds
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    horizon = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    threads = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count() or 1
+    lines = CORPUS.read_text().splitlines()[:n]
+    facts = [parse_formula(x) for x in lines]
+    tableaux = [tableaux_reify(parse_formula_object(x)) for x in lines]
+
+    configurations = [SolverConfiguration(preset=x) for x in (None, *PRESETS)]
+    if threads > 1:
+        configurations += [
+            SolverConfiguration(threads, mode) for mode in ("compete", "split")
+        ]
+
+    print("{} cpus".format(os.cpu_count()))
+    for configuration in configurations:
+        solver = Solver(True, horizon, configuration=configuration)
+        start = perf_counter()
+        for x in facts:
+            solver.solve(x)
+        incremental = perf_counter() - start
+
+        reynolds = Reynolds(False, configuration)
+        start = perf_counter()
+        for x in tableaux:
+            reynolds.solve(x, horizon)
+        tableaux_time = perf_counter() - start
+
+        print(
+            "{:<40} incremental {:>7.2f}s  reynolds {:>7.2f}s".format(
+                " ".join(configuration.arguments()) or "default",
+                incremental,
+                tableaux_time,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
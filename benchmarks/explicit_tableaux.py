@@ -0,0 +1,107 @@
+"""The explicit-state tableau against the Reynolds encoding, at a fixed
+depth and deepened along the doubling schedule, on the handwritten Reynolds
+tests and on corpus formulas: time, answers, and answers that contradict the
+explicit tableau (which needs no depth bound).
+
+Usage: python -m benchmarks.explicit_tableaux [number of formulas] [depth]
+"""
+
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from ltlf2asp.parser import parse_formula_object, tableaux_reify
+from ltlf2asp.solve import explicit_tableaux
+from ltlf2asp.solve.decode_model import SolveStatus
+from ltlf2asp.solve.schedule import DOUBLING
+from ltlf2asp.solve.tableaux import Reynolds, ReynoldsIncremental
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+HANDWRITTEN = [
+    "a",
+    "~a",
+    "a & b",
+    "WX a",
+    "X b",
+    "(a U b) & (~a) & X(~a)",
+    "F(a) & F(~a)",
+    "G(a) & F(a)",
+    "G(WX(a))",
+    "a & (a -> G(~b)) & F(b)",
+    "~a & a",
+    "X(True) & (WX a) & G(a -> X(a))",
+    "G(X(a))",
+    "G(a -> X a) & F(a)",
+    "F(false)",
+    "G(true)",
+    "G(a -> X b) & G(b -> X a) & F(a)",
+]
+
+
+def reynolds(depth):
+    def solve(f):
+        return Reynolds(False).solve(tableaux_reify(f), depth).status
+
+    return solve
+
+
+def deepening(depth):
+    def solve(f):
+        g = tableaux_reify(f)
+        tableaux = ReynoldsIncremental(False)
+        for _, b in DOUBLING.segments(depth + 1):
+            status = tableaux.solve(g, b).status
+            if status != SolveStatus.UNKNOWN:
+                return status
+        return SolveStatus.UNKNOWN
+
+    return solve
+
+
+def measure(name: str, formulas, depth: int) -> None:
+    solvers = {
+        "explicit": lambda f: explicit_tableaux.solve(f).status,
+        "reynolds d={}".format(depth): reynolds(depth),
+        "deepening d<={}".format(depth): deepening(depth),
+    }
+    expected = None
+    for solver, solve in solvers.items():
+        latencies, answers = [], []
+        for f in formulas:
+            start = perf_counter()
+            answers.append(solve(f))
+            latencies.append(1000 * (perf_counter() - start))
+
+        expected = expected or answers
+        wrong = sum(x != y for x, y in zip(answers, expected))
+        q = statistics.quantiles(latencies, n=100)
+        print(
+            "{:<12} {:<16} {:>4} sat {:>4} unsat {:>4} differ  p50 {:>7.1f}ms  "
+            "p99 {:>8.1f}ms  total {:>7.2f}s".format(
+                name,
+                solver,
+                answers.count(SolveStatus.SATISFIABLE),
+                answers.count(SolveStatus.UNSATISFIABLE),
+                wrong,
+                q[49],
+                q[98],
+                sum(latencies) / 1000,
+            )
+        )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+    def load(strings):
+        return [parse_formula_object(x).to_nnf() for x in strings]
+
+    measure("handwritten", load(HANDWRITTEN), depth)
+    measure("corpus", load(CORPUS.read_text().splitlines()[:n]), depth)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Load time of a large formula: parsing its text vs. mapping the formula
+file written by `ltlf2asp parse -o`.
+
+Usage: python -m benchmarks.formula_file_load [number of conjuncts]
+"""
+
+import re
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from ltlf2asp.parser import parse_formula, parse_formula_arrays
+from ltlf2asp.parser.binary_format import dump_arrays, load_arrays
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 15000
+    lines = CORPUS.read_text().splitlines()
+    # Rename propositions on every pass over the corpus, so that conjuncts
+    # do not share subformulas.
+    conjuncts = [
+        re.sub(r"\bp(\d+)", r"p\1_{}".format(i // len(lines)), lines[i % len(lines)])
+        for i in range(n)
+    ]
+    formula = " & ".join("({})".format(x) for x in conjuncts)
+
+    start = perf_counter()
+    arrays = parse_formula_arrays(formula)
+    parsing = perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp, "formula.bin")
+        dump_arrays(arrays, path)
+        size = path.stat().st_size
+
+        start = perf_counter()
+        loaded = load_arrays(path)
+        loading = perf_counter() - start
+
+        start = perf_counter()
+        facts = loaded.to_facts()
+        replaying = perf_counter() - start
+
+    start = perf_counter()
+    parse_formula(formula)
+    parsing_facts = perf_counter() - start
+
+    print("{} nodes, {} facts, {} bytes on disk".format(len(arrays), len(facts), size))
+    print("text -> arrays:        {:.3f}s".format(parsing))
+    print("mmap -> arrays:        {:.6f}s".format(loading))
+    print("text -> facts:         {:.3f}s".format(parsing_facts))
+    print("mmap -> facts:         {:.3f}s".format(loading + replaying))
+
+
+if __name__ == "__main__":
+    main()
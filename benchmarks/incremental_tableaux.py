@@ -0,0 +1,52 @@
+"""Time to run the Reynolds tableaux on corpus formulas at increasing depths,
+one-shot (a fresh Control per depth) or on the multi-shot encoding (one
+Control per formula, grounding only the new steps).
+
+Usage: python -m benchmarks.incremental_tableaux [number of formulas] [depth]
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from ltlf2asp.parser import parse_formula_object, tableaux_reify
+from ltlf2asp.solve.schedule import DOUBLING, Linear
+from ltlf2asp.solve.tableaux import Reynolds, ReynoldsIncremental
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    formulas = [
+        tableaux_reify(parse_formula_object(x).to_nnf())
+        for x in CORPUS.read_text().splitlines()[:n]
+    ]
+
+    for schedule_name, schedule in (("doubling", DOUBLING), ("linear", Linear())):
+        for name, tableaux in (
+            ("one-shot", Reynolds),
+            ("incremental", ReynoldsIncremental),
+        ):
+            # Cumulated time to go through the depths of the schedule.
+            times = {}
+            for g in formulas:
+                solver = tableaux(False)
+                start = perf_counter()
+                for _, b in schedule.segments(depth + 1):
+                    solver.solve(g, b)
+                    times[b] = times.get(b, 0.0) + perf_counter() - start
+
+            print(
+                "{:<9} {:<12} ".format(schedule_name, name)
+                + "  ".join(
+                    "d={} {:.2f}s".format(b, t)
+                    for b, t in times.items()
+                    if b & (b - 1) == 0
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Ground program size and solve time on corpus formulas, with derived
+operators desugared (the default) and reified natively.
+
+Usage: python -m benchmarks.native_operators [number of formulas] [horizon]
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import clingo
+
+from ltlf2asp.parser import parse_formula
+from ltlf2asp.parser.reify_as_atoms import add_facts
+from ltlf2asp.solve import SOLVE_STATIC
+from ltlf2asp.solve.incremental_solve_loop import solve
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+
+def ground_size(facts, horizon: int) -> int:
+    ctl = clingo.Control(["-c a=0", "-c b={}".format(horizon)])
+    with ctl.backend() as backend:
+        add_facts(backend, facts)
+    ctl.load(SOLVE_STATIC)
+    ctl.ground([("base", [])])
+    ctl.solve()
+    return int(ctl.statistics["problem"]["lp"]["rules"])
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    horizon = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    lines = CORPUS.read_text().splitlines()[:n]
+
+    for native in (False, True):
+        facts = [parse_formula(x, native=native) for x in lines]
+        rules = sum(ground_size(x, horizon) for x in facts)
+
+        start = perf_counter()
+        for x in facts:
+            solve(x, horizon)
+        elapsed = perf_counter() - start
+
+        print(
+            "native={!s:<5} {:>8} facts {:>9} ground rules {:>8.3f}s solving".format(
+                native, sum(len(x) for x in facts), rules, elapsed
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""NNF conversion time on nested equivalence chains
+((p0 <-> p1) <-> p2) <-> ... , where every level duplicates its operands.
+
+Usage: python -m benchmarks.nnf_equivalence_chain [max chain length]
+"""
+
+import sys
+from time import perf_counter
+
+from ltlf2asp.parser import FormulaContext
+from ltlf2asp.parser.syntax import FormulaBuilder
+
+
+def chain(n: int, context: FormulaContext):
+    f = FormulaBuilder.proposition("p0", context)
+    for i in range(1, n + 1):
+        f = FormulaBuilder.equivalence(f, FormulaBuilder.proposition(f"p{i}", context))
+    return f
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 18
+    for k in range(2, n + 1, 2):
+        context = FormulaContext()
+        f = chain(k, context)
+        start = perf_counter()
+        g = f.to_nnf()
+        elapsed = perf_counter() - start
+        print(
+            "<-> chain of {:3d}: {:10.4f}s ({} nodes)".format(k, elapsed, len(context))
+        )
+        if elapsed > 30:
+            break
+    del g
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Per-formula parse latency, rebuilding the LALR tables on every call vs.
+reusing the process-wide parser.
+
+Usage: python -m benchmarks.parse_latency [number of formulas]
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from lark import Lark
+
+from ltlf2asp.parser.parser import (
+    GRAMMAR,
+    LTLfFlatTransformer,
+    _build_parser,
+    parse_formula,
+)
+from ltlf2asp.parser.reify_as_atoms import ReifyFormulaAsFacts
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+
+def parse_rebuilding_tables(formula_string: str) -> None:
+    parser = Lark(GRAMMAR.read_text(), parser="lalr", start="start")
+    LTLfFlatTransformer(ReifyFormulaAsFacts).transform(parser.parse(formula_string))
+
+
+def per_formula_ms(fn, formulas) -> float:
+    start = perf_counter()
+    for formula in formulas:
+        fn(formula)
+    return 1000 * (perf_counter() - start) / len(formulas)
+
+
+def cold_start_ms(cache_dir) -> float:
+    _build_parser.cache_clear()
+    start = perf_counter()
+    _build_parser("start", cache_dir)
+    return 1000 * (perf_counter() - start)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    formulas = CORPUS.read_text().splitlines()[:n]
+
+    print("{} formulas".format(len(formulas)))
+    print(
+        "rebuilt tables: {:.3f} ms/formula".format(
+            per_formula_ms(parse_rebuilding_tables, formulas)
+        )
+    )
+    parse_formula(formulas[0])
+    print(
+        "cached parser:  {:.3f} ms/formula".format(
+            per_formula_ms(parse_formula, formulas)
+        )
+    )
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        print("cold start, no table cache:  {:.2f} ms".format(cold_start_ms(None)))
+        cold_start_ms(cache_dir)
+        print(
+            "cold start, warm table cache: {:.2f} ms".format(cold_start_ms(cache_dir))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Parsing throughput of the Lark and Pratt engines on the corpus, into
+clingo facts and into FormulaArrays, and on one large formula.
+
+Usage: python -m benchmarks.parser_engines [number of conjuncts]
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from ltlf2asp.parser import parse_formula, parse_formula_arrays
+from ltlf2asp.parser.parser import get_parser
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+
+def throughput(name, parse, lines) -> None:
+    start = perf_counter()
+    for x in lines:
+        parse(x)
+    elapsed = perf_counter() - start
+    size = sum(len(x) for x in lines)
+    print(
+        "{:<32} {:>8.3f}s {:>8.0f} formulas/s {:>6.2f} MB/s".format(
+            name, elapsed, len(lines) / elapsed, size / elapsed / 1e6
+        )
+    )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    lines = CORPUS.read_text().splitlines()
+    get_parser("start")
+
+    for engine in ("lark", "pratt"):
+        throughput(
+            "{}, facts".format(engine),
+            lambda x: parse_formula(x, engine=engine),
+            lines,
+        )
+        throughput(
+            "{}, arrays".format(engine),
+            lambda x: parse_formula_arrays(x, engine=engine),
+            lines,
+        )
+
+    formula = " & ".join("({})".format(x) for x in lines[:n])
+    for engine in ("lark", "pratt"):
+        throughput(
+            "{}, {} conjuncts".format(engine, n),
+            lambda x: parse_formula_arrays(x, engine=engine),
+            [formula],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Per-formula latency of the static loop, the incremental loop, the hybrid
+solver and the portfolio racing them in processes.
+
+Usage: python -m benchmarks.portfolio [number of formulas] [horizon]
+"""
+
+import os
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from ltlf2asp.parser.parser import parse_formula_arrays
+from ltlf2asp.parser.syntax import FormulaContext, tableaux_reify
+from ltlf2asp.solve import portfolio
+from ltlf2asp.solve.hybrid_solve import solve as solve_hybrid
+from ltlf2asp.solve.incremental_solve_loop import solve as solve_incremental
+from ltlf2asp.solve.static_solve_loop import solve as solve_static
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+SOLVERS = {
+    "static": lambda f, k: solve_static(f.to_facts(), k),
+    "incremental": lambda f, k: solve_incremental(f.to_backend, k),
+    "hybrid": lambda f, k: solve_hybrid(
+        f.to_facts(), tableaux_reify(f.to_formula(FormulaContext())), k
+    ),
+    "portfolio": portfolio.solve,
+}
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    horizon = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    formulas = [
+        parse_formula_arrays(x, simplify=True)
+        for x in CORPUS.read_text().splitlines()[:n]
+    ]
+
+    print("{} cpus".format(os.cpu_count()))
+    for name, solve in SOLVERS.items():
+        latencies, answers = [], 0
+        for f in formulas:
+            start = perf_counter()
+            result = solve(f, horizon)
+            latencies.append(1000 * (perf_counter() - start))
+            answers += result.status != "UNKNOWN"
+
+        q = statistics.quantiles(latencies, n=100)
+        print(
+            "{:<12} {:>4} answered  p50 {:>7.1f}ms  p90 {:>7.1f}ms  "
+            "p99 {:>7.1f}ms  max {:>7.1f}ms  total {:>6.2f}s".format(
+                name,
+                answers,
+                q[49],
+                q[89],
+                q[98],
+                max(latencies),
+                sum(latencies) / 1000,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
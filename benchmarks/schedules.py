@@ -0,0 +1,59 @@
+"""Solve time of the static and incremental loops on corpus formulas, with
+different horizon schedules.
+
+Usage: python -m benchmarks.schedules [number of formulas] [horizon]
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from ltlf2asp.parser import parse_formula
+from ltlf2asp.solve.decode_model import SolveStatus
+from ltlf2asp.solve.incremental_solve_loop import solve as solve_incremental
+from ltlf2asp.solve.schedule import parse_schedule
+from ltlf2asp.solve.static_solve_loop import solve as solve_static
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+SCHEDULES = (
+    "doubling",
+    "linear:1",
+    "linear:4",
+    "geometric:1.5",
+    "geometric:4",
+    "luby:1",
+    "luby:4",
+    "list:2,4,8,16,64,128,256",
+)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    horizon = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    facts = [parse_formula(x) for x in CORPUS.read_text().splitlines()[:n]]
+
+    for spec in SCHEDULES:
+        schedule = parse_schedule(spec)
+        for name, solve in (
+            ("static", solve_static),
+            ("incremental", solve_incremental),
+        ):
+            start = perf_counter()
+            results = [solve(x, horizon, schedule) for x in facts]
+            elapsed = perf_counter() - start
+
+            sat = [x for x in results if x.status == SolveStatus.SATISFIABLE]
+            print(
+                "{:<26} {:<12} {:>4} sat {:>7.2f} avg k {:>8.3f}s".format(
+                    spec,
+                    name,
+                    len(sat),
+                    sum(x.k for x in sat) / max(1, len(sat)),
+                    elapsed,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
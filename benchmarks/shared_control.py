@@ -0,0 +1,73 @@
+"""Grounding time per solve of the static loop, with one Control per horizon
+and with a single Control shared by all horizons.
+
+Usage: python -m benchmarks.shared_control [number of formulas] [horizon]
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import clingo
+
+from ltlf2asp.parser import parse_formula
+from ltlf2asp.solve import static_solve_loop
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+
+class TimedControl(clingo.Control):
+    """Accumulates the time spent loading facts and encoding, and grounding."""
+
+    grounding = 0.0
+    controls = 0
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        TimedControl.controls += 1
+
+    def backend(self):
+        start = perf_counter()
+        backend = super().backend()
+        TimedControl.grounding += perf_counter() - start
+        return backend
+
+    def load(self, path: str) -> None:
+        start = perf_counter()
+        super().load(path)
+        TimedControl.grounding += perf_counter() - start
+
+    def ground(self, *args, **kwargs) -> None:
+        start = perf_counter()
+        super().ground(*args, **kwargs)
+        TimedControl.grounding += perf_counter() - start
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    horizon = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    facts = [parse_formula(x) for x in CORPUS.read_text().splitlines()[:n]]
+
+    static_solve_loop.clingo.Control = TimedControl  # type: ignore
+    for name, solve in (
+        ("per horizon", static_solve_loop.solve),
+        ("shared", static_solve_loop.solve_shared),
+    ):
+        TimedControl.grounding, TimedControl.controls = 0.0, 0
+        start = perf_counter()
+        for x in facts:
+            solve(x, horizon)
+        elapsed = perf_counter() - start
+
+        print(
+            "{:<12} {:>6} controls {:>8.2f}ms grounding/solve {:>8.2f}ms total/solve".format(
+                name,
+                TimedControl.controls,
+                1000 * TimedControl.grounding / len(facts),
+                1000 * elapsed / len(facts),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
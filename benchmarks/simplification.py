@@ -0,0 +1,52 @@
+"""Ground program size and solve time on corpus formulas, as written and
+after simplification.
+
+Usage: python -m benchmarks.simplification [number of formulas] [horizon]
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import clingo
+
+from ltlf2asp.parser import parse_formula
+from ltlf2asp.parser.reify_as_atoms import add_facts
+from ltlf2asp.solve import SOLVE_STATIC
+from ltlf2asp.solve.incremental_solve_loop import solve
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+
+def ground_size(facts, horizon: int) -> int:
+    ctl = clingo.Control(["-c a=0", "-c b={}".format(horizon)])
+    with ctl.backend() as backend:
+        add_facts(backend, facts)
+    ctl.load(SOLVE_STATIC)
+    ctl.ground([("base", [])])
+    return len(ctl.symbolic_atoms)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    horizon = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    lines = CORPUS.read_text().splitlines()[:n]
+
+    for simplify in (False, True):
+        facts = [parse_formula(x, simplify) for x in lines]
+        atoms = sum(ground_size(x, horizon) for x in facts)
+
+        start = perf_counter()
+        for x in facts:
+            solve(x, horizon)
+        elapsed = perf_counter() - start
+
+        print(
+            "simplify={!s:<5} {:>8} facts {:>9} ground atoms {:>8.3f}s solving".format(
+                simplify, sum(len(x) for x in facts), atoms, elapsed
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Time of the Reynolds tableaux enumerating optimal branches (optN) or
+asking targeted questions, on the handwritten Reynolds tests and on corpus
+formulas, one-shot and multi-shot.
+
+Usage: python -m benchmarks.targeted_tableaux [number of formulas] [depth]
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from ltlf2asp.parser import parse_formula_object, tableaux_reify
+from ltlf2asp.solve.schedule import DOUBLING
+from ltlf2asp.solve.tableaux import Reynolds, ReynoldsIncremental
+
+CORPUS = Path(__file__).parent.parent / "tests/test_solve_random_sample/formulas.txt"
+
+HANDWRITTEN = [
+    "a",
+    "~a",
+    "a & b",
+    "WX a",
+    "X b",
+    "(a U b) & (~a) & X(~a)",
+    "F(a) & F(~a)",
+    "G(a) & F(a)",
+    "G(WX(a))",
+    "a & (a -> G(~b)) & F(b)",
+    "~a & a",
+    "X(True) & (WX a) & G(a -> X(a))",
+    "G(X(a))",
+    "G(a -> X a) & F(a)",
+    "F(false)",
+    "G(true)",
+    "G(a -> X b) & G(b -> X a) & F(a)",
+]
+
+
+def measure(name: str, formulas, depth: int) -> None:
+    for tableaux in (Reynolds, ReynoldsIncremental):
+        for targeted in (False, True):
+            # Deepening along the schedule, as in the hybrid solver.
+            start = perf_counter()
+            for g in formulas:
+                solver = tableaux(False, targeted=targeted)
+                for _, b in DOUBLING.segments(depth + 1):
+                    solver.solve(g, b)
+            print(
+                "{:<12} {:<20} {:<9} {:>7.2f}s".format(
+                    name,
+                    tableaux.__name__,
+                    "targeted" if targeted else "optN",
+                    perf_counter() - start,
+                )
+            )
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+    def load(strings):
+        return [tableaux_reify(parse_formula_object(x).to_nnf()) for x in strings]
+
+    measure("handwritten", load(HANDWRITTEN), depth)
+    measure("corpus", load(CORPUS.read_text().splitlines()[:n]), depth)
+
+
+if __name__ == "__main__":
+    main()
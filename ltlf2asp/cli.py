@@ -1,23 +1,40 @@
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Sequence
+from typing import TYPE_CHECKING, Optional, Sequence
 
-from ltlf2asp.solve.solver_interface import Solver
-from ltlf2asp.parser import parse_formula, parse_formula_object, tableaux_reify
 from dataclasses import dataclass
-from ltlf2asp.solve.check_model import check_trace
-from ltlf2asp.solve.parse_trace import parse_trace
-from ltlf2asp.solve.tableaux import Reynolds
-from ltlf2asp.solve.hybrid_solve import solve as hybrid_solve
+from functools import partial
+
+from ltlf2asp.solve.budget import Budget
+from ltlf2asp.solve.configuration import MODES, PRESETS, SolverConfiguration
+
+# Parsers and solvers are imported by the subcommands using them: the CLI is
+# often run as a short-lived process, and startup is dominated by imports.
+if TYPE_CHECKING:
+    from ltlf2asp.parser.reify_as_arrays import FormulaArrays
+    from ltlf2asp.parser.reify_as_atoms import FormulaFacts
+    from ltlf2asp.parser.syntax import Formula
+    from ltlf2asp.solve.schedule import Schedule
+
+ENGINES = ("lark", "pratt")
+PORTFOLIO = ("static", "incremental", "reynolds")
 
 
 @dataclass(frozen=True)
 class SolveArguments:
     formula: Path
     incremental: bool
+    shared: bool
     quiet: bool
     search_horizon: int
+    simplify: bool
+    native: bool
+    engine: str
+    schedule: "Schedule"
+    configuration: SolverConfiguration
+    budget: Budget
 
     def __post_init__(self) -> None:
         if not self.formula.is_file():
@@ -26,11 +43,40 @@ class SolveArguments:
         if self.search_horizon <= 0:
             raise RuntimeError("Search horizon must be a positive integer.")
 
+        if self.incremental and self.shared:
+            raise RuntimeError("--shared only applies to static solving.")
+
 
 @dataclass(frozen=True)
 class HybridArguments:
     formula: Path
     search_horizon: int
+    simplify: bool
+    native: bool
+    engine: str
+    schedule: Optional["Schedule"]
+    concurrent: bool
+    configuration: SolverConfiguration
+    budget: Budget
+
+    def __post_init__(self) -> None:
+        if not self.formula.is_file():
+            raise RuntimeError("Formula does not exist.")
+
+        if self.search_horizon <= 0:
+            raise RuntimeError("Search horizon must be a positive integer.")
+
+
+@dataclass(frozen=True)
+class PortfolioArguments:
+    formula: Path
+    search_horizon: int
+    simplify: bool
+    native: bool
+    engine: str
+    schedule: "Schedule"
+    solvers: Sequence[str]
+    configuration: SolverConfiguration
 
     def __post_init__(self) -> None:
         if not self.formula.is_file():
@@ -40,11 +86,41 @@ class HybridArguments:
             raise RuntimeError("Search horizon must be a positive integer.")
 
 
+@dataclass(frozen=True)
+class ExplicitArguments:
+    formula: Path
+    simplify: bool
+    engine: str
+    timeout: Optional[float]
+
+    def __post_init__(self) -> None:
+        if not self.formula.is_file():
+            raise RuntimeError("Formula does not exist.")
+
+
+@dataclass(frozen=True)
+class AutomataArguments:
+    formula: Path
+    simplify: bool
+    engine: str
+    timeout: Optional[float]
+    cache_dir: Optional[Path]
+
+    def __post_init__(self) -> None:
+        if not self.formula.is_file():
+            raise RuntimeError("Formula does not exist.")
+
+
 @dataclass(frozen=True)
 class TableauxArguments:
     formula: Path
     depth: int
     verbose: bool
+    simplify: bool
+    engine: str
+    targeted: bool
+    configuration: SolverConfiguration
+    budget: Budget
 
     def __post_init__(self) -> None:
         if not self.formula.is_file():
@@ -58,6 +134,10 @@ class TableauxArguments:
 class CheckArguments:
     formula: Path
     trace: Path
+    simplify: bool
+    native: bool
+    engine: str
+    configuration: SolverConfiguration
 
     def __post_init__(self) -> None:
         if not self.formula.is_file():
@@ -71,22 +151,89 @@ class CheckArguments:
 class ParseArgs:
     formula: Path
     method: str
+    batch: bool
+    output: Optional[Path]
+    simplify: bool
+    native: bool
+    engine: str
 
     def __post_init__(self) -> None:
-        if not self.formula.is_file():
+        reads_stdin = self.batch and self.formula == Path("-")
+        if not reads_stdin and not self.formula.is_file():
             raise RuntimeError("Formula file does not exist.")
 
+        if self.batch and self.output is not None:
+            raise RuntimeError("Batch mode does not write formula files.")
+
         if self.method not in ["dag", "tableaux"]:
             raise RuntimeError("Unknown representation method: {}".format(self.method))
 
 
+def add_configuration_arguments(p: ArgumentParser) -> None:
+    p.add_argument("-t", "--threads", type=int, default=1)
+    p.add_argument("--parallel-mode", choices=MODES, default="compete")
+    p.add_argument("--configuration", dest="preset", choices=PRESETS)
+
+
+def pop_configuration(args: Namespace) -> SolverConfiguration:
+    options = vars(args)
+    return SolverConfiguration(
+        options.pop("threads"), options.pop("parallel_mode"), options.pop("preset")
+    )
+
+
+def add_budget_arguments(p: ArgumentParser) -> None:
+    p.add_argument("--timeout", type=float, help="seconds")
+    p.add_argument("--conflicts", type=int)
+    p.add_argument("--restarts", type=int)
+    p.add_argument("--max-atoms", type=int, help="ground atoms")
+
+
+def pop_budget(args: Namespace) -> Budget:
+    options = vars(args)
+    return Budget(
+        options.pop("timeout"),
+        options.pop("conflicts"),
+        options.pop("restarts"),
+        options.pop("max_atoms"),
+    )
+
+
 def parse_check_args(argv: Sequence[str]) -> CheckArguments:
     p = ArgumentParser()
     p.add_argument("trace", type=Path)
     p.add_argument("formula", type=Path)
+    p.add_argument("--no-simplify", dest="simplify", action="store_false")
+    p.add_argument("-e", "--engine", choices=ENGINES, default="lark")
+    p.add_argument("--native", action="store_true")
+    add_configuration_arguments(p)
+
+    args = p.parse_args(argv)
+    configuration = pop_configuration(args)
+    return CheckArguments(configuration=configuration, **args.__dict__)
+
+
+def parse_explicit_args(argv: Sequence[str]) -> ExplicitArguments:
+    p = ArgumentParser()
+    p.add_argument("formula", type=Path)
+    p.add_argument("--no-simplify", dest="simplify", action="store_false")
+    p.add_argument("-e", "--engine", choices=ENGINES, default="lark")
+    p.add_argument("--timeout", type=float, help="seconds")
+
+    args = p.parse_args(argv)
+    return ExplicitArguments(**args.__dict__)
+
+
+def parse_automata_args(argv: Sequence[str]) -> AutomataArguments:
+    p = ArgumentParser()
+    p.add_argument("formula", type=Path)
+    p.add_argument("--no-simplify", dest="simplify", action="store_false")
+    p.add_argument("-e", "--engine", choices=ENGINES, default="lark")
+    p.add_argument("--timeout", type=float, help="seconds")
+    p.add_argument("--cache-dir", type=Path, help="defaults to $LTLF2ASP_CACHE_DIR")
 
     args = p.parse_args(argv)
-    return CheckArguments(**args.__dict__)
+    return AutomataArguments(**args.__dict__)
 
 
 def parse_tableaux_args(argv: Sequence[str]) -> TableauxArguments:
@@ -94,9 +241,24 @@ def parse_tableaux_args(argv: Sequence[str]) -> TableauxArguments:
     p.add_argument("formula", type=Path)
     p.add_argument("depth", type=int)
     p.add_argument("--verbose", "-v", action="store_true")
+    p.add_argument("--no-simplify", dest="simplify", action="store_false")
+    p.add_argument("-e", "--engine", choices=ENGINES, default="lark")
+    p.add_argument("--targeted", action="store_true")
+    add_configuration_arguments(p)
+    add_budget_arguments(p)
 
     args = p.parse_args(argv)
-    return TableauxArguments(**args.__dict__)
+    configuration = pop_configuration(args)
+    budget = pop_budget(args)
+    return TableauxArguments(
+        configuration=configuration, budget=budget, **args.__dict__
+    )
+
+
+def parse_schedule(spec: str) -> "Schedule":
+    from ltlf2asp.solve.schedule import parse_schedule
+
+    return parse_schedule(spec)
 
 
 def parse_solve_args(argv: Sequence[str]) -> SolveArguments:
@@ -104,46 +266,162 @@ def parse_solve_args(argv: Sequence[str]) -> SolveArguments:
     p.add_argument("formula", type=Path)
     p.add_argument("search_horizon", type=int)
     p.add_argument("-i", "--incremental", action="store_true")
+    p.add_argument("-s", "--shared", action="store_true")
     p.add_argument("-q", "--quiet", action="store_true")
+    p.add_argument("--no-simplify", dest="simplify", action="store_false")
+    p.add_argument("-e", "--engine", choices=ENGINES, default="lark")
+    p.add_argument("--native", action="store_true")
+    p.add_argument("--schedule", type=parse_schedule, default="doubling")
+    add_configuration_arguments(p)
+    add_budget_arguments(p)
 
     args = p.parse_args(argv)
-
-    return SolveArguments(**args.__dict__)
+    configuration = pop_configuration(args)
+    budget = pop_budget(args)
+    return SolveArguments(configuration=configuration, budget=budget, **args.__dict__)
 
 
 def parse_hybrid_args(argv: Sequence[str]) -> HybridArguments:
     p = ArgumentParser()
     p.add_argument("formula", type=Path)
     p.add_argument("search_horizon", type=int)
+    p.add_argument("--no-simplify", dest="simplify", action="store_false")
+    p.add_argument("-e", "--engine", choices=ENGINES, default="lark")
+    p.add_argument("--native", action="store_true")
+    p.add_argument("--schedule", type=parse_schedule, default=None)
+    p.add_argument("--concurrent", action="store_true")
+    add_configuration_arguments(p)
+    add_budget_arguments(p)
 
     args = p.parse_args(argv)
+    configuration = pop_configuration(args)
+    budget = pop_budget(args)
+    return HybridArguments(configuration=configuration, budget=budget, **args.__dict__)
+
+
+def parse_portfolio_args(argv: Sequence[str]) -> PortfolioArguments:
+    p = ArgumentParser()
+    p.add_argument("formula", type=Path)
+    p.add_argument("search_horizon", type=int)
+    p.add_argument("--no-simplify", dest="simplify", action="store_false")
+    p.add_argument("-e", "--engine", choices=ENGINES, default="lark")
+    p.add_argument("--native", action="store_true")
+    p.add_argument("--schedule", type=parse_schedule, default="doubling")
+    p.add_argument("--solvers", nargs="+", choices=PORTFOLIO, default=PORTFOLIO)
+    add_configuration_arguments(p)
 
-    return HybridArguments(**args.__dict__)
+    args = p.parse_args(argv)
+    configuration = pop_configuration(args)
+    return PortfolioArguments(configuration=configuration, **args.__dict__)
 
 
 def parse_parse_args(argv: Sequence[str]) -> ParseArgs:
     p = ArgumentParser()
     p.add_argument("formula", type=Path)
     p.add_argument("-m", "--method", choices=["dag", "tableaux"], default="dag")
+    p.add_argument("-b", "--batch", action="store_true")
+    p.add_argument("-o", "--output", type=Path, default=None)
+    p.add_argument("--no-simplify", dest="simplify", action="store_false")
+    p.add_argument("-e", "--engine", choices=ENGINES, default="lark")
+    p.add_argument("--native", action="store_true")
 
     args = p.parse_args(argv)
 
     return ParseArgs(**args.__dict__)
 
 
+def read_formula_facts(
+    path: Path, streamed: bool, simplify: bool, native: bool, engine: str
+) -> "FormulaFacts":
+    from ltlf2asp.parser.binary_format import is_formula_file, load_arrays
+    from ltlf2asp.parser.parser import formula_loader, parse_formula
+
+    # Formula files written by `parse -o` are mapped, not parsed (nor
+    # simplified again). Streamed facts go straight into the solver backend.
+    if is_formula_file(path):
+        arrays = load_arrays(path)
+        if streamed:
+            return partial(arrays.to_backend, native=native)
+        return arrays.to_facts(native)
+
+    if streamed:
+        return formula_loader(path.read_text(), simplify, native, engine)
+    return parse_formula(path.read_text(), simplify, native, engine)
+
+
+def read_formula_object(path: Path, simplify: bool, engine: str) -> "Formula":
+    from ltlf2asp.parser.binary_format import is_formula_file, load_arrays
+    from ltlf2asp.parser.parser import parse_formula_object
+
+    if is_formula_file(path):
+        return load_arrays(path).to_formula()
+    return parse_formula_object(path.read_text(), simplify=simplify, engine=engine)
+
+
+def read_formula_arrays(path: Path, simplify: bool, engine: str) -> "FormulaArrays":
+    from ltlf2asp.parser.binary_format import is_formula_file, load_arrays
+    from ltlf2asp.parser.parser import parse_formula_arrays
+
+    if is_formula_file(path):
+        return load_arrays(path)
+    return parse_formula_arrays(path.read_text(), simplify, engine)
+
+
 def tableaux(args: TableauxArguments):
-    formula = parse_formula_object(args.formula.read_text())
-    tableaux = Reynolds(args.verbose)
-    facts = tableaux_reify(formula.to_nnf())
+    from ltlf2asp.parser.syntax import tableaux_reify
+    from ltlf2asp.solve.tableaux import Reynolds
+
+    formula = read_formula_object(args.formula, args.simplify, args.engine)
+    tableaux = Reynolds(args.verbose, args.configuration, args.budget, args.targeted)
+    facts = tableaux_reify(formula)
     result = tableaux.solve(facts, args.depth)
 
     print(result.json())
     return 0
 
 
+def explicit(args: ExplicitArguments) -> int:
+    from ltlf2asp.solve.explicit_tableaux import solve
+
+    formula = read_formula_object(args.formula, args.simplify, args.engine)
+    result = solve(formula, Budget(time=args.timeout))
+
+    print(result.json())
+    return 0
+
+
+def automata(args: AutomataArguments) -> int:
+    import os
+
+    from ltlf2asp.parser.parser import CACHE_DIR_VARIABLE
+    from ltlf2asp.solve.automata import Automata
+
+    # Automata are cached across runs, as the LALR tables of the parser.
+    formula = read_formula_object(args.formula, args.simplify, args.engine)
+    engine = Automata(cache_dir=args.cache_dir or os.environ.get(CACHE_DIR_VARIABLE))
+    result = engine.solve(formula, Budget(time=args.timeout))
+    engine.save()
+
+    print(result.json())
+    return 0
+
+
 def solve(args: SolveArguments) -> int:
-    formula = parse_formula(args.formula.read_text())
-    solver = Solver(args.incremental, args.search_horizon)
+    from ltlf2asp.solve.solver_interface import Solver
+
+    # The static loop loads the formula in several controls: parse it once.
+    streamed = args.incremental or args.shared
+    formula = read_formula_facts(
+        args.formula, streamed, args.simplify, args.native, args.engine
+    )
+    solver = Solver(
+        args.incremental,
+        args.search_horizon,
+        args.shared,
+        args.schedule,
+        args.configuration,
+        args.budget,
+    )
     result = solver.solve(formula)
 
     if args.quiet:
@@ -154,27 +432,112 @@ def solve(args: SolveArguments) -> int:
     return 0
 
 
+def portfolio(args: PortfolioArguments) -> int:
+    from ltlf2asp.solve.portfolio import solve as portfolio_solve
+
+    formula = read_formula_arrays(args.formula, args.simplify, args.engine)
+    ans = portfolio_solve(
+        formula,
+        args.search_horizon,
+        args.schedule,
+        args.native,
+        args.solvers,
+        args.configuration,
+    )
+
+    print(ans.json())
+    return 0
+
+
 def hybrid(args: HybridArguments) -> int:
+    from ltlf2asp.parser.syntax import tableaux_reify
+    from ltlf2asp.solve.hybrid_solve import HYBRID_DOUBLING
+    from ltlf2asp.solve.hybrid_solve import solve, solve_concurrent
+
     # TODO: Fix this!
-    formula_tableaux = parse_formula_object(args.formula.read_text()).to_nnf()
-    formula_ltl2sat = parse_formula(args.formula.read_text())
+    formula_tableaux = read_formula_object(args.formula, args.simplify, args.engine)
+    formula_ltl2sat = read_formula_facts(
+        args.formula, False, args.simplify, args.native, args.engine
+    )
+    hybrid_solve = solve_concurrent if args.concurrent else solve
     ans = hybrid_solve(
-        formula_ltl2sat, tableaux_reify(formula_tableaux), args.search_horizon
+        formula_ltl2sat,
+        tableaux_reify(formula_tableaux),
+        args.search_horizon,
+        args.schedule or HYBRID_DOUBLING,
+        args.configuration,
+        args.budget,
     )
 
     print(ans.json())
     return 0
 
 
+def parse_batch(args: ParseArgs) -> int:
+    from ltlf2asp.parser.parser import parse_formulas
+    from ltlf2asp.parser.reify_as_atoms import ReifyFormulaAsFacts
+    from ltlf2asp.parser.reify_as_object import ReifyFormulaAsObject
+    from ltlf2asp.parser.simplify import ReifySimplified
+    from ltlf2asp.parser.syntax import FormulaContext, tableaux_reify
+
+    # One formula per input line, one line of facts per formula. Tableaux
+    # formulas get a context each, so that ids do not depend on earlier lines.
+    def reify():
+        if args.simplify:
+            return ReifySimplified()
+        if args.method == "tableaux":
+            return ReifyFormulaAsObject(FormulaContext())
+        return ReifyFormulaAsFacts(args.native)
+
+    failures = 0
+
+    # Standard input is read, but left open.
+    stdin = args.formula == Path("-")
+    with nullcontext(sys.stdin) if stdin else args.formula.open() as lines:
+        for parsed in parse_formulas(lines, reify, engine=args.engine):
+            if not parsed.ok:
+                failures += 1
+                error = " ".join(str(parsed.error).split())
+                print("line {}: {}".format(parsed.line, error), file=sys.stderr)
+                continue
+
+            formula = parsed.result
+            if args.method == "tableaux":
+                if args.simplify:
+                    formula = formula.to_formula(FormulaContext())
+                facts = tableaux_reify(formula)
+            else:
+                facts = formula.to_facts(args.native) if args.simplify else formula
+            print(" ".join(str(fact) + "." for fact in facts))
+
+    return 0 if failures == 0 else 1
+
+
 def parse(args: ParseArgs) -> int:
+    if args.batch:
+        return parse_batch(args)
+
+    if args.output is not None:
+        from ltlf2asp.parser.binary_format import dump_arrays
+        from ltlf2asp.parser.parser import parse_formula_arrays
+
+        formula_string = args.formula.read_text()
+        arrays = parse_formula_arrays(formula_string, args.simplify, args.engine)
+        dump_arrays(arrays, args.output)
+        return 0
+
     # TODO: Fix this!
     if args.method == "tableaux":
-        formula_tableaux = parse_formula_object(args.formula.read_text()).to_nnf()
+        from ltlf2asp.parser.syntax import tableaux_reify
+
+        formula_tableaux = read_formula_object(args.formula, args.simplify, args.engine)
         for fact in tableaux_reify(formula_tableaux):
             print(str(fact) + ".")
 
     elif args.method == "dag":
-        formula_ltl2sat = parse_formula(args.formula.read_text())
+        formula_ltl2sat = read_formula_facts(
+            args.formula, False, args.simplify, args.native, args.engine
+        )
         for fact in formula_ltl2sat:
             print(str(fact) + ".")
 
@@ -182,27 +545,37 @@ def parse(args: ParseArgs) -> int:
 
 
 def check(args: CheckArguments) -> int:
-    formula = parse_formula(args.formula.read_text())
+    from ltlf2asp.solve.check_model import check_trace
+    from ltlf2asp.solve.parse_trace import parse_trace
+
+    formula = read_formula_facts(
+        args.formula, True, args.simplify, args.native, args.engine
+    )
     trace = parse_trace(args.trace.read_text())
 
-    ans = check_trace(trace, formula)
+    ans = check_trace(trace, formula, args.configuration)
     print(ans)
     return 0
 
 
 def run() -> int:
     argv = sys.argv[1:]
-    if len(argv) <= 2:
+    if len(argv) < 2:
         print("Usage:")
-        print("* ltlf2asp solve [-i --incremental] [formula: Path] [horizon: int]")
+        print(
+            "* ltlf2asp solve [-i --incremental | -s --shared] [formula: Path] [horizon: int]"
+        )
         print("* ltlf2asp check [trace: Path] [formula: Path]")
         print("* ltlf2asp reynolds [formula: Path] [depth: int]")
+        print("* ltlf2asp explicit [formula: Path]")
+        print("* ltlf2asp automata [formula: Path] [--cache-dir Path]")
         print("* ltlf2asp hybrid [formula: Path] [depth: int]")
-        print("* ltlf2asp parse [formula: Path] [-m DAG|TABLEAUX]")
+        print("* ltlf2asp portfolio [formula: Path] [horizon: int] [--solvers ...]")
+        print(
+            "* ltlf2asp parse [formula: Path] [-m DAG|TABLEAUX] [-b --batch] [-o --output]"
+        )
         sys.exit(1)
 
-    # TODO: Make a parameter, or fix the grammar...
-    sys.setrecursionlimit(2056)
     command, args = argv[0], argv[1:]
     match command:
         case "check":
@@ -211,8 +584,14 @@ def run() -> int:
             return solve(parse_solve_args(args))
         case "reynolds":
             return tableaux(parse_tableaux_args(args))
+        case "explicit":
+            return explicit(parse_explicit_args(args))
+        case "automata":
+            return automata(parse_automata_args(args))
         case "hybrid":
             return hybrid(parse_hybrid_args(args))
+        case "portfolio":
+            return portfolio(parse_portfolio_args(args))
         case "parse":
             return parse(parse_parse_args(args))
 
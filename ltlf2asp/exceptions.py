@@ -4,6 +4,7 @@ class ParsingError(Exception):
 
 class UnsupportedOperator(Exception):
     def __init__(self, string: str) -> None:
+        super().__init__(string)
         self.string: str = string
 
     def message(self) -> str:
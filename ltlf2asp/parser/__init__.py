@@ -1,3 +1,40 @@
-from .parser import parse_formula as parse_formula
-from .parser import parse_formula_object as parse_formula_object
-from .syntax import tableaux_reify as tableaux_reify
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .parser import parse_formula as parse_formula
+    from .parser import parse_formula_object as parse_formula_object
+    from .parser import parse_formulas as parse_formulas
+    from .parser import parse_formula_arrays as parse_formula_arrays
+    from .parser import parse_formula_into_backend as parse_formula_into_backend
+    from .parser import formula_loader as formula_loader
+    from .syntax import tableaux_reify as tableaux_reify
+    from .syntax import FormulaContext as FormulaContext
+
+# Re-exports are resolved on first access (PEP 562), so that importing a
+# submodule does not load the parser, lark and syntax.Formula as well.
+_EXPORTS = {
+    "parse_formula": ".parser",
+    "parse_formula_object": ".parser",
+    "parse_formulas": ".parser",
+    "parse_formula_arrays": ".parser",
+    "parse_formula_into_backend": ".parser",
+    "formula_loader": ".parser",
+    "tableaux_reify": ".syntax",
+    "FormulaContext": ".syntax",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    if name not in _EXPORTS:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,100 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import BinaryIO, List
+
+from ltlf2asp.exceptions import ParsingError
+from ltlf2asp.parser.reify_as_arrays import INDEX, FormulaArrays
+
+# Layout of a formula file, all integers little endian:
+#   header: magic, version, #nodes, #children, #propositions, root
+#   opcode: #nodes bytes, zero-padded to a multiple of 4
+#   lhs, rhs: #nodes int32 each
+#   offsets: #nodes + 1 int32
+#   children: #children int32
+#   string table: #propositions + 1 int32 offsets, then the utf-8 bytes
+MAGIC = b"LTLF2ASP"
+VERSION = 1
+HEADER = struct.Struct("<8sIIIIi")
+
+
+def _padding(n: int) -> int:
+    return -n % 4
+
+
+def is_formula_file(path: Path) -> bool:
+    with path.open("rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write_arrays(arrays: FormulaArrays, out: BinaryIO) -> None:
+    n, m, p = len(arrays), len(arrays.children), len(arrays.propositions)
+    out.write(HEADER.pack(MAGIC, VERSION, n, m, p, arrays.root))
+
+    out.write(bytes(arrays.opcode))
+    out.write(bytes(_padding(n)))
+
+    strings = [x.encode() for x in arrays.propositions]
+    string_offsets = array(INDEX, [0])
+    for x in strings:
+        string_offsets.append(string_offsets[-1] + len(x))
+
+    for a in (arrays.lhs, arrays.rhs, arrays.offsets, arrays.children):
+        _write_int32(out, a)
+    _write_int32(out, string_offsets)
+    out.write(b"".join(strings))
+
+
+def _write_int32(out: BinaryIO, a) -> None:
+    a = array(INDEX, a)
+    if sys.byteorder == "big":
+        a.byteswap()
+    out.write(a.tobytes())
+
+
+def dump_arrays(arrays: FormulaArrays, path: Path) -> None:
+    with path.open("wb") as out:
+        write_arrays(arrays, out)
+
+
+def load_arrays(path: Path) -> FormulaArrays:
+    """Map a formula file in memory. On little endian machines the arrays of
+    the result are views over the mapping, nothing is copied or parsed."""
+    with path.open("rb") as f:
+        # An empty file cannot be mapped.
+        if os.fstat(f.fileno()).st_size < HEADER.size:
+            raise ParsingError("Not a formula file: {}".format(path))
+        buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    magic, version, n, m, p, root = HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != VERSION:
+        raise ParsingError("Not a formula file: {}".format(path))
+
+    position = HEADER.size
+
+    def take(size: int, fmt: str):
+        nonlocal position
+        view = buffer[position : position + size * struct.calcsize(fmt)]
+        position += len(view)
+        if len(view) != size * struct.calcsize(fmt):
+            raise ParsingError("Truncated formula file: {}".format(path))
+        if fmt == INDEX and sys.byteorder == "big":
+            a = array(INDEX, view.tobytes())
+            a.byteswap()
+            return a
+        return view.cast(fmt)
+
+    opcode = take(n, "B")
+    position += _padding(n)
+    lhs, rhs = take(n, INDEX), take(n, INDEX)
+    offsets, children = take(n + 1, INDEX), take(m, INDEX)
+    string_offsets = take(p + 1, INDEX)
+    strings = bytes(buffer[position : position + string_offsets[p]])
+    propositions: List[str] = [
+        strings[string_offsets[i] : string_offsets[i + 1]].decode() for i in range(p)
+    ]
+
+    return FormulaArrays(opcode, lhs, rhs, offsets, children, propositions, root)
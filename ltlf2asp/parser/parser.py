@@ -1,26 +1,86 @@
-from typing import TypeVar, Set, Type, Sequence
+import os
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import (
+    TYPE_CHECKING,
+    TypeVar,
+    Set,
+    Callable,
+    Sequence,
+    Optional,
+    Union,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
 
-import clingo  # type: ignore
-import lark  # type: ignore
-from lark import Lark, Transformer
 from pathlib import Path
+from ltlf2asp.parser import pratt
 from ltlf2asp.parser.constants import Constants
-from ltlf2asp.parser.reify_as_atoms import ReifyFormulaAsFacts
-from ltlf2asp.parser.reify_as_object import ReifyFormulaAsObject
 from ltlf2asp.exceptions import ParsingError, UnsupportedOperator
 from ltlf2asp.parser.reify_interface import Reify
 
+# Lark, clingo, syntax.Formula and the array representation are imported when
+# first used: command line runs only pay for what their subcommand needs.
+if TYPE_CHECKING:
+    import clingo  # type: ignore
+    import lark  # type: ignore
+    from ltlf2asp.parser.reify_as_arrays import FormulaArrays
+    from ltlf2asp.parser.syntax import Formula, FormulaContext
+
 
 T = TypeVar("T")
 G = TypeVar("G")
 
+GRAMMAR = Path(__file__).parent / "grammar.lark"
+
+# When set, serialized LALR tables are stored in (and loaded from) this folder.
+CACHE_DIR_VARIABLE = "LTLF2ASP_CACHE_DIR"
+
+# Parser engines: the Lark grammar, or the operator precedence parser in
+# ltlf2asp.parser.pratt, which accepts the same language.
+LARK = "lark"
+PRATT = "pratt"
+ENGINES = (LARK, PRATT)
 
-class LTLfFlatTransformer(Transformer[T]):
-    def __init__(self, reification_cls: Type[Reify[T, G]]) -> None:
+
+class LTLfFlatTransformer(Generic[T]):
+    def __init__(self, reification_cls: Callable[[], Reify[T, G]]) -> None:
         """Initiaflize."""
         super().__init__()
+        self.reification_cls = reification_cls
         self.reify: Reify[T, G] = reification_cls()
 
+    def reset(self) -> None:
+        self.reify = self.reification_cls()
+
+    def transform(self, tree: "lark.Tree") -> G:
+        import lark
+
+        # Post-order visit with an explicit stack instead of Transformer's
+        # recursive one: the nesting depth of a formula is not bounded by the
+        # interpreter recursion limit, and callback errors are not wrapped.
+        results: List[object] = []
+        stack: List[Tuple[object, bool]] = [(tree, False)]
+        while len(stack) > 0:
+            node, visited = stack.pop()
+            if not isinstance(node, lark.Tree):
+                results.append(node)
+
+            elif visited:
+                arity = len(node.children)
+                args = results[len(results) - arity :]
+                del results[len(results) - arity :]
+                results.append(getattr(self, node.data)(args))
+
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.children))
+
+        return results[0]  # type: ignore
+
     def start(self, args: Sequence[T]) -> G:  # type: ignore
         self.reify.mark_as_root(args[0])
         return self.reify.result()
@@ -165,7 +225,7 @@ class LTLfFlatTransformer(Transformer[T]):
             return args[0]
         return args[1]
 
-    def symbol(self, args: Sequence[lark.Token]) -> str:
+    def symbol(self, args: Sequence["lark.Token"]) -> str:
         string = "".join(x.value for x in args)
         return string.replace("'", '"')
 
@@ -192,17 +252,177 @@ class LTLfFlatTransformer(Transformer[T]):
         return self.reify.last()
 
 
-def _parse_formula(formula_string: str, start_rule: str, reify: Type[Reify[T, G]]) -> G:
-    GRAMMAR = Path(__file__).parent / "grammar.lark"
-    parser = Lark(GRAMMAR.read_text(), parser="lalr", start=start_rule)
+@lru_cache(maxsize=None)
+def _build_parser(start_rule: str, cache_dir: Optional[str]) -> "lark.Lark":
+    from lark import Lark
+
+    cache: Union[bool, str] = False
+    if cache_dir is not None:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        cache = Path(cache_dir, "ltlf2asp-{}.lark".format(start_rule)).as_posix()
+
+    return Lark(GRAMMAR.read_text(), parser="lalr", start=start_rule, cache=cache)
+
+
+def get_parser(start_rule: str) -> "lark.Lark":
+    """Return the LALR parser for `start_rule`, building it once per process.
+
+    If the LTLF2ASP_CACHE_DIR environment variable is set, the parser tables
+    are persisted there, so that later processes skip table construction."""
+    return _build_parser(start_rule, os.environ.get(CACHE_DIR_VARIABLE))
+
+
+def _parse_formula(
+    formula_string: str,
+    start_rule: str,
+    reify: Callable[[], Reify[T, G]],
+    engine: str = LARK,
+) -> G:
+    if engine == PRATT:
+        return pratt.parse(formula_string, reify())
+    if engine != LARK:
+        raise ValueError("Unknown parser engine: {}".format(engine))
+
+    parser = get_parser(start_rule)
     transformer = LTLfFlatTransformer(reify)
     tree = parser.parse(formula_string)
     return transformer.transform(tree)  # type: ignore
 
 
-def parse_formula(formula_string: str) -> Set[clingo.Symbol]:
-    return _parse_formula(formula_string, "start", ReifyFormulaAsFacts)
-
-
-def parse_formula_object(formula_string: str):
-    return _parse_formula(formula_string, "start", ReifyFormulaAsObject)
+def parse_formula(
+    formula_string: str,
+    simplify: bool = False,
+    native: bool = False,
+    engine: str = LARK,
+) -> Set["clingo.Symbol"]:
+    """Parse into clingo facts. With `native`, derived operators are reified
+    as they are, instead of being rewritten into the core operators."""
+    if simplify:
+        arrays = parse_formula_arrays(formula_string, simplify, engine)
+        return arrays.to_facts(native)
+
+    from ltlf2asp.parser.reify_as_atoms import ReifyFormulaAsFacts
+
+    reify = partial(ReifyFormulaAsFacts, native)
+    return _parse_formula(formula_string, "start", reify, engine)
+
+
+def parse_formula_into_backend(
+    formula_string: str,
+    backend: "clingo.Backend",
+    simplify: bool = False,
+    native: bool = False,
+    engine: str = LARK,
+) -> None:
+    """Parse and add the facts of parse_formula straight into `backend`."""
+    if simplify:
+        arrays = parse_formula_arrays(formula_string, simplify, engine)
+        arrays.to_backend(backend, native)
+        return
+
+    from ltlf2asp.parser.reify_into_backend import ReifyFormulaIntoBackend
+
+    reify = partial(ReifyFormulaIntoBackend, backend, native)
+    _parse_formula(formula_string, "start", reify, engine)
+
+
+def formula_loader(
+    formula_string: str,
+    simplify: bool = False,
+    native: bool = False,
+    engine: str = LARK,
+) -> Callable[["clingo.Backend"], None]:
+    """FormulaFacts that parse `formula_string` into the solver backend."""
+    return partial(
+        parse_formula_into_backend,
+        formula_string,
+        simplify=simplify,
+        native=native,
+        engine=engine,
+    )
+
+
+def parse_formula_object(
+    formula_string: str,
+    context: Optional["FormulaContext"] = None,
+    simplify: bool = False,
+    engine: str = LARK,
+) -> "Formula":
+    """Parse into a syntax.Formula, built in `context` (by default, the
+    current formula context)."""
+    from ltlf2asp.parser.reify_as_object import ReifyFormulaAsObject
+
+    if simplify:
+        arrays = parse_formula_arrays(formula_string, simplify, engine)
+        return arrays.to_formula(context)
+
+    reify = partial(ReifyFormulaAsObject, context)
+    return _parse_formula(formula_string, "start", reify, engine)  # type: ignore
+
+
+def parse_formula_arrays(
+    formula_string: str, simplify: bool = False, engine: str = LARK
+) -> "FormulaArrays":
+    """Parse into the struct-of-arrays FormulaArrays representation. With
+    `simplify`, the formula goes through the rewritings of ReifySimplified."""
+    from ltlf2asp.parser.reify_as_arrays import ReifyFormulaAsArrays
+    from ltlf2asp.parser.simplify import ReifySimplified
+
+    reify = ReifySimplified if simplify else ReifyFormulaAsArrays
+    return _parse_formula(formula_string, "start", reify, engine)
+
+
+@dataclass(frozen=True)
+class ParsedLine(Generic[G]):
+    line: int
+    formula: str
+    result: Optional[G]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def parse_formulas(
+    lines: Iterable[str],
+    reify: Optional[Callable[[], Reify[T, G]]] = None,
+    start_rule: str = "start",
+    engine: str = LARK,
+) -> Iterator[ParsedLine[G]]:
+    """Lazily parse one formula per line, sharing the parser and transformer.
+
+    Blank lines and lines starting with '%' are skipped. A line that fails to
+    parse is reported through `ParsedLine.error` and does not stop the stream.
+    By default, formulas are reified as by parse_formula."""
+    if reify is None:
+        from ltlf2asp.parser.reify_as_atoms import ReifyFormulaAsFacts
+
+        reify = ReifyFormulaAsFacts  # type: ignore
+
+    if engine not in ENGINES:
+        raise ValueError("Unknown parser engine: {}".format(engine))
+
+    parser = get_parser(start_rule) if engine == LARK else None
+    transformer = LTLfFlatTransformer(reify)
+    errors: Tuple[type, ...] = (ParsingError, UnsupportedOperator)
+    if parser is not None:
+        from lark.exceptions import LarkError
+
+        errors = (*errors, LarkError)
+
+    for number, line in enumerate(lines, start=1):
+        formula_string = line.strip()
+        if len(formula_string) == 0 or formula_string.startswith("%"):
+            continue
+
+        transformer.reset()
+        try:
+            if parser is None:
+                result = pratt.parse(formula_string, transformer.reify)
+            else:
+                result = transformer.transform(parser.parse(formula_string))
+        except errors as e:
+            yield ParsedLine(number, formula_string, None, e)
+        else:
+            yield ParsedLine(number, formula_string, result, None)  # type: ignore
@@ -0,0 +1,165 @@
+import re
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from ltlf2asp.exceptions import ParsingError, UnsupportedOperator
+from ltlf2asp.parser.constants import Constants
+from ltlf2asp.parser.reify_interface import Reify, T, G
+
+# The language of grammar.lark, parsed by operator precedence without building
+# a parse tree. As with Lark's contextual lexer, the tokens that may appear
+# depend on the position: prefix (an operand is expected) or infix.
+KEYWORD = r"(?=[^a-zA-Z]|$)"
+FREE_SYMBOL = r"[A-Za-z0-9_\-\?]+"
+
+PREFIX = re.compile(
+    r"\s*(?:"
+    rf"(?P<weak_next>[Ww]X{KEYWORD})"
+    rf"|(?P<always>G{KEYWORD})"
+    rf"|(?P<eventually>F{KEYWORD})"
+    rf"|(?P<next>X{KEYWORD})"
+    r"|(?P<negate>[!~])"
+    r"|(?P<open>\()"
+    r"|(?P<symbol>[a-zA-Z0-9_\?]+)"
+    rf"|'\s*(?P<single_quoted>{FREE_SYMBOL})\s*'"
+    rf"|\"\s*(?P<double_quoted>{FREE_SYMBOL})\s*\""
+    r")"
+)
+
+INFIX = re.compile(
+    r"\s*(?:"
+    rf"(?P<until>U{KEYWORD})"
+    rf"|(?P<release>R{KEYWORD})"
+    rf"|(?P<weak_until>W{KEYWORD})"
+    rf"|(?P<strong_release>M{KEYWORD})"
+    r"|(?P<disjunction>\|\|?)"
+    r"|(?P<conjunction>&&?)"
+    r"|(?P<equivalence><->|<=>|=)"
+    r"|(?P<implies>->|=>)"
+    r"|(?P<close>\))"
+    r"|(?P<end>\s*$)"
+    r")"
+)
+
+# Binding strength of binary operators, as in grammar.lark: the larger, the
+# tighter. Operands of one level are collected in a single node.
+LEVELS: Dict[str, int] = {
+    "equivalence": 0,
+    "implies": 1,
+    "disjunction": 2,
+    "conjunction": 3,
+    "until": 4,
+    "weak_until": 5,
+    "release": 6,
+    "strong_release": 7,
+}
+
+VARIADIC = ("conjunction", "disjunction")
+
+# Error messages of LTLfFlatTransformer.
+UNSUPPORTED = {
+    "equivalence": "Variadic Release is not supported!",
+    "implies": "Variadic Implication is not supported!",
+    "until": "Variadic Until is not supported!",
+    "weak_until": "Variadic WeakUntil is not supported!",
+    "release": "Variadic Release is not supported!",
+    "strong_release": "Variadic StrongRelease is not supported!",
+}
+
+OPEN = "open"
+
+# Pending operators: a unary operator, an open parenthesis, or a binary
+# operator together with the number of operands it takes.
+Pending = Union[str, Tuple[str, int]]
+
+
+def parse(formula_string: str, reify: Reify[T, G]) -> G:
+    """Parse `formula_string`, calling `reify` in the same order as
+    LTLfFlatTransformer does on the Lark parse tree."""
+    operands: List[T] = []
+    pending: List[Pending] = []
+    position = 0
+
+    def error(message: str) -> ParsingError:
+        return ParsingError(
+            "{} at column {}: {!r}".format(message, position + 1, formula_string)
+        )
+
+    def apply_unary() -> None:
+        while len(pending) > 0 and isinstance(pending[-1], str) and pending[-1] != OPEN:
+            operator: Callable[[T], T] = getattr(reify, pending.pop())  # type: ignore
+            operands.append(operator(operands.pop()))
+
+    def reduce(level: int) -> None:
+        while len(pending) > 0 and isinstance(pending[-1], tuple):
+            name, arity = pending[-1]
+            if LEVELS[name] <= level:
+                return
+
+            pending.pop()
+            args: Sequence[T] = operands[len(operands) - arity :]
+            del operands[len(operands) - arity :]
+            if name in VARIADIC:
+                operands.append(getattr(reify, name)(args))
+            elif arity > 2:
+                raise UnsupportedOperator(UNSUPPORTED[name])
+            else:
+                operands.append(getattr(reify, name)(*args))
+
+    while True:
+        # Prefix position: unary operators, then an operand.
+        match = PREFIX.match(formula_string, position)
+        if match is None:
+            raise error("Expected a formula")
+
+        position = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)  # type: ignore
+        if kind == "symbol":
+            operands.append(_atom(reify, value))
+        elif kind in ("single_quoted", "double_quoted"):
+            operands.append(reify.proposition('"{}"'.format(value)))
+        else:
+            pending.append(kind)  # type: ignore
+            continue
+
+        # Infix position: close parentheses, then a binary operator.
+        while True:
+            apply_unary()
+            match = INFIX.match(formula_string, position)
+            if match is None:
+                raise error("Expected an operator")
+
+            position = match.end()
+            kind = match.lastgroup  # type: ignore
+            if kind != "close":
+                break
+
+            reduce(-1)
+            if len(pending) == 0 or pending[-1] != OPEN:
+                raise error("Unbalanced parenthesis")
+            pending.pop()
+
+        if kind == "end":
+            reduce(-1)
+            if len(pending) > 0:
+                raise error("Unbalanced parenthesis")
+            reify.mark_as_root(operands.pop())
+            return reify.result()
+
+        reduce(LEVELS[kind])  # type: ignore
+        top = pending[-1] if len(pending) > 0 else None
+        if isinstance(top, tuple) and top[0] == kind:
+            pending[-1] = (kind, top[1] + 1)  # type: ignore
+        else:
+            pending.append((kind, 2))  # type: ignore
+
+
+def _atom(reify: Reify[T, G], symbol: str) -> T:
+    if symbol.lower() == Constants.TRUE:
+        return reify.true()
+    elif symbol.lower() == Constants.FALSE:
+        return reify.false()
+    elif symbol.lower() in (Constants.LAST, Constants.END):
+        return reify.last()
+    else:
+        return reify.proposition(symbol)
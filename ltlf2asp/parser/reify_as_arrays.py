@@ -0,0 +1,259 @@
+from array import array
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from ltlf2asp.parser.reify_interface import Reify, T, G
+
+if TYPE_CHECKING:
+    import clingo  # type: ignore
+    from ltlf2asp.parser.syntax import Formula, FormulaContext
+
+# Node indices are stored as signed 32 bit integers, NONE marks an unused slot.
+INDEX = "i"
+NONE = -1
+
+# Arrays built by ReifyFormulaAsArrays, or views over a mapped formula file
+# (see binary_format.load_arrays).
+IntArray = Union[array, memoryview]
+
+
+class Op(IntEnum):
+    TRUE = 0
+    FALSE = 1
+    LAST = 2
+    ATOMIC = 3
+    NEXT = 4
+    WEAK_NEXT = 5
+    EVENTUALLY = 6
+    ALWAYS = 7
+    NEGATE = 8
+    UNTIL = 9
+    RELEASE = 10
+    WEAK_UNTIL = 11
+    STRONG_RELEASE = 12
+    IMPLIES = 13
+    EQUIVALENT = 14
+    CONJUNCTION = 15
+    DISJUNCTION = 16
+
+
+UNARY = (Op.NEXT, Op.WEAK_NEXT, Op.EVENTUALLY, Op.ALWAYS, Op.NEGATE)
+BINARY = (
+    Op.UNTIL,
+    Op.RELEASE,
+    Op.WEAK_UNTIL,
+    Op.STRONG_RELEASE,
+    Op.IMPLIES,
+    Op.EQUIVALENT,
+)
+VARIADIC = (Op.CONJUNCTION, Op.DISJUNCTION)
+
+
+@dataclass
+class FormulaArrays:
+    """A formula DAG as a struct of arrays, one slot per distinct subformula.
+
+    Nodes are numbered in topological order (children before parents):
+      - opcode[i] is the Op of node i;
+      - lhs[i] is the operand of a unary node, the left operand of a binary
+        node, or the index in `propositions` of an atomic node;
+      - rhs[i] is the right operand of a binary node;
+      - the operands of a variadic node are children[offsets[i]:offsets[i+1]].
+    Unused slots hold NONE. Arrays expose the buffer protocol, so e.g.
+    numpy.frombuffer(arrays.lhs, dtype=numpy.int32) is a zero-copy view."""
+
+    opcode: IntArray = field(default_factory=lambda: array("B"))
+    lhs: IntArray = field(default_factory=lambda: array(INDEX))
+    rhs: IntArray = field(default_factory=lambda: array(INDEX))
+    offsets: IntArray = field(default_factory=lambda: array(INDEX, [0]))
+    children: IntArray = field(default_factory=lambda: array(INDEX))
+    propositions: List[str] = field(default_factory=list)
+    root: int = NONE
+
+    def __len__(self) -> int:
+        return len(self.opcode)
+
+    def operands(self, i: int) -> Sequence[int]:
+        return self.children[self.offsets[i] : self.offsets[i + 1]]
+
+    def nbytes(self) -> int:
+        arrays = (self.opcode, self.lhs, self.rhs, self.offsets, self.children)
+        return sum(len(a) * a.itemsize for a in arrays)
+
+    def detach(self) -> "FormulaArrays":
+        """A copy owning its arrays: arrays loaded from a formula file are
+        views over a mapping, which cannot be pickled."""
+        return FormulaArrays(
+            array("B", self.opcode),
+            *(array(INDEX, a) for a in (self.lhs, self.rhs, self.offsets)),
+            array(INDEX, self.children),
+            list(self.propositions),
+            self.root,
+        )
+
+    def reachable(self) -> List[bool]:
+        # Parents come after their children: one backward pass is enough.
+        reachable = [False] * len(self)
+        if len(self) > 0:
+            reachable[self.root] = True
+        for i in reversed(range(len(self))):
+            if not reachable[i] or self.opcode[i] == Op.ATOMIC:
+                continue
+            for j in (self.lhs[i], self.rhs[i], *self.operands(i)):
+                if j != NONE:
+                    reachable[j] = True
+        return reachable
+
+    def replay(self, reify: Reify[T, G]) -> G:
+        """Rebuild the formula through `reify`, one call per node reachable
+        from the root."""
+        built: List[T] = [None] * len(self)  # type: ignore
+        methods = {op: getattr(reify, name) for op, name in METHODS.items()}
+        reachable = self.reachable()
+        for i, op in enumerate(self.opcode):
+            if not reachable[i]:
+                continue
+            elif op == Op.TRUE:
+                built[i] = reify.true()
+            elif op == Op.FALSE:
+                built[i] = reify.false()
+            elif op == Op.LAST:
+                built[i] = reify.last()
+            elif op == Op.ATOMIC:
+                built[i] = reify.proposition(self.propositions[self.lhs[i]])
+            elif op in UNARY:
+                built[i] = methods[op](built[self.lhs[i]])
+            elif op in BINARY:
+                lhs, rhs = built[self.lhs[i]], built[self.rhs[i]]
+                built[i] = methods[op](lhs, rhs)
+            else:
+                fs = [built[j] for j in self.operands(i)]
+                built[i] = methods[op](fs)
+
+        reify.mark_as_root(built[self.root])
+        return reify.result()
+
+    def to_facts(self, native: bool = False) -> Set["clingo.Symbol"]:
+        from ltlf2asp.parser.reify_as_atoms import ReifyFormulaAsFacts
+
+        return self.replay(ReifyFormulaAsFacts(native))
+
+    def to_backend(self, backend: "clingo.Backend", native: bool = False) -> None:
+        from ltlf2asp.parser.reify_into_backend import ReifyFormulaIntoBackend
+
+        self.replay(ReifyFormulaIntoBackend(backend, native))
+
+    def to_formula(self, context: Optional["FormulaContext"] = None) -> "Formula":
+        from ltlf2asp.parser.reify_as_object import ReifyFormulaAsObject
+
+        return self.replay(ReifyFormulaAsObject(context))  # type: ignore
+
+
+# Name of the Reify method building each operator.
+METHODS = {
+    Op.NEXT: "next",
+    Op.WEAK_NEXT: "weak_next",
+    Op.EVENTUALLY: "eventually",
+    Op.ALWAYS: "always",
+    Op.NEGATE: "negate",
+    Op.UNTIL: "until",
+    Op.RELEASE: "release",
+    Op.WEAK_UNTIL: "weak_until",
+    Op.STRONG_RELEASE: "strong_release",
+    Op.IMPLIES: "implies",
+    Op.EQUIVALENT: "equivalence",
+    Op.CONJUNCTION: "conjunction",
+    Op.DISJUNCTION: "disjunction",
+}
+
+
+class ReifyFormulaAsArrays(Reify[int, FormulaArrays]):
+    """Reify into FormulaArrays. Operators are stored as written, without
+    rewriting into the core fragment; structurally equal subformulas (up to
+    the order of variadic operands) share one node, as in ReifyFormulaAsFacts."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.arrays = FormulaArrays()
+        self.nodes: Dict[Tuple, int] = {}
+        self.symbols: Dict[str, int] = {}
+
+    def result(self) -> FormulaArrays:
+        return self.arrays
+
+    def node(
+        self, op: Op, lhs: int = NONE, rhs: int = NONE, fs: Sequence[int] = ()
+    ) -> int:
+        key = (op, lhs, rhs, *sorted(fs))
+        id = self.nodes.get(key)
+        if id is not None:
+            return id
+
+        a = self.arrays
+        id = len(a.opcode)
+        a.opcode.append(op)
+        a.lhs.append(lhs)
+        a.rhs.append(rhs)
+        a.children.extend(fs)
+        a.offsets.append(len(a.children))
+        self.nodes[key] = id
+        return id
+
+    def true(self) -> int:
+        return self.node(Op.TRUE)
+
+    def false(self) -> int:
+        return self.node(Op.FALSE)
+
+    def last(self) -> int:
+        return self.node(Op.LAST)
+
+    def proposition(self, string: str) -> int:
+        symbol = self.symbols.get(string)
+        if symbol is None:
+            symbol = self.symbols[string] = len(self.arrays.propositions)
+            self.arrays.propositions.append(string)
+        return self.node(Op.ATOMIC, symbol)
+
+    def next(self, f: int) -> int:
+        return self.node(Op.NEXT, f)
+
+    def weak_next(self, f: int) -> int:
+        return self.node(Op.WEAK_NEXT, f)
+
+    def until(self, lhs: int, rhs: int) -> int:
+        return self.node(Op.UNTIL, lhs, rhs)
+
+    def release(self, lhs: int, rhs: int) -> int:
+        return self.node(Op.RELEASE, lhs, rhs)
+
+    def weak_until(self, lhs: int, rhs: int) -> int:
+        return self.node(Op.WEAK_UNTIL, lhs, rhs)
+
+    def strong_release(self, lhs: int, rhs: int) -> int:
+        return self.node(Op.STRONG_RELEASE, lhs, rhs)
+
+    def equivalence(self, lhs: int, rhs: int) -> int:
+        return self.node(Op.EQUIVALENT, lhs, rhs)
+
+    def implies(self, lhs: int, rhs: int) -> int:
+        return self.node(Op.IMPLIES, lhs, rhs)
+
+    def eventually(self, f: int) -> int:
+        return self.node(Op.EVENTUALLY, f)
+
+    def always(self, f: int) -> int:
+        return self.node(Op.ALWAYS, f)
+
+    def negate(self, f: int) -> int:
+        return self.node(Op.NEGATE, f)
+
+    def conjunction(self, fs: Sequence[int]) -> int:
+        return self.node(Op.CONJUNCTION, fs=fs)
+
+    def disjunction(self, fs: Sequence[int]) -> int:
+        return self.node(Op.DISJUNCTION, fs=fs)
+
+    def mark_as_root(self, f: int) -> None:
+        self.arrays.root = f
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Set, Dict, Sequence
+from typing import Set, Dict, Sequence, Tuple, Iterable, Union, Callable
 
 import clingo  # type: ignore
 from ltlf2asp.parser.constants import Constants
@@ -15,6 +15,20 @@ def add_in_backend(b: clingo.Backend, symbol: clingo.Symbol) -> None:
     b.add_rule([lit], [])
 
 
+# A reified formula: either its facts, or a function adding them to a backend
+# (see ReifyFormulaIntoBackend).
+FormulaFacts = Union[Iterable[clingo.Symbol], Callable[[clingo.Backend], None]]
+
+
+def add_facts(b: clingo.Backend, f: FormulaFacts) -> None:
+    if callable(f):
+        f(b)
+        return
+
+    for symbol in f:
+        add_in_backend(b, symbol)
+
+
 class IDPool:
     def __init__(self) -> None:
         self.objects: Dict[object, int] = defaultdict(lambda: self._next_id())
@@ -30,33 +44,50 @@ class IDPool:
 
 
 class ReifyFormulaAsFacts(Reify[int, Set[clingo.Symbol]]):
-    def __init__(self) -> None:
+    """Reify a formula as facts for the ASP encodings. Unless `native` is
+    set, weak next, weak until, strong release, implication, equivalence,
+    eventually and always are rewritten into the core operators."""
+
+    def __init__(self, native: bool = False) -> None:
         super().__init__()
         self.pool: IDPool = IDPool()
         self.facts: Set[clingo.Symbol] = set()
+        self.native: bool = native
 
     def result(self) -> Set[clingo.Symbol]:
         return self.facts
 
+    def emit(self, symbol: clingo.Symbol) -> None:
+        self.facts.add(symbol)
+
+    def node(self, key: Tuple) -> Tuple[int, bool]:
+        # Id of the node, and whether its facts still have to be emitted.
+        fresh = key not in self.pool.objects
+        return self.pool.id(key), fresh
+
     def constant(self, name: str) -> int:
-        id = self.pool.id((name,))
-        self.facts.add(clingo_symbol(name, [id]))
+        id, fresh = self.node((name,))
+        if fresh:
+            self.emit(clingo_symbol(name, [id]))
         return id
 
     def reify_unary(self, f: int, name: str) -> int:
-        id = self.pool.id((name, f))
-        self.facts.add(clingo_symbol(name, [id, f]))
+        id, fresh = self.node((name, f))
+        if fresh:
+            self.emit(clingo_symbol(name, [id, f]))
         return id
 
     def reify_binary(self, lhs: int, rhs: int, name: str) -> int:
-        id = self.pool.id((name, lhs, rhs))
-        self.facts.add(clingo_symbol(name, [id, lhs, rhs]))
+        id, fresh = self.node((name, lhs, rhs))
+        if fresh:
+            self.emit(clingo_symbol(name, [id, lhs, rhs]))
         return id
 
     def reify_variadic(self, fs: Sequence[int], name: str) -> int:
-        id = self.pool.id((name, *sorted(fs)))
-        for f in fs:
-            self.facts.add(clingo_symbol(name, [id, f]))
+        id, fresh = self.node((name, *sorted(fs)))
+        if fresh:
+            for f in fs:
+                self.emit(clingo_symbol(name, [id, f]))
         return id
 
     def true(self) -> int:
@@ -69,19 +100,21 @@ class ReifyFormulaAsFacts(Reify[int, Set[clingo.Symbol]]):
         return self.constant(Constants.LAST)
 
     def proposition(self, string: str) -> int:
-        id = self.pool.id((Constants.ATOMIC, string))
-        self.facts.add(
-            clingo.Function(
-                Constants.ATOMIC, [clingo.Number(id), clingo.String(string)]
+        id, fresh = self.node((Constants.ATOMIC, string))
+        if fresh:
+            self.emit(
+                clingo.Function(
+                    Constants.ATOMIC, [clingo.Number(id), clingo.String(string)]
+                )
             )
-        )
         return id
 
     def next(self, f: int) -> int:
         return self.reify_unary(f, Constants.NEXT)
 
     def weak_next(self, f: int) -> int:
-        # return self.reify_unary(f, Constants.WEAK_NEXT)
+        if self.native:
+            return self.reify_unary(f, Constants.WEAK_NEXT)
         return self.disjunction((self.last(), self.next(f)))
 
     def until(self, lhs: int, rhs: int) -> int:
@@ -91,27 +124,33 @@ class ReifyFormulaAsFacts(Reify[int, Set[clingo.Symbol]]):
         return self.reify_binary(lhs, rhs, Constants.RELEASE)
 
     def weak_until(self, lhs: int, rhs: int) -> int:
-        # return self.reify_binary(lhs, rhs, Constants.WEAK_UNTIL)
+        if self.native:
+            return self.reify_binary(lhs, rhs, Constants.WEAK_UNTIL)
         return self.disjunction((self.until(lhs, rhs), self.always(lhs)))
 
     def strong_release(self, lhs: int, rhs: int) -> int:
-        # return self.reify_binary(lhs, rhs, Constants.STRONG_RELEASE)
+        if self.native:
+            return self.reify_binary(lhs, rhs, Constants.STRONG_RELEASE)
         return self.conjunction((self.release(lhs, rhs), self.eventually(lhs)))
 
     def equivalence(self, lhs: int, rhs: int) -> int:
-        # return self.reify_binary(lhs, rhs, Constants.EQUALS)
+        if self.native:
+            return self.reify_binary(lhs, rhs, Constants.EQUALS)
         return self.conjunction((self.implies(lhs, rhs), self.implies(rhs, lhs)))
 
     def implies(self, lhs: int, rhs: int) -> int:
-        # return self.reify_binary(lhs, rhs, Constants.IMPLIES)
+        if self.native:
+            return self.reify_binary(lhs, rhs, Constants.IMPLIES)
         return self.disjunction((self.negate(lhs), rhs))
 
     def eventually(self, f: int) -> int:
-        # return self.reify_unary(f, Constants.EVENTUALLY)
+        if self.native:
+            return self.reify_unary(f, Constants.EVENTUALLY)
         return self.until(self.true(), f)
 
     def always(self, f: int) -> int:
-        # return self.reify_unary(f, Constants.ALWAYS)
+        if self.native:
+            return self.reify_unary(f, Constants.ALWAYS)
         return self.release(self.false(), f)
 
     def negate(self, f: int) -> int:
@@ -124,4 +163,4 @@ class ReifyFormulaAsFacts(Reify[int, Set[clingo.Symbol]]):
         return self.reify_variadic(fs, Constants.DISJUNCTION)
 
     def mark_as_root(self, f: int) -> None:
-        self.facts.add(clingo_symbol(Constants.ROOT, [f]))
+        self.emit(clingo_symbol(Constants.ROOT, [f]))
@@ -2,28 +2,31 @@ from typing import Optional, Sequence
 
 from ltlf2asp.parser.reify_interface import Reify
 from ltlf2asp.parser import syntax
-from ltlf2asp.parser.syntax import Formula, FormulaBuilder
+from ltlf2asp.parser.syntax import Formula, FormulaBuilder, FormulaContext
 
 
 class ReifyFormulaAsObject(Reify[syntax.Formula, Optional[syntax.Formula]]):
-    def __init__(self) -> None:
+    def __init__(self, context: Optional[FormulaContext] = None) -> None:
         super().__init__()
         self.f: Optional[syntax.Formula] = None
+        self.context: FormulaContext = (
+            syntax.current_context() if context is None else context
+        )
 
     def result(self) -> Optional[syntax.Formula]:
         return self.f.to_nnf()
 
     def true(self) -> syntax.Formula:
-        return FormulaBuilder.true()
+        return FormulaBuilder.true(self.context)
 
     def false(self) -> syntax.Formula:
-        return FormulaBuilder.false()
+        return FormulaBuilder.false(self.context)
 
     def last(self) -> syntax.Formula:
-        return FormulaBuilder.last()
+        return FormulaBuilder.last(self.context)
 
     def proposition(self, string: str) -> syntax.Formula:
-        return FormulaBuilder.proposition(string)
+        return FormulaBuilder.proposition(string, self.context)
 
     def next(self, f: syntax.Formula) -> syntax.Formula:
         return FormulaBuilder.next(f)
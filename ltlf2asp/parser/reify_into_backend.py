@@ -0,0 +1,18 @@
+import clingo  # type: ignore
+
+from ltlf2asp.parser.reify_as_atoms import ReifyFormulaAsFacts, add_in_backend
+
+
+class ReifyFormulaIntoBackend(ReifyFormulaAsFacts):
+    """Same facts as ReifyFormulaAsFacts, added to a clingo backend as soon as
+    each node is reified instead of being collected in a set."""
+
+    def __init__(self, backend: clingo.Backend, native: bool = False) -> None:
+        super().__init__(native)
+        self.backend: clingo.Backend = backend
+
+    def result(self) -> None:  # type: ignore
+        return None
+
+    def emit(self, symbol: clingo.Symbol) -> None:
+        add_in_backend(self.backend, symbol)
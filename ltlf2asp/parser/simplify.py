@@ -0,0 +1,142 @@
+from typing import List, Sequence, Set
+
+from ltlf2asp.parser.reify_as_arrays import FormulaArrays, Op, ReifyFormulaAsArrays
+
+
+class ReifySimplified(ReifyFormulaAsArrays):
+    """ReifyFormulaAsArrays with smart constructors: every node is simplified
+    as it is built, using rewritings that preserve LTLf equivalence:
+      - true/false are folded away;
+      - nested conjunctions (disjunctions) are flattened, duplicate operands
+        removed, and `a & ~a` (`a | ~a`) is false (true);
+      - G G a = G a, F F a = F a;
+      - binary operators with equal operands collapse, e.g. a U a = a;
+      - false R a = G a, true U a = F a, a W false = G a, a M true = F a.
+    Only nodes reachable from the root end up in the result."""
+
+    def op(self, f: int) -> Op:
+        return self.arrays.opcode[f]  # type: ignore
+
+    def result(self) -> FormulaArrays:
+        return self.arrays.replay(ReifyFormulaAsArrays())
+
+    def junction(self, fs: Sequence[int], op: Op, unit: Op, zero: Op) -> int:
+        operands: List[int] = []
+        seen: Set[int] = set()
+        for f in fs:
+            for g in self.arrays.operands(f) if self.op(f) == op else (f,):
+                if self.op(g) == zero:
+                    return self.node(zero)
+                if self.op(g) == unit or g in seen:
+                    continue
+                seen.add(g)
+                operands.append(g)
+
+        for g in operands:
+            if self.op(g) == Op.NEGATE and self.arrays.lhs[g] in seen:
+                return self.node(zero)
+
+        if len(operands) == 0:
+            return self.node(unit)
+        if len(operands) == 1:
+            return operands[0]
+        return self.node(op, fs=operands)
+
+    def conjunction(self, fs: Sequence[int]) -> int:
+        return self.junction(fs, Op.CONJUNCTION, Op.TRUE, Op.FALSE)
+
+    def disjunction(self, fs: Sequence[int]) -> int:
+        return self.junction(fs, Op.DISJUNCTION, Op.FALSE, Op.TRUE)
+
+    def negate(self, f: int) -> int:
+        if self.op(f) == Op.TRUE:
+            return self.false()
+        if self.op(f) == Op.FALSE:
+            return self.true()
+        if self.op(f) == Op.NEGATE:
+            return self.arrays.lhs[f]
+        return super().negate(f)
+
+    def next(self, f: int) -> int:
+        if self.op(f) == Op.FALSE:
+            return f
+        return super().next(f)
+
+    def weak_next(self, f: int) -> int:
+        if self.op(f) == Op.TRUE:
+            return f
+        if self.op(f) == Op.FALSE:
+            return self.last()
+        return super().weak_next(f)
+
+    def eventually(self, f: int) -> int:
+        if self.op(f) in (Op.TRUE, Op.FALSE, Op.EVENTUALLY):
+            return f
+        return super().eventually(f)
+
+    def always(self, f: int) -> int:
+        if self.op(f) in (Op.TRUE, Op.FALSE, Op.ALWAYS):
+            return f
+        return super().always(f)
+
+    def until(self, lhs: int, rhs: int) -> int:
+        if self.op(rhs) in (Op.TRUE, Op.FALSE) or lhs == rhs:
+            return rhs
+        if self.op(lhs) == Op.FALSE:
+            return rhs
+        if self.op(lhs) == Op.TRUE:
+            return self.eventually(rhs)
+        return super().until(lhs, rhs)
+
+    def release(self, lhs: int, rhs: int) -> int:
+        if self.op(rhs) in (Op.TRUE, Op.FALSE) or lhs == rhs:
+            return rhs
+        if self.op(lhs) == Op.TRUE:
+            return rhs
+        if self.op(lhs) == Op.FALSE:
+            return self.always(rhs)
+        return super().release(lhs, rhs)
+
+    def weak_until(self, lhs: int, rhs: int) -> int:
+        if self.op(rhs) == Op.TRUE or lhs == rhs:
+            return rhs
+        if self.op(lhs) == Op.TRUE:
+            return lhs
+        if self.op(lhs) == Op.FALSE:
+            return rhs
+        if self.op(rhs) == Op.FALSE:
+            return self.always(lhs)
+        return super().weak_until(lhs, rhs)
+
+    def strong_release(self, lhs: int, rhs: int) -> int:
+        if self.op(rhs) == Op.FALSE or lhs == rhs:
+            return rhs
+        if self.op(lhs) == Op.FALSE:
+            return lhs
+        if self.op(lhs) == Op.TRUE:
+            return rhs
+        if self.op(rhs) == Op.TRUE:
+            return self.eventually(lhs)
+        return super().strong_release(lhs, rhs)
+
+    def implies(self, lhs: int, rhs: int) -> int:
+        if self.op(lhs) == Op.FALSE or self.op(rhs) == Op.TRUE or lhs == rhs:
+            return self.true()
+        if self.op(lhs) == Op.TRUE:
+            return rhs
+        if self.op(rhs) == Op.FALSE:
+            return self.negate(lhs)
+        return super().implies(lhs, rhs)
+
+    def equivalence(self, lhs: int, rhs: int) -> int:
+        if lhs == rhs:
+            return self.true()
+        if self.op(lhs) == Op.TRUE:
+            return rhs
+        if self.op(rhs) == Op.TRUE:
+            return lhs
+        if self.op(lhs) == Op.FALSE:
+            return self.negate(rhs)
+        if self.op(rhs) == Op.FALSE:
+            return self.negate(lhs)
+        return super().equivalence(lhs, rhs)
@@ -1,47 +1,238 @@
-from dataclasses import dataclass
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
 from abc import ABC, abstractmethod
-from typing import Sequence, List
+from functools import lru_cache
+from typing import Sequence, List, Callable, Tuple, Union, Dict, Optional, Iterator, Set
 
 import clingo
 
 
-def integer_sequence():
-    x = 1
-    while True:
-        yield x
-        x += 1
+class FormulaContext:
+    """Arena owning the hash-consing table of a family of formulas, and thus
+    their ids: formulas built in a fresh context are numbered 1, 2, ... in
+    construction order, whatever the history of the process.
 
+    Dropping a context (and its formulas) releases the whole table; after a
+    reset, formulas built before it must not be mixed with newer ones."""
 
-__formula_id_sequence__ = integer_sequence()
-__formula_ids__ = dict()
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.formulas: Dict[Tuple, Formula] = dict()
+        self.rewritings: Dict[Tuple[Formula, bool], Formula] = dict()
 
+    def __len__(self) -> int:
+        return len(self.formulas)
 
-def tableaux_reify(f: "Formula"):
+    def intern(self, cls: type, args: Tuple) -> "Formula":
+        h = cls.__code__(*args)  # type: ignore
+        with self.lock:
+            f = self.formulas.get(h)
+            if f is None:
+                f = object.__new__(cls)
+                f.__dict__["uid"] = len(self.formulas) + 1
+                f.__dict__["context"] = self
+                f.__dict__.update(zip(_field_names(cls), args))
+                self.formulas[h] = f
+
+        return f
+
+    def reset(self) -> None:
+        with self.lock:
+            self.formulas.clear()
+            self.rewritings.clear()
+
+    @contextmanager
+    def activate(self) -> Iterator["FormulaContext"]:
+        """Make this the context in which new leaves (truth values and
+        propositions) are built, for the current thread or task."""
+        token = __current_context__.set(self)
+        try:
+            yield self
+        finally:
+            __current_context__.reset(token)
+
+    def adopt(self, f: "Formula") -> "Formula":
+        """Rebuild `f` (built in any context) in this context."""
+        if f.context is self:
+            return f
+
+        return _unflatten(_flatten(f), self)
+
+
+DEFAULT_CONTEXT = FormulaContext()
+__current_context__: ContextVar[FormulaContext] = ContextVar(
+    "formula_context", default=DEFAULT_CONTEXT
+)
+
+
+def current_context() -> FormulaContext:
+    return __current_context__.get()
+
+
+def tableaux_reify(f: "Formula", context: Optional[FormulaContext] = None):
+    # Ids are the ones of the formula context: reifying in a fresh context
+    # yields the same facts for the same formula, in any process.
+    if context is not None:
+        f = context.adopt(f)
+
+    # Each subformula is reified once, however many times it is shared, in
+    # left-to-right preorder.
     facts = [clingo.Function("root", [f.id])]
+    visited = {f}
     stack = [f]
     while len(stack) > 0:
         top = stack.pop()
-        stack.extend(top.children())
         facts.extend(top.tableaux_reify())
+        for x in reversed(top.children()):
+            if x not in visited:
+                visited.add(x)
+                stack.append(x)
 
     return facts
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(x.name for x in fields(cls) if x.name not in ("uid", "context"))
+
+
+def _flatten(f: "Formula") -> List[Tuple[type, Tuple]]:
+    # Subformulas of f in post-order, each listed once, with references to
+    # subformulas replaced by their position in the list.
+    index: Dict[Formula, int] = dict()
+    table: List[Tuple[type, Tuple]] = []
+    stack: List[Tuple[Formula, bool]] = [(f, False)]
+    while len(stack) > 0:
+        top, visited = stack.pop()
+        if top in index:
+            continue
+
+        if not visited:
+            stack.append((top, True))
+            stack.extend((x, False) for x in reversed(top.children()))
+            continue
+
+        args = []
+        for x in _field_names(type(top)):
+            value = getattr(top, x)
+            if isinstance(value, Formula):
+                value = index[value]
+            elif isinstance(value, tuple):
+                value = tuple(index[y] for y in value)
+            args.append(value)
+
+        index[top] = len(table)
+        table.append((type(top), tuple(args)))
+
+    return table
+
+
+def _unflatten(table: List[Tuple[type, Tuple]], context: FormulaContext) -> "Formula":
+    built: List[Formula] = []
+    for cls, args in table:
+        xs = []
+        for value in args:
+            if isinstance(value, int):
+                value = built[value]
+            elif isinstance(value, tuple):
+                value = tuple(built[y] for y in value)
+            xs.append(value)
+        built.append(context.intern(cls, tuple(xs)))
+
+    return built[-1]
+
+
+def _load(table: List[Tuple[type, Tuple]]) -> "Formula":
+    return _unflatten(table, current_context())
+
+
+# A rewriting step maps a formula to a builder and to the (subformula,
+# polarity) pairs whose rewritings the builder has to be applied to.
+Builder = Callable[[List["Formula"]], "Formula"]
+Rewriting = Tuple[Builder, List[Tuple["Formula", bool]]]
+
+
+def _rewrite(f: "Formula", positive: bool) -> "Formula":
+    # NNF of f (positive) or of its negation (not positive), computed with an
+    # explicit stack so that deeply nested formulas do not hit the recursion
+    # limit. Rewritings are memoized per (formula, polarity) in the context of
+    # f, so shared subformulas are rewritten once and the cost is linear in
+    # the size of the DAG.
+    memo = f.context.rewritings
+    results: List[Formula] = []
+    stack: List[Union[Tuple[Formula, bool], Tuple[Builder, Tuple]]] = [(f, positive)]
+    while len(stack) > 0:
+        top, arg = stack.pop()
+        if not isinstance(top, Formula):
+            key, arity = arg
+            args = results[len(results) - arity :]
+            del results[len(results) - arity :]
+            g = top(args)
+            memo[key] = g
+            # An NNF formula is its own NNF.
+            memo[(g, True)] = g
+            results.append(g)
+            continue
+
+        g = memo.get((top, arg))
+        if g is not None:
+            results.append(g)
+            continue
+
+        build, children = top.rewrite(arg)  # type: ignore
+        stack.append((build, ((top, arg), len(children))))
+        stack.extend(reversed(children))
+
+    return results[0]
+
+
+@dataclass(frozen=True, eq=False, init=False)
 class Formula(ABC):
+    """Formulas are hash-consed: building a formula structurally equal to an
+    existing one of the same FormulaContext returns the existing object.
+    Equality is therefore identity, and both `uid` and the hash are computed
+    once, at construction.
+
+    Compound formulas live in the context of their subformulas; leaves live in
+    the given context, or in the current one (see FormulaContext.activate)."""
+
+    uid: int = field(repr=False)
+    context: FormulaContext = field(repr=False)
+
+    def __new__(cls, *args, context: Optional[FormulaContext] = None):
+        for x in args:
+            for y in x if isinstance(x, tuple) else (x,):
+                if not isinstance(y, Formula):
+                    continue
+                if context is None:
+                    context = y.context
+                elif y.context is not context:
+                    raise ValueError("Formulas from different contexts.")
+
+        if context is None:
+            context = current_context()
+
+        return context.intern(cls, args)
+
+    def __hash__(self) -> int:
+        return self.uid
+
+    def __reduce__(self):
+        # Pickled as a flat table, rebuilt in the current context when loaded.
+        return _load, (_flatten(self),)
+
+    @classmethod
     @abstractmethod
-    def __code__(self):
+    def __code__(cls, *args):
+        # Subformulas are referred to by their ids, so that codes are
+        # constant-size and never require visiting the whole subtree.
         pass
 
-    def __post_init__(self):
-        h = self.__code__()
-        if h not in __formula_ids__:
-            i = next(__formula_id_sequence__)
-            __formula_ids__[h] = i
-
     @property
     def id(self):
-        return clingo.Number(__formula_ids__[self.__code__()])
+        return clingo.Number(self.uid)
 
     @abstractmethod
     def __str__(self) -> str:
@@ -56,19 +247,36 @@ class Formula(ABC):
         pass
 
     @abstractmethod
-    def negate(self):
+    def rewrite(self, positive: bool) -> Rewriting:
         pass
 
-    @abstractmethod
+    def negate(self):
+        return _rewrite(self, False)
+
     def to_nnf(self):
-        pass
+        return _rewrite(self, True)
+
+    def propositions(self) -> Set[str]:
+        # Names of the propositions occurring in the formula, positively or not.
+        names = set()
+        visited = {self}
+        stack: List[Formula] = [self]
+        while len(stack) > 0:
+            top = stack.pop()
+            if isinstance(top, (Proposition, NegativeProposition)):
+                names.add(top.value)
+            for x in top.children():
+                if x not in visited:
+                    visited.add(x)
+                    stack.append(x)
+        return names
 
     @abstractmethod
     def tableaux_reify(self):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, init=False)
 class Atomic(Formula, ABC):
     def __str__(self) -> str:
         return self.symbol()
@@ -76,13 +284,19 @@ class Atomic(Formula, ABC):
     def children(self) -> List:
         return []
 
-    def to_nnf(self):
-        return self
+    @abstractmethod
+    def dual(self) -> "Atomic":
+        pass
 
+    def rewrite(self, positive: bool) -> Rewriting:
+        f = self if positive else self.dual()
+        return lambda _: f, []
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, eq=False, init=False)
 class Truth(Atomic):
-    def __code__(self):
+    @classmethod
+    def __code__(cls):
         return ("true",)
 
     @property
@@ -92,16 +306,17 @@ class Truth(Atomic):
     def symbol(self) -> str:
         return "#true"
 
-    def negate(self):
-        return Faux()
+    def dual(self) -> Atomic:
+        return Faux(context=self.context)
 
     def tableaux_reify(self):
         return []
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, init=False)
 class Faux(Atomic):
-    def __code__(self):
+    @classmethod
+    def __code__(cls):
         return ("false",)
 
     @property
@@ -111,42 +326,44 @@ class Faux(Atomic):
     def symbol(self) -> str:
         return "#false"
 
-    def negate(self):
-        return Truth()
+    def dual(self) -> Atomic:
+        return Truth(context=self.context)
 
     def tableaux_reify(self):
         return []
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, init=False)
 class Proposition(Atomic):
     value: str
 
-    def __code__(self):
-        return ("proposition", self.value)
+    @classmethod
+    def __code__(cls, value: str):
+        return ("proposition", value)
 
     def symbol(self) -> str:
         return self.value
 
-    def negate(self):
-        return NegativeProposition(self.value)
+    def dual(self) -> Atomic:
+        return NegativeProposition(self.value, context=self.context)
 
     def tableaux_reify(self):
         return (clingo.Function("atomic", [self.id, clingo.Function(self.value)]),)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, init=False)
 class NegativeProposition(Atomic):
     value: str
 
-    def __code__(self):
-        return ("negative-proposition", self.value)
+    @classmethod
+    def __code__(cls, value: str):
+        return ("negative-proposition", value)
 
     def symbol(self) -> str:
         return "~" + self.value
 
-    def negate(self):
-        return Proposition(self.value)
+    def dual(self) -> Atomic:
+        return Proposition(self.value, context=self.context)
 
     def tableaux_reify(self):
         return (
@@ -156,13 +373,10 @@ class NegativeProposition(Atomic):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, init=False)
 class Unary(Formula, ABC):
     f: Formula
 
-    def dual(self):
-        pass
-
     def __str__(self) -> str:
         return "({} {})".format(self.symbol(), self.f)
 
@@ -170,65 +384,58 @@ class Unary(Formula, ABC):
         return [self.f]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, init=False)
 class Next(Unary):
-    def __code__(self):
-        return ("next", *self.f.__code__())
+    @classmethod
+    def __code__(cls, f: Formula):
+        return ("next", f.uid)
 
     def symbol(self) -> str:
         return "X"
 
-    def negate(self):
-        return WeakNext(self.f.negate())
-
-    def to_nnf(self):
-        return Next(self.f.to_nnf())
+    def rewrite(self, positive: bool) -> Rewriting:
+        cls = Next if positive else WeakNext
+        return lambda xs: cls(xs[0]), [(self.f, positive)]
 
     def tableaux_reify(self):
         return (clingo.Function("next", [self.id, self.f.id]),)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, init=False)
 class WeakNext(Unary):
-    def __code__(self):
-        return ("weak-next", *self.f.__code__())
+    @classmethod
+    def __code__(cls, f: Formula):
+        return ("weak-next", f.uid)
 
     def symbol(self) -> str:
         return "WX"
 
-    def negate(self):
-        return Next(self.f.negate())
-
-    def to_nnf(self):
-        return WeakNext(self.f.to_nnf())
+    def rewrite(self, positive: bool) -> Rewriting:
+        cls = WeakNext if positive else Next
+        return lambda xs: cls(xs[0]), [(self.f, positive)]
 
     def tableaux_reify(self):
         return (clingo.Function("weak_next", [self.id, self.f.id]),)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, init=False)
 class Negate(Unary):
-    def __code__(self):
-        return ("negate", *self.f.__code__())
+    @classmethod
+    def __code__(cls, f: Formula):
+        return ("negate", f.uid)
 
     def symbol(self) -> str:
         return "~"
 
-    def negate(self):
-        return self.f
-
-    def to_nnf(self):
-        if isinstance(self.f, Negate):
-            return self.f.to_nnf()
-
-        return self.f.negate().to_nnf()
+    def rewrite(self, positive: bool) -> Rewriting:
+        return lambda xs: xs[0], [(self.f, not positive)]
 
     def tableaux_reify(self):
         # Negations are absorbed in NNF
         raise NotImplementedError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, init=False)
 class Binary(Formula, ABC):
     lhs: Formula
     rhs: Formula
@@ -240,46 +447,47 @@ class Binary(Formula, ABC):
         return [self.lhs, self.rhs]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, init=False)
 class Release(Binary):
-    def __code__(self):
-        return ("release", (self.lhs.__code__(), self.rhs.__code__()))
+    @classmethod
+    def __code__(cls, lhs: Formula, rhs: Formula):
+        return ("release", lhs.uid, rhs.uid)
 
     def symbol(self) -> str:
         return "R"
 
-    def negate(self):
-        return Until(self.lhs.negate(), self.rhs.negate())
-
-    def to_nnf(self):
-        return Release(self.lhs.to_nnf(), self.rhs.to_nnf())
+    def rewrite(self, positive: bool) -> Rewriting:
+        cls = Release if positive else Until
+        return lambda xs: cls(*xs), [(self.lhs, positive), (self.rhs, positive)]
 
     def tableaux_reify(self):
         return (clingo.Function("release", [self.id, self.lhs.id, self.rhs.id]),)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, init=False)
 class Until(Binary):
-    def __code__(self):
-        return ("until", (self.lhs.__code__(), self.rhs.__code__()))
+    @classmethod
+    def __code__(cls, lhs: Formula, rhs: Formula):
+        return ("until", lhs.uid, rhs.uid)
 
     def symbol(self) -> str:
         return "U"
 
-    def negate(self):
-        return Release(self.lhs.negate(), self.rhs.negate())
-
-    def to_nnf(self):
-        return Until(self.lhs.to_nnf(), self.rhs.to_nnf())
+    def rewrite(self, positive: bool) -> Rewriting:
+        cls = Until if positive else Release
+        return lambda xs: cls(*xs), [(self.lhs, positive), (self.rhs, positive)]
 
     def tableaux_reify(self):
         return (clingo.Function("until", [self.id, self.lhs.id, self.rhs.id]),)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, init=False)
 class Variadic(Formula, ABC):
     fs: Sequence[Formula]
 
+    def __new__(cls, fs: Sequence[Formula], context: Optional[FormulaContext] = None):
+        return super().__new__(cls, tuple(fs), context=context)
+
     def __str__(self) -> str:
         return "({})".format((" " + self.symbol() + " ").join(str(x) for x in self.fs))
 
@@ -287,37 +495,35 @@ class Variadic(Formula, ABC):
         return list(self.fs)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, init=False)
 class Conjunction(Variadic):
-    def __code__(self):
-        return ("conjunction", *[f.__code__() for f in self.fs])
+    @classmethod
+    def __code__(cls, fs: Sequence[Formula]):
+        return ("conjunction", *[f.uid for f in fs])
 
     def symbol(self) -> str:
         return "&"
 
-    def negate(self):
-        return Disjunction([f.negate() for f in self.fs])
-
-    def to_nnf(self):
-        return Conjunction([f.to_nnf() for f in self.fs])
+    def rewrite(self, positive: bool) -> Rewriting:
+        cls = Conjunction if positive else Disjunction
+        return cls, [(f, positive) for f in self.fs]
 
     def tableaux_reify(self):
         return tuple([clingo.Function("conjunction", [self.id, f.id]) for f in self.fs])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, init=False)
 class Disjunction(Variadic):
-    def __code__(self):
-        return ("disjunction", *[f.__code__() for f in self.fs])
+    @classmethod
+    def __code__(cls, fs: Sequence[Formula]):
+        return ("disjunction", *[f.uid for f in fs])
 
     def symbol(self) -> str:
         return "|"
 
-    def negate(self):
-        return Conjunction([f.negate() for f in self.fs])
-
-    def to_nnf(self):
-        return Disjunction([f.to_nnf() for f in self.fs])
+    def rewrite(self, positive: bool) -> Rewriting:
+        cls = Disjunction if positive else Conjunction
+        return cls, [(f, positive) for f in self.fs]
 
     def tableaux_reify(self):
         return tuple([clingo.Function("disjunction", [self.id, f.id]) for f in self.fs])
@@ -325,24 +531,24 @@ class Disjunction(Variadic):
 
 class FormulaBuilder:
     @staticmethod
-    def proposition(value: str):
-        return Proposition(value)
+    def proposition(value: str, context: Optional[FormulaContext] = None):
+        return Proposition(value, context=context)
 
     @staticmethod
-    def negative_proposition(value: str):
-        return NegativeProposition(value)
+    def negative_proposition(value: str, context: Optional[FormulaContext] = None):
+        return NegativeProposition(value, context=context)
 
     @staticmethod
-    def last():
-        return WeakNext(Faux())
+    def last(context: Optional[FormulaContext] = None):
+        return WeakNext(Faux(context=context))
 
     @staticmethod
-    def true():
-        return Truth()
+    def true(context: Optional[FormulaContext] = None):
+        return Truth(context=context)
 
     @staticmethod
-    def false():
-        return Faux()
+    def false(context: Optional[FormulaContext] = None):
+        return Faux(context=context)
 
     @staticmethod
     def next(f: Formula):
@@ -354,11 +560,11 @@ class FormulaBuilder:
         # ~F(~a)
         # ~(true U ~a)
         # false R a
-        return Release(Faux(), f)
+        return Release(Faux(context=f.context), f)
 
     @staticmethod
     def eventually(f: Formula):
-        return Until(Truth(), f)
+        return Until(Truth(context=f.context), f)
 
     @staticmethod
     def weak_next(f: Formula):
@@ -388,9 +594,7 @@ class FormulaBuilder:
         # ~(G(~a) | (~a U ~b))
         # ~((false R ~a) | (~a U ~b))
         # true U a & (a R b))
-        return Conjunction(
-            [FormulaBuilder.until(Truth(), f), FormulaBuilder.release(f, g)]
-        )
+        return Conjunction([FormulaBuilder.eventually(f), FormulaBuilder.release(f, g)])
 
     @staticmethod
     def implication(f: Formula, g: Formula):
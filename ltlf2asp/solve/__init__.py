@@ -5,3 +5,5 @@ CHECK = Path(ENCODINGS_FOLDER, "check_trace.lp").as_posix()
 SOLVE_STATIC = Path(ENCODINGS_FOLDER, "solve_static.lp").as_posix()
 SOLVE_INCREMENTAL = Path(ENCODINGS_FOLDER, "solve_incremental.lp").as_posix()
 REYNOLDS = Path(ENCODINGS_FOLDER, "reynolds.lp").as_posix()
+SOLVE_HORIZONS = Path(ENCODINGS_FOLDER, "solve_horizons.lp").as_posix()
+REYNOLDS_INCREMENTAL = Path(ENCODINGS_FOLDER, "reynolds_incremental.lp").as_posix()
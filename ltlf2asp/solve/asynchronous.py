@@ -0,0 +1,47 @@
+import asyncio
+from typing import Callable, List, Sequence, Tuple
+
+import clingo  # type: ignore
+
+# Building blocks of the async variants of the solvers. The event loop is
+# never blocked: grounding runs in the default executor, and solving in the
+# thread clingo starts for async solve calls.
+
+Parts = Sequence[Tuple[str, List[clingo.Symbol]]]
+
+
+async def ground_async(ctl: clingo.Control, parts: Parts) -> None:
+    """Ground `parts` in a worker thread. A grounding call cannot be
+    interrupted: if the task is cancelled meanwhile, the call runs to its end
+    in the background, and the task is cancelled right away."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, ctl.ground, parts)
+
+
+async def solve_async(
+    ctl: clingo.Control,
+    on_model: Callable[[clingo.Model], bool],
+    assumptions: Sequence[int] = (),
+) -> clingo.SolveResult:
+    """Solve without blocking the event loop. Cancelling the awaiting task
+    interrupts the search. As for Control.solve, `on_model` is called from
+    the solving thread."""
+    loop = asyncio.get_running_loop()
+    finished = loop.create_future()
+
+    def on_finish(result: clingo.SolveResult) -> None:
+        loop.call_soon_threadsafe(_set_result, finished, result)
+
+    with ctl.solve(
+        assumptions, on_model=on_model, on_finish=on_finish, async_=True
+    ) as handle:
+        try:
+            return await finished
+        except asyncio.CancelledError:
+            handle.cancel()
+            raise
+
+
+def _set_result(future: asyncio.Future, result: clingo.SolveResult) -> None:
+    if not future.done():
+        future.set_result(result)
@@ -0,0 +1,350 @@
+import pickle
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Deque,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import clingo  # type: ignore
+
+from ltlf2asp.parser.constants import Constants
+from ltlf2asp.parser.syntax import (
+    Conjunction,
+    Disjunction,
+    Faux,
+    Formula,
+    FormulaBuilder,
+    FormulaContext,
+    Next,
+    NegativeProposition,
+    Proposition,
+    Release,
+    Truth,
+    Until,
+    WeakNext,
+    _flatten,
+)
+from ltlf2asp.solve.budget import UNLIMITED, Budget
+from ltlf2asp.solve.decode_model import Model, SolveResult, SolveStatus, State
+
+# The automaton of a formula is built on the fly by progression: its states
+# are formulas in NNF, the initial one being the formula itself, and reading
+# an instant of the trace moves to the formula the rest of the trace has to
+# satisfy. Letters are partial assignments (cubes): a state has one
+# transition per cube, instead of one per assignment to all propositions.
+Cube = FrozenSet[Tuple[str, bool]]
+# A formula, flattened as by pickling: equal in any context.
+Key = Tuple[Tuple[type, Tuple], ...]
+
+CACHE_FILE = "ltlf2asp-automata.pickle"
+CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class Step:
+    """The outgoing transitions of a state: a trace going on from an instant
+    agreeing with a cube must then satisfy the successor, while a trace may
+    end on an instant agreeing with one of the `final` cubes."""
+
+    transitions: Tuple[Tuple[Cube, Formula], ...]
+    final: Tuple[Cube, ...]
+
+
+def _merge(x: Cube, y: Cube) -> Optional[Cube]:
+    # The conjunction of two cubes, None if inconsistent.
+    merged = x | y
+    if len({p for p, _ in merged}) < len(merged):
+        return None
+    return merged
+
+
+EMPTY: Cube = frozenset()
+EMPTY_SET: FrozenSet[Formula] = frozenset()
+
+
+def _conjuncts(f: Formula) -> FrozenSet[Formula]:
+    if isinstance(f, Conjunction):
+        return frozenset(f.fs)
+    if isinstance(f, Truth):
+        return EMPTY_SET
+    return frozenset((f,))
+
+
+class Automaton:
+    """The progression automaton of a formula in NNF, built lazily: the step
+    of each state is computed once. States are hash-consed in the context of
+    the formula, which should be owned by the automaton: dropping it frees
+    them all."""
+
+    def __init__(self, root: Formula, steps: Optional[Dict[Formula, Step]] = None):
+        self.root = root
+        self.context = root.context
+        self.steps: Dict[Formula, Step] = dict() if steps is None else steps
+
+    def __reduce__(self):
+        # Rebuilt in a fresh context when loaded.
+        return _load, (pickle.dumps((self.root, self.steps)),)
+
+    def conjunction(self, operands: FrozenSet[Formula]) -> Formula:
+        # In a canonical order, so that equal sets give the same state.
+        if len(operands) == 0:
+            return FormulaBuilder.true(self.context)
+        if len(operands) == 1:
+            return next(iter(operands))
+        return Conjunction(sorted(operands, key=lambda x: x.uid))
+
+    def step(self, f: Formula) -> Step:
+        """The step of `f`, from the steps of its subformulas at the same
+        instant, computed bottom-up with an explicit stack."""
+        stack = [(f, False)]
+        while len(stack) > 0:
+            top, expanded = stack.pop()
+            if top in self.steps:
+                continue
+
+            children = _current(top)
+            if not expanded and len(children) > 0:
+                stack.append((top, True))
+                stack.extend((x, False) for x in children)
+                continue
+
+            self.steps[top] = self._step(top)
+
+        return self.steps[f]
+
+    def _step(self, f: Formula) -> Step:
+        true = FormulaBuilder.true(self.context)
+        if isinstance(f, Truth):
+            return Step(((EMPTY, true),), (EMPTY,))
+        elif isinstance(f, Faux):
+            return Step((), ())
+        elif isinstance(f, (Proposition, NegativeProposition)):
+            cube = frozenset(((f.value, isinstance(f, Proposition)),))
+            return Step(((cube, true),), (cube,))
+        elif isinstance(f, Next):
+            return self._canonical([(EMPTY, f.f)], [])
+        elif isinstance(f, WeakNext):
+            return self._canonical([(EMPTY, f.f)], [EMPTY])
+        elif isinstance(f, Conjunction):
+            # Successors are built once per distinct set of conjuncts.
+            transitions = {(EMPTY, EMPTY_SET)}
+            final = {EMPTY}
+            for x in f.fs:
+                s = self.steps[x]
+                transitions = {
+                    (c, conjuncts | _conjuncts(g))
+                    for y, conjuncts in transitions
+                    for z, g in s.transitions
+                    if (c := _merge(y, z)) is not None
+                }
+                final = {
+                    c for y in final for z in s.final if (c := _merge(y, z)) is not None
+                }
+            return self._canonical(
+                [(c, self.conjunction(conjuncts)) for c, conjuncts in transitions],
+                list(final),
+            )
+        elif isinstance(f, Disjunction):
+            steps = [self.steps[x] for x in f.fs]
+            return self._canonical(
+                [t for s in steps for t in s.transitions],
+                [c for s in steps for c in s.final],
+            )
+        elif isinstance(f, Until):
+            # Fulfilled now, or postponed to the next instant.
+            lhs, rhs = self.steps[f.lhs], self.steps[f.rhs]
+            postponed = [
+                (c, self.conjunction(_conjuncts(g) | {f})) for c, g in lhs.transitions
+            ]
+            return self._canonical([*rhs.transitions, *postponed], rhs.final)
+        elif isinstance(f, Release):
+            # Released now, or carried over to the next instant, if any.
+            lhs, rhs = self.steps[f.lhs], self.steps[f.rhs]
+            transitions = [
+                (c, self.conjunction(_conjuncts(g) | _conjuncts(h)))
+                for x, g in rhs.transitions
+                for y, h in (*lhs.transitions, (EMPTY, f))
+                if (c := _merge(x, y)) is not None
+            ]
+            return self._canonical(transitions, rhs.final)
+
+        raise ValueError("Not in negation normal form: {}".format(f))
+
+    @staticmethod
+    def _canonical(transitions: List[Tuple[Cube, Formula]], final: List[Cube]) -> Step:
+        # Without duplicates, nor transitions to false.
+        unique = dict.fromkeys(t for t in transitions if not isinstance(t[1], Faux))
+        return Step(tuple(unique), tuple(dict.fromkeys(final)))
+
+    def solve(self, budget: Budget = UNLIMITED) -> SolveResult:
+        """Decide the formula by a breadth-first search of an accepting state:
+        the answer is definitive, and a satisfiable formula comes with a
+        shortest witness, k being its length. Otherwise k is the number of
+        instants of the longest trace explored. Only the time of the budget
+        applies."""
+        spending = budget.start()
+        root = self.root
+        propositions = sorted(root.propositions())
+
+        # How each state was first reached: its parent, and the letter read.
+        parents: Dict[Formula, Optional[Tuple[Formula, Cube]]] = {root: None}
+        depths = {root: 1}
+        queue: Deque[Formula] = deque([root])
+        k = 1
+        while len(queue) > 0:
+            if not spending.check():
+                return SolveResult(
+                    SolveStatus.UNKNOWN, k, None, exhausted=spending.exhausted
+                )
+
+            state = queue.popleft()
+            k = depths[state]
+            step = self.step(state)
+            if len(step.final) > 0:
+                cubes = [step.final[0]]
+                parent = parents[state]
+                while parent is not None:
+                    state, cube = parent
+                    cubes.append(cube)
+                    parent = parents[state]
+
+                model = Model(
+                    tuple(
+                        State({p: (p, True) in cube for p in propositions})
+                        for cube in reversed(cubes)
+                    )
+                )
+                return SolveResult(SolveStatus.SATISFIABLE, len(model), model)
+
+            for cube, successor in step.transitions:
+                if successor not in parents:
+                    parents[successor] = (state, cube)
+                    depths[successor] = k + 1
+                    queue.append(successor)
+
+        return SolveResult(SolveStatus.UNSATISFIABLE, k, None)
+
+
+class Automata:
+    """Progression automata of LTLf formulas, each one in a context of its
+    own. The cache keeps the `maxsize` most recently used automata, so that
+    solving a formula again reuses its states; an evicted automaton frees
+    them. With `cache_dir`, the cache is loaded from there, and `save` writes
+    it back."""
+
+    def __init__(
+        self, maxsize: int = CACHE_SIZE, cache_dir: Optional[Union[str, Path]] = None
+    ) -> None:
+        self.maxsize = maxsize
+        self.automata: "OrderedDict[Key, Automaton]" = OrderedDict()
+        self.path = None if cache_dir is None else Path(cache_dir, CACHE_FILE)
+        if self.path is not None and self.path.is_file():
+            self.load(self.path)
+
+    def load(self, path: Path) -> None:
+        with open(path, "rb") as stream:
+            for key, automaton in pickle.load(stream):
+                self.cache(key, automaton)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "wb") as stream:
+            pickle.dump(list(self.automata.items()), stream)
+
+    def cache(self, key: Key, automaton: Automaton) -> Automaton:
+        self.automata[key] = automaton
+        if len(self.automata) > self.maxsize:
+            self.automata.popitem(last=False)
+        return automaton
+
+    def automaton(self, f: Formula) -> Automaton:
+        # Formulas are looked up by structure, whatever their context.
+        key = tuple(_flatten(f))
+        if key in self.automata:
+            self.automata.move_to_end(key)
+            return self.automata[key]
+        return self.cache(key, Automaton(FormulaContext().adopt(f).to_nnf()))
+
+    def solve(self, f: Formula, budget: Budget = UNLIMITED) -> SolveResult:
+        """Decide `f`, see Automaton.solve."""
+        return self.automaton(f).solve(budget)
+
+
+def _load(data: bytes) -> Automaton:
+    context = FormulaContext()
+    with context.activate():
+        root, steps = pickle.loads(data)
+    return Automaton(root, steps)
+
+
+def _current(f: Formula) -> List[Formula]:
+    # Subformulas whose steps make the step of f: the ones at the same
+    # instant, not under a next.
+    if isinstance(f, (Next, WeakNext)):
+        return []
+    return f.children()
+
+
+# How each kind of fact builds its formula from the subformulas it refers to,
+# see ReifyFormulaAsFacts.
+_BUILDERS: Dict[str, Callable[..., Formula]] = {
+    Constants.TRUE: FormulaBuilder.true,
+    Constants.FALSE: FormulaBuilder.false,
+    Constants.LAST: FormulaBuilder.last,
+    Constants.NEXT: FormulaBuilder.next,
+    Constants.WEAK_NEXT: FormulaBuilder.weak_next,
+    Constants.NEGATE: FormulaBuilder.negate,
+    Constants.EVENTUALLY: FormulaBuilder.eventually,
+    Constants.ALWAYS: FormulaBuilder.always,
+    Constants.UNTIL: FormulaBuilder.until,
+    Constants.WEAK_UNTIL: FormulaBuilder.weak_until,
+    Constants.RELEASE: FormulaBuilder.release,
+    Constants.STRONG_RELEASE: FormulaBuilder.strong_release,
+    Constants.IMPLIES: FormulaBuilder.implication,
+    Constants.EQUALS: FormulaBuilder.equivalence,
+}
+
+
+def formula_from_facts(
+    facts: Iterable[clingo.Symbol], context: FormulaContext
+) -> Formula:
+    """The formula reified by `facts`, built in `context`. Subformulas have
+    smaller ids than the formulas containing them, so ids are decoded in
+    increasing order."""
+    nodes: Dict[int, List[clingo.Symbol]] = defaultdict(list)
+    root = None
+    for symbol in facts:
+        if symbol.name == Constants.ROOT:
+            root = symbol.arguments[0].number
+        else:
+            nodes[symbol.arguments[0].number].append(symbol)
+    if root is None:
+        raise ValueError("No root in the formula facts.")
+
+    formulas: Dict[int, Formula] = dict()
+    with context.activate():
+        for id in sorted(nodes):
+            symbol = nodes[id][0]
+            if symbol.name == Constants.ATOMIC:
+                f = FormulaBuilder.proposition(symbol.arguments[1].string)
+            elif symbol.name == Constants.CONJUNCTION:
+                f = Conjunction([formulas[x.arguments[1].number] for x in nodes[id]])
+            elif symbol.name == Constants.DISJUNCTION:
+                f = Disjunction([formulas[x.arguments[1].number] for x in nodes[id]])
+            else:
+                args = [formulas[x.number] for x in symbol.arguments[1:]]
+                f = _BUILDERS[symbol.name](*args)
+            formulas[id] = f
+
+    return formulas[root]
@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Optional, Sequence
+
+# Imported by the CLI: clingo is only needed for annotations.
+if TYPE_CHECKING:
+    import clingo  # type: ignore
+
+    from ltlf2asp.solve.asynchronous import Parts
+
+# Names of the budgets, as reported by results when one was exhausted.
+TIME = "time"
+CONFLICTS = "conflicts"
+RESTARTS = "restarts"
+ATOMS = "atoms"
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Resources a solver call may use in total over all horizons, None for
+    no limit: wall-clock seconds, clasp conflicts and restarts, and ground
+    atoms in a single Control."""
+
+    time: Optional[float] = None
+    conflicts: Optional[int] = None
+    restarts: Optional[int] = None
+    atoms: Optional[int] = None
+
+    def start(self) -> "Spending":
+        return Spending(self)
+
+
+UNLIMITED = Budget()
+
+
+class Spending:
+    """What a solver call has used of its budget. Grounding and solving go
+    through `ground` and `solve`, which return False and None once a budget
+    is exhausted (see `exhausted`)."""
+
+    def __init__(self, budget: Budget) -> None:
+        self.budget = budget
+        self.deadline = None if budget.time is None else perf_counter() + budget.time
+        self.conflicts = 0
+        self.restarts = 0
+        self.exhausted: Optional[str] = None
+
+    def remaining_time(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - perf_counter())
+
+    def check(self) -> bool:
+        if self.deadline is not None and perf_counter() >= self.deadline:
+            self.exhausted = TIME
+        elif _spent(self.conflicts, self.budget.conflicts):
+            self.exhausted = CONFLICTS
+        elif _spent(self.restarts, self.budget.restarts):
+            self.exhausted = RESTARTS
+        return self.exhausted is None
+
+    def ground(self, ctl: "clingo.Control", parts: "Parts") -> bool:
+        # Grounding cannot be interrupted: budgets are checked around it.
+        if not self.check():
+            return False
+
+        ctl.ground(parts)
+        if _spent(len(ctl.symbolic_atoms), self.budget.atoms):
+            self.exhausted = ATOMS
+        return self.check()
+
+    def solve(
+        self,
+        ctl: "clingo.Control",
+        on_model: Callable[["clingo.Model"], bool],
+        assumptions: Sequence[int] = (),
+    ) -> Optional["clingo.SolveResult"]:
+        if not self.check():
+            return None
+
+        limited = self.budget.conflicts is not None or self.budget.restarts is not None
+        if limited:
+            ctl.configuration.solve.solve_limit = "{},{}".format(
+                _left(self.conflicts, self.budget.conflicts),
+                _left(self.restarts, self.budget.restarts),
+            )
+
+        if self.deadline is None:
+            result = ctl.solve(assumptions, on_model=on_model)
+        else:
+            with ctl.solve(assumptions, on_model=on_model, async_=True) as handle:
+                if not handle.wait(self.remaining_time()):
+                    handle.cancel()
+                    self.exhausted = TIME
+                    return None
+                result = handle.get()
+
+        statistics = ctl.statistics["solving"]["solvers"]
+        self.conflicts += int(statistics["conflicts"])
+        self.restarts += int(statistics["restarts"])
+        if limited and result.unknown:
+            self.exhausted = CONFLICTS
+            if not _spent(self.conflicts, self.budget.conflicts):
+                self.exhausted = RESTARTS
+            return None
+
+        return result
+
+
+def _spent(used: int, budget: Optional[int]) -> bool:
+    return budget is not None and used >= budget
+
+
+def _left(used: int, budget: Optional[int]) -> str:
+    return "umax" if budget is None else str(budget - used)
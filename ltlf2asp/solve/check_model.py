@@ -1,8 +1,11 @@
-from typing import Tuple, Iterable
+from typing import Tuple
 
 import clingo  # type: ignore
+from ltlf2asp.parser.reify_as_atoms import FormulaFacts, add_facts
 from ltlf2asp.solve.decode_model import State
 from ltlf2asp.solve import CHECK
+from ltlf2asp.solve.asynchronous import ground_async, solve_async
+from ltlf2asp.solve.configuration import DEFAULT, SolverConfiguration
 
 
 def trace_2(t: int, value: str, positive: bool) -> clingo.Symbol:
@@ -13,14 +16,14 @@ def time_1(t: int) -> clingo.Symbol:
     return clingo.Function("time", [clingo.Number(t)])
 
 
-def check_trace(trace: Tuple[State, ...], formula: Iterable[clingo.Symbol]) -> bool:
-    ctl = clingo.Control()
+def _control(
+    trace: Tuple[State, ...], formula: FormulaFacts, configuration: SolverConfiguration
+) -> clingo.Control:
+    ctl = clingo.Control(configuration.arguments())
     ctl.load(CHECK)
 
     with ctl.backend() as be:
-        for x in formula:
-            lit = be.add_atom(x)
-            be.add_rule([lit], [])
+        add_facts(be, formula)
 
         for t, state in enumerate(trace):
             lit = be.add_atom(time_1(t))
@@ -30,7 +33,28 @@ def check_trace(trace: Tuple[State, ...], formula: Iterable[clingo.Symbol]) -> b
                 lit = be.add_atom(trace_2(t, p, val))
                 be.add_rule([lit], [])
 
+    return ctl
+
+
+def check_trace(
+    trace: Tuple[State, ...],
+    formula: FormulaFacts,
+    configuration: SolverConfiguration = DEFAULT,
+) -> bool:
+    ctl = _control(trace, formula, configuration)
     ctl.ground([("base", [])])
     ans = ctl.solve()
 
     return not (ans.satisfiable is None or not ans.satisfiable)
+
+
+async def check_trace_async(
+    trace: Tuple[State, ...],
+    formula: FormulaFacts,
+    configuration: SolverConfiguration = DEFAULT,
+) -> bool:
+    ctl = _control(trace, formula, configuration)
+    await ground_async(ctl, [("base", [])])
+    ans = await solve_async(ctl, lambda _: True)
+
+    return not (ans.satisfiable is None or not ans.satisfiable)
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+# clasp's --parallel-mode: threads race on the whole problem, or split the
+# search space among themselves.
+MODES = ("compete", "split")
+
+# clasp's --configuration presets.
+PRESETS = ("auto", "frumpy", "jumpy", "tweety", "handy", "crafty", "trendy", "many")
+
+
+@dataclass(frozen=True)
+class SolverConfiguration:
+    """Search options of the clingo Controls created by the solvers."""
+
+    threads: int = 1
+    mode: str = "compete"
+    preset: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.threads <= 0:
+            raise ValueError("Thread count must be a positive integer.")
+
+        if self.mode not in MODES:
+            raise ValueError("Unknown parallel mode: {}".format(self.mode))
+
+        if self.preset is not None and self.preset not in PRESETS:
+            raise ValueError("Unknown configuration: {}".format(self.preset))
+
+    def arguments(self) -> List[str]:
+        args = []
+        if self.threads > 1:
+            args.append("--parallel-mode={},{}".format(self.threads, self.mode))
+        if self.preset is not None:
+            args.append("--configuration={}".format(self.preset))
+        return args
+
+
+DEFAULT = SolverConfiguration()
@@ -17,6 +17,10 @@ class SolveResult:
     status: SolveStatus
     k: int
     model: Optional["Model"]
+    # The solver that found the result, when several ran (see portfolio.py)
+    engine: Optional[str] = None
+    # The budget that ran out, for UNKNOWN results (see budget.py)
+    exhausted: Optional[str] = None
 
     def __str__(self) -> str:
         return "{}[{}]".format(self.status.value, self.k)
@@ -32,6 +36,10 @@ class SolveResult:
             or self.status == SolveStatus.UNKNOWN
         ):
             unsat_json = {"result": self.status, "k": self.k}
+            if self.engine is not None:
+                unsat_json["engine"] = self.engine
+            if self.exhausted is not None:
+                unsat_json["exhausted"] = self.exhausted
 
             return json.dumps(unsat_json, indent=4)
 
@@ -47,6 +55,8 @@ class SolveResult:
                 ],
             },
         }
+        if self.engine is not None:
+            sat_json["engine"] = self.engine
         return json.dumps(sat_json, indent=4)
 
 
@@ -62,20 +72,28 @@ class State:
             yield x, y
 
     @staticmethod
-    def from_clingo_model(model: clingo.Model) -> Tuple["State", ...]:
+    def from_clingo_model(
+        model: clingo.Model, horizon: Optional[int] = None
+    ) -> Tuple["State", ...]:
+        # With a horizon, atoms are tagged with it as in solve_horizons.lp.
+        tag = () if horizon is None else (clingo.Number(horizon),)
         trace_dict: Dict[int, Dict[str, bool]] = defaultdict(dict)
         last_instant = None
-        for x in model.context.symbolic_atoms.by_signature("last_state", 1):
-            if model.contains(x.symbol):
-                last_instant = x.symbol.arguments[0].number
+        symbolic_atoms = model.context.symbolic_atoms
+        for x in symbolic_atoms.by_signature("last_state", 1 + len(tag)):
+            if model.contains(x.symbol) and tuple(x.symbol.arguments[:-1]) == tag:
+                last_instant = x.symbol.arguments[-1].number
 
-        for x in model.context.symbolic_atoms.by_signature("trace", 2):
+        for x in symbolic_atoms.by_signature("trace", 2 + len(tag)):
             symbol = x.symbol
-            t = symbol.arguments[0].number
+            if tuple(symbol.arguments[:-2]) != tag:
+                continue
+
+            t = symbol.arguments[-2].number
             if t > last_instant:
                 continue
 
-            a = symbol.arguments[1].string
+            a = symbol.arguments[-1].string
             trace_dict[t][a] = model.contains(symbol)
 
         return tuple(State(trace_dict[i]) for i in range(len(trace_dict)))
@@ -0,0 +1,154 @@
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+
+from ltlf2asp.parser.syntax import (
+    Conjunction,
+    Disjunction,
+    Faux,
+    Formula,
+    Next,
+    Proposition,
+    NegativeProposition,
+    Release,
+    Truth,
+    Until,
+    WeakNext,
+)
+from ltlf2asp.solve.budget import UNLIMITED, Budget
+from ltlf2asp.solve.decode_model import Model, SolveResult, SolveStatus, State
+
+# A tableau state is the set of NNF formulas that must hold at an instant.
+# Expanding it yields elementary branches: the literals of the instant, the
+# formulas that must hold at the next one, and whether a next instant must
+# exist (a strong next, or a postponed until).
+Step = Tuple[Dict[str, bool], FrozenSet[Formula], bool]
+
+
+class _Branch:
+    def __init__(
+        self,
+        todo: List[Formula],
+        seen: Optional[Set[Formula]] = None,
+        literals: Optional[Dict[str, bool]] = None,
+        nexts: Optional[Set[Formula]] = None,
+        strong: bool = False,
+    ) -> None:
+        self.todo = todo
+        self.seen = seen or set()
+        self.literals = literals or dict()
+        self.nexts = nexts or set()
+        self.strong = strong
+
+    def fork(self, *fs: Formula) -> "_Branch":
+        return _Branch(
+            [*self.todo, *fs],
+            set(self.seen),
+            dict(self.literals),
+            set(self.nexts),
+            self.strong,
+        )
+
+    def expand(self, branches: List["_Branch"]) -> bool:
+        # Saturates the branch, pushing the alternatives of each choice to
+        # `branches`. False if the branch closes.
+        while len(self.todo) > 0:
+            f = self.todo.pop()
+            if f in self.seen:
+                continue
+            self.seen.add(f)
+
+            if isinstance(f, (Proposition, NegativeProposition)):
+                positive = isinstance(f, Proposition)
+                if self.literals.setdefault(f.value, positive) != positive:
+                    return False
+            elif isinstance(f, Conjunction):
+                self.todo.extend(f.fs)
+            elif isinstance(f, Disjunction):
+                # A branch with more obligations than this one adds no model.
+                if any(g in self.seen for g in f.fs):
+                    continue
+                branches.extend(self.fork(g) for g in reversed(f.fs[1:]))
+                self.todo.append(f.fs[0])
+            elif isinstance(f, Until):
+                if f.rhs in self.seen:
+                    continue
+                # Fulfilled now, or postponed to a next instant.
+                postponed = self.fork(f.lhs)
+                postponed.nexts.add(f)
+                postponed.strong = True
+                branches.append(postponed)
+                self.todo.append(f.rhs)
+            elif isinstance(f, Release):
+                if f.lhs in self.seen and f.rhs in self.seen:
+                    continue
+                # Released now, or carried over if there is a next instant.
+                carried = self.fork(f.rhs)
+                carried.nexts.add(f)
+                branches.append(carried)
+                self.todo.extend((f.lhs, f.rhs))
+            elif isinstance(f, Next):
+                self.nexts.add(f.f)
+                self.strong = True
+            elif isinstance(f, WeakNext):
+                self.nexts.add(f.f)
+            elif isinstance(f, Faux):
+                return False
+            elif not isinstance(f, Truth):
+                raise ValueError("Not in negation normal form: {}".format(f))
+
+        return True
+
+
+def expand(state: FrozenSet[Formula]) -> Iterator[Step]:
+    """The elementary branches of `state`, lazily and depth-first."""
+    branches = [_Branch(list(state))]
+    while len(branches) > 0:
+        branch = branches.pop()
+        if branch.expand(branches):
+            yield branch.literals, frozenset(branch.nexts), branch.strong
+
+
+def solve(f: Formula, budget: Budget = UNLIMITED) -> SolveResult:
+    """Decide `f` with an explicit-state one-pass tableau, without a depth
+    bound: the formula is satisfiable iff a branch reaches an instant with no
+    strong obligation for a next one. Tableau states are memoized, so each is
+    expanded at most once. A satisfiable formula comes with the trace of the
+    branch, k being its length; otherwise k is the deepest branch explored.
+    Only the time of the budget applies."""
+    spending = budget.start()
+    propositions = sorted(f.propositions())
+    root = frozenset((f.to_nnf(),))
+
+    visited = {root}
+    stack = [expand(root)]
+    # The literals of the instants leading to the top of the stack.
+    trace: List[Dict[str, bool]] = []
+    k = 1
+    while len(stack) > 0:
+        if not spending.check():
+            return SolveResult(
+                SolveStatus.UNKNOWN, k, None, exhausted=spending.exhausted
+            )
+
+        step = next(stack[-1], None)
+        if step is None:
+            stack.pop()
+            if len(trace) > 0:
+                trace.pop()
+            continue
+
+        literals, nexts, strong = step
+        if not strong:
+            trace.append(literals)
+            model = Model(
+                tuple(State({p: x.get(p, False) for p in propositions}) for x in trace)
+            )
+            return SolveResult(SolveStatus.SATISFIABLE, len(trace), model)
+
+        if nexts in visited:
+            continue
+        visited.add(nexts)
+        trace.append(literals)
+        stack.append(expand(nexts))
+        k = max(k, len(stack))
+
+    return SolveResult(SolveStatus.UNSATISFIABLE, k, None)
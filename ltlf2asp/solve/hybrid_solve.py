@@ -1,28 +1,241 @@
-from typing import Iterable
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
 
-import clingo
+import clingo  # type: ignore
 
+from ltlf2asp.parser.reify_as_atoms import FormulaFacts
 from ltlf2asp.solve.decode_model import SolveResult, SolveStatus
 from ltlf2asp.solve.static_solve_loop import _solve as search_model_in_segment
-from ltlf2asp.solve.tableaux import Reynolds
+from ltlf2asp.solve.static_solve_loop import _solve_async
+from ltlf2asp.solve.static_solve_loop import _control as segment_control
+from ltlf2asp.solve.static_solve_loop import _search as search_model
+from ltlf2asp.solve.budget import UNLIMITED, Budget, Spending
+from ltlf2asp.solve.configuration import DEFAULT, SolverConfiguration
+from ltlf2asp.solve.schedule import Geometric, Schedule
+from ltlf2asp.solve.tableaux import ReynoldsIncremental
+
+# Doubling from 8, as the tableaux is too costly to run at every short depth.
+HYBRID_DOUBLING = Geometric(2, 8)
+
+# The tableaux refutes some satisfiable formulas: it is not run below this
+# depth, and its answer at depth d is only trusted once the model search has
+# refuted every horizon up to d.
+MIN_TABLEAUX_DEPTH = 8
 
 
 def solve(
-    f: Iterable[clingo.Symbol], g: Iterable[clingo.Symbol], max_horizon: int
+    f: FormulaFacts,
+    g: FormulaFacts,
+    max_horizon: int,
+    schedule: Schedule = HYBRID_DOUBLING,
+    configuration: SolverConfiguration = DEFAULT,
+    budget: Budget = UNLIMITED,
 ) -> SolveResult:
-    tableaux = Reynolds(False)
+    tableaux = ReynoldsIncremental(False, configuration)
+    spending = budget.start()
 
-    a, b = 0, 8
-    while b <= max_horizon:
-        model = search_model_in_segment(f, a, b)
+    k = 0
+    for a, b in schedule.segments(max_horizon):
+        model = search_model_in_segment(f, a, b, configuration, spending)
 
         if model is not None:
             return SolveResult(SolveStatus.SATISFIABLE, b, model)
 
-        ans = tableaux.solve(g, b)
+        if b >= MIN_TABLEAUX_DEPTH:
+            ans = tableaux.solve(g, b, spending)
+            if ans.unsatisfiable:
+                return SolveResult(SolveStatus.UNSATISFIABLE, b, None)
+        if spending.exhausted is not None:
+            return SolveResult(
+                SolveStatus.UNKNOWN, k, None, exhausted=spending.exhausted
+            )
+
+        k = b
+
+    return SolveResult(SolveStatus.UNKNOWN, k, None)
+
+
+async def solve_async(
+    f: FormulaFacts,
+    g: FormulaFacts,
+    max_horizon: int,
+    schedule: Schedule = HYBRID_DOUBLING,
+    configuration: SolverConfiguration = DEFAULT,
+) -> SolveResult:
+    tableaux = ReynoldsIncremental(False, configuration)
+
+    k = 0
+    for a, b in schedule.segments(max_horizon):
+        model = await _solve_async(f, a, b, configuration)
+
+        if model is not None:
+            return SolveResult(SolveStatus.SATISFIABLE, b, model)
+
+        if b >= MIN_TABLEAUX_DEPTH:
+            ans = await tableaux.solve_async(g, b)
+            if ans.unsatisfiable:
+                return SolveResult(SolveStatus.UNSATISFIABLE, b, None)
+
+        k = b
+
+    return SolveResult(SolveStatus.UNKNOWN, k, None)
+
+
+class _Race:
+    """Shared by the two sides of `solve_concurrent`. The first conclusive
+    side sets the result and interrupts the Controls in use by the other.
+    The model search publishes the deepest horizon it refuted: a refutation
+    of the tableaux waits for it (see `confirm`)."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+        self.over = False
+        self.result: Optional[SolveResult] = None
+        self.controls: List[clingo.Control] = []
+        self.refuted = 0
+        self.searching = True
+
+    @contextmanager
+    def running(self, ctl: clingo.Control) -> Iterator[None]:
+        with self.lock:
+            self.controls.append(ctl)
+            # An interrupt before solving cancels the next solve call.
+            if self.over:
+                ctl.interrupt()
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.controls.remove(ctl)
+
+    def finish(self, result: Optional[SolveResult]) -> None:
+        with self.lock:
+            if self.over:
+                return
+            self.over = True
+            self.result = result
+            for ctl in self.controls:
+                ctl.interrupt()
+            self.changed.notify_all()
+
+    def refute(self, k: int) -> None:
+        with self.lock:
+            self.refuted = k
+            self.changed.notify_all()
+
+    def stop_searching(self) -> None:
+        with self.lock:
+            self.searching = False
+            self.changed.notify_all()
+
+    def confirm(self, depth: int) -> bool:
+        # Wait until the model search refuted every horizon up to `depth`.
+        # False if the race ends, or the search stops, before that.
+        with self.lock:
+            while not self.over and self.searching and self.refuted < depth:
+                self.changed.wait()
+            return not self.over and self.refuted >= depth
+
+
+def _search_models(
+    race: _Race,
+    f: FormulaFacts,
+    max_horizon: int,
+    schedule: Schedule,
+    configuration: SolverConfiguration,
+    spending: Spending,
+) -> int:
+    # Returns the deepest horizon without models.
+    k = 0
+    for a, b in schedule.segments(max_horizon):
+        if race.over:
+            break
+
+        ctl = segment_control(f, a, b, configuration)
+        with race.running(ctl):
+            model = search_model(ctl, spending)
+
+        if model is not None:
+            race.finish(SolveResult(SolveStatus.SATISFIABLE, b, model))
+            break
+        # An interrupted search did not refute the segment.
+        if race.over or spending.exhausted is not None:
+            break
+
+        k = b
+        race.refute(k)
+
+    return k
+
+
+def _refute(
+    race: _Race,
+    g: FormulaFacts,
+    max_horizon: int,
+    schedule: Schedule,
+    configuration: SolverConfiguration,
+    spending: Spending,
+) -> None:
+    tableaux = ReynoldsIncremental(False, configuration)
+    for _, b in schedule.segments(max_horizon):
+        if race.over or spending.exhausted is not None:
+            return
+        if b < MIN_TABLEAUX_DEPTH:
+            continue
+
+        ctl = tableaux.control(g, b)
+        with race.running(ctl):
+            ans = tableaux.search(ctl, b, spending)
+
         if ans.unsatisfiable:
-            return SolveResult(SolveStatus.UNSATISFIABLE, b, None)
+            if race.confirm(b):
+                race.finish(SolveResult(SolveStatus.UNSATISFIABLE, b, None))
+            return
+
+
+def solve_concurrent(
+    f: FormulaFacts,
+    g: FormulaFacts,
+    max_horizon: int,
+    schedule: Schedule = HYBRID_DOUBLING,
+    configuration: SolverConfiguration = DEFAULT,
+    budget: Budget = UNLIMITED,
+) -> SolveResult:
+    """As `solve`, but the model search and the tableaux run side by side, in
+    this thread and in a worker thread (clingo releases the GIL while
+    grounding and solving), each deepening along `schedule` on its own. The
+    first conclusive side interrupts the other.
+
+    As in `solve`, a refutation of the tableaux at depth d only ends the race
+    once the model search has refuted every horizon up to d."""
+    race = _Race()
+    spending = budget.start()
+    failure: List[BaseException] = []
+
+    def refute() -> None:
+        try:
+            _refute(race, g, max_horizon, schedule, configuration, spending)
+        except BaseException as e:
+            failure.append(e)
+            race.finish(None)
 
-        a, b = b, b * 2
+    worker = threading.Thread(target=refute, daemon=True)
+    worker.start()
+    try:
+        k = _search_models(race, f, max_horizon, schedule, configuration, spending)
+    except BaseException:
+        race.finish(None)
+        raise
+    finally:
+        race.stop_searching()
+        # Grounding cannot be interrupted: the tableaux may take a while to
+        # notice the end of the race.
+        worker.join()
 
-    return SolveResult(SolveStatus.UNKNOWN, a, None)
+    if len(failure) > 0:
+        raise failure[0]
+    if race.result is not None:
+        return race.result
+    return SolveResult(SolveStatus.UNKNOWN, k, None, exhausted=spending.exhausted)
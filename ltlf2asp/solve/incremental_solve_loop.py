@@ -1,7 +1,12 @@
-from typing import Optional, Tuple, List, Iterable
+from typing import Optional, Tuple, List
 import clingo  # type: ignore
+from ltlf2asp.parser.reify_as_atoms import FormulaFacts, add_facts
 from ltlf2asp.solve.decode_model import State, SolveResult, SolveStatus, Model
 from ltlf2asp.solve import SOLVE_INCREMENTAL
+from ltlf2asp.solve.asynchronous import ground_async, solve_async as search_async
+from ltlf2asp.solve.budget import UNLIMITED, Budget
+from ltlf2asp.solve.configuration import DEFAULT, SolverConfiguration
+from ltlf2asp.solve.schedule import DOUBLING, Schedule
 
 
 class Catch:
@@ -17,22 +22,34 @@ class Catch:
         return self.states
 
 
-def solve(f: Iterable[clingo.Symbol], max_horizon: int) -> SolveResult:
-    a, b = 0, 1
-    ctl = clingo.Control()
+def _control(f: FormulaFacts, configuration: SolverConfiguration) -> clingo.Control:
+    ctl = clingo.Control(configuration.arguments())
 
     with ctl.backend() as be:
-        for symbol in f:
-            be.add_rule([be.add_atom(symbol)], [])
+        add_facts(be, f)
 
     ctl.load(SOLVE_INCREMENTAL)
+    return ctl
+
+
+def solve(
+    f: FormulaFacts,
+    max_horizon: int,
+    schedule: Schedule = DOUBLING,
+    configuration: SolverConfiguration = DEFAULT,
+    budget: Budget = UNLIMITED,
+) -> SolveResult:
+    spending = budget.start()
+    k = 0
+    ctl = _control(f, configuration)
     parts: List[Tuple[str, List[clingo.Symbol]]] = [("base", []), ("formula", [])]
-    while b <= max_horizon:
+    for a, b in schedule.segments(max_horizon):
         for t in range(a, b):
             parts.append(("semantics", [clingo.Number(t)]))
         parts.append(("search", [clingo.Number(a), clingo.Number(b)]))
         # Ground
-        ctl.ground(parts)
+        if not spending.ground(ctl, parts):
+            break
         parts.clear()
 
         # Set the valid segment to search for the last timepoint
@@ -41,13 +58,49 @@ def solve(f: Iterable[clingo.Symbol], max_horizon: int) -> SolveResult:
 
         # Search, eventually capture model
         trace_cb = Catch()
-        ans = ctl.solve(on_model=trace_cb)
+        ans = spending.solve(ctl, trace_cb)
+        if ans is None:
+            break
+
+        if ans.satisfiable:
+            model = Model(trace_cb.get())
+            return SolveResult(SolveStatus.SATISFIABLE, b, model)
+
+        ctl.assign_external(search, False)
+        k = b
+
+    return SolveResult(SolveStatus.UNKNOWN, k, None, exhausted=spending.exhausted)
+
+
+async def solve_async(
+    f: FormulaFacts,
+    max_horizon: int,
+    schedule: Schedule = DOUBLING,
+    configuration: SolverConfiguration = DEFAULT,
+) -> SolveResult:
+    k = 0
+    ctl = _control(f, configuration)
+    parts: List[Tuple[str, List[clingo.Symbol]]] = [("base", []), ("formula", [])]
+    for a, b in schedule.segments(max_horizon):
+        # A segment is grounded in one call, as the externals of a time point
+        # are defined by the parts of the next ones.
+        for t in range(a, b):
+            parts.append(("semantics", [clingo.Number(t)]))
+        parts.append(("search", [clingo.Number(a), clingo.Number(b)]))
+        await ground_async(ctl, parts)
+        parts = []
+
+        search = clingo.Function("search", [clingo.Number(a), clingo.Number(b)])
+        ctl.assign_external(search, True)
+
+        trace_cb = Catch()
+        ans = await search_async(ctl, trace_cb)
 
         if ans.satisfiable:
             model = Model(trace_cb.get())
             return SolveResult(SolveStatus.SATISFIABLE, b, model)
 
         ctl.assign_external(search, False)
-        a, b = b, 2 * b
+        k = b
 
-    return SolveResult(SolveStatus.UNKNOWN, a, None)
+    return SolveResult(SolveStatus.UNKNOWN, k, None)
@@ -0,0 +1,182 @@
+import multiprocessing
+from dataclasses import replace
+from functools import partial
+from multiprocessing.connection import Connection, wait
+from typing import Callable, Dict, List, Optional, Sequence
+
+# Solvers are imported before forking, not by each engine process.
+from ltlf2asp.parser import reify_as_object, reify_into_backend  # noqa: F401
+from ltlf2asp.parser.reify_as_arrays import FormulaArrays
+from ltlf2asp.parser.syntax import FormulaContext, tableaux_reify
+from ltlf2asp.solve import incremental_solve_loop, static_solve_loop
+from ltlf2asp.solve.configuration import DEFAULT, SolverConfiguration
+from ltlf2asp.solve.decode_model import SolveResult, SolveStatus
+from ltlf2asp.solve.hybrid_solve import MIN_TABLEAUX_DEPTH
+from ltlf2asp.solve.schedule import DOUBLING, Schedule
+from ltlf2asp.solve.tableaux import ReynoldsIncremental
+
+STATIC = "static"
+INCREMENTAL = "incremental"
+REYNOLDS = "reynolds"
+ENGINES = (STATIC, INCREMENTAL, REYNOLDS)
+
+
+def _static(
+    f: FormulaArrays,
+    max_horizon: int,
+    schedule: Schedule,
+    native: bool,
+    configuration: SolverConfiguration,
+) -> SolveResult:
+    facts = f.to_facts(native)
+    return static_solve_loop.solve(facts, max_horizon, schedule, configuration)
+
+
+def _incremental(
+    f: FormulaArrays,
+    max_horizon: int,
+    schedule: Schedule,
+    native: bool,
+    configuration: SolverConfiguration,
+) -> SolveResult:
+    facts = partial(f.to_backend, native=native)
+    return incremental_solve_loop.solve(facts, max_horizon, schedule, configuration)
+
+
+def _reynolds(
+    f: FormulaArrays,
+    max_horizon: int,
+    schedule: Schedule,
+    native: bool,
+    configuration: SolverConfiguration,
+) -> SolveResult:
+    # As in hybrid_solve: the tableaux is deepened along the schedule, in one
+    # Control, from MIN_TABLEAUX_DEPTH. It proves no SAT: without a model,
+    # that is UNKNOWN.
+    facts = tableaux_reify(f.to_formula(FormulaContext()))
+    tableaux = ReynoldsIncremental(False, configuration)
+    k = 0
+    for _, b in schedule.segments(max_horizon):
+        if b < MIN_TABLEAUX_DEPTH:
+            continue
+
+        k = b
+        ans = tableaux.solve(facts, k)
+        if ans.unsatisfiable:
+            return SolveResult(SolveStatus.UNSATISFIABLE, k, None)
+        if not ans.unknown:
+            break
+
+    return SolveResult(SolveStatus.UNKNOWN, k, None)
+
+
+Engine = Callable[
+    [FormulaArrays, int, Schedule, bool, SolverConfiguration], SolveResult
+]
+
+SOLVERS: Dict[str, Engine] = {
+    STATIC: _static,
+    INCREMENTAL: _incremental,
+    REYNOLDS: _reynolds,
+}
+
+
+def _run(
+    out: Connection,
+    engine: str,
+    f: FormulaArrays,
+    max_horizon: int,
+    schedule: Schedule,
+    native: bool,
+    configuration: SolverConfiguration,
+) -> None:
+    try:
+        result = SOLVERS[engine](f, max_horizon, schedule, native, configuration)
+        out.send(replace(result, engine=engine))
+    except Exception as e:
+        out.send(e)
+    finally:
+        out.close()
+
+
+def is_definitive(result: SolveResult, refuted: int) -> bool:
+    # A satisfiable tableaux comes without a model: only the ASP loops are
+    # trusted for SAT. The tableaux refutes some satisfiable formulas, and is
+    # only trusted at depth d once an ASP loop has refuted every horizon up
+    # to d (`refuted`).
+    if result.status == SolveStatus.SATISFIABLE:
+        return result.model is not None
+    return result.status == SolveStatus.UNSATISFIABLE and result.k <= refuted
+
+
+def solve(
+    f: FormulaArrays,
+    max_horizon: int,
+    schedule: Schedule = DOUBLING,
+    native: bool = False,
+    engines: Sequence[str] = ENGINES,
+    configuration: SolverConfiguration = DEFAULT,
+) -> SolveResult:
+    """Race `engines`, each in its own process, and return the first
+    definitive answer: SAT with a model, or UNSAT (held until confirmed, see
+    is_definitive). The other processes are killed. If no engine is conclusive, the answer of the engine that went
+    the deepest is returned. An engine failing does not stop the others: its
+    exception is raised only if no engine answers."""
+    context = multiprocessing.get_context()
+    f = f.detach()
+
+    processes: Dict[Connection, multiprocessing.process.BaseProcess] = {}
+    try:
+        for engine in engines:
+            reader, writer = context.Pipe(duplex=False)
+            process = context.Process(
+                target=_run,
+                args=(writer, engine, f, max_horizon, schedule, native, configuration),
+                daemon=True,
+            )
+            process.start()
+            writer.close()
+            processes[reader] = process
+
+        best: Optional[SolveResult] = None
+        failure: Optional[Exception] = None
+        # Refutations of the tableaux waiting for the ASP loops, and the
+        # deepest horizon these refuted.
+        held: List[SolveResult] = []
+        refuted = 0
+        pending = list(processes)
+        while len(pending) > 0:
+            for reader in wait(pending):
+                pending.remove(reader)  # type: ignore
+                try:
+                    result = reader.recv()  # type: ignore
+                except EOFError:
+                    # The process died without an answer (e.g. out of memory).
+                    continue
+
+                if isinstance(result, Exception):
+                    failure = failure or result
+                    continue
+                if result.status == SolveStatus.UNSATISFIABLE:
+                    held.append(result)
+                    result = replace(result, status=SolveStatus.UNKNOWN)
+                elif result.engine != REYNOLDS:
+                    refuted = max(refuted, result.k)
+
+                for x in (result, *held):
+                    if is_definitive(x, refuted):
+                        return x
+                if best is None or result.k > best.k:
+                    best = result
+
+        if best is None and failure is not None:
+            raise failure
+        if best is None:
+            raise RuntimeError("No engine of the portfolio answered.")
+        return best
+
+    finally:
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+            process.join()
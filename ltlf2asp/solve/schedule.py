@@ -0,0 +1,124 @@
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from itertools import count
+from typing import Iterator, Optional, Tuple
+
+
+class Schedule(ABC):
+    """The horizons tried by a solve loop: an increasing sequence of bounds
+    b_1 < b_2 < ..., where segment [b_i, b_{i+1}) holds the candidate last
+    states searched at step i+1."""
+
+    @abstractmethod
+    def bounds(self) -> Iterator[int]:
+        pass
+
+    def segments(self, max_horizon: int) -> Iterator[Tuple[int, int]]:
+        """Segments [a, b) with b <= max_horizon, starting at a = 0."""
+        a = 0
+        for b in self.bounds():
+            if b <= a:
+                raise ValueError("Schedule bounds must be increasing: {}".format(self))
+            if b > max_horizon:
+                return
+            yield a, b
+            a = b
+
+
+@dataclass(frozen=True)
+class Linear(Schedule):
+    step: int = 1
+    start: int = 1
+
+    def bounds(self) -> Iterator[int]:
+        return count(self.start, self.step)
+
+
+@dataclass(frozen=True)
+class Geometric(Schedule):
+    factor: float = 2.0
+    start: int = 1
+
+    def bounds(self) -> Iterator[int]:
+        b = self.start
+        while True:
+            yield b
+            b = max(b + 1, math.ceil(b * self.factor))
+
+
+@dataclass(frozen=True)
+class Luby(Schedule):
+    """Segments whose lengths follow the Luby sequence 1 1 2 1 1 2 4 ...,
+    scaled by unit: short segments keep coming back between long ones."""
+
+    unit: int = 1
+
+    def bounds(self) -> Iterator[int]:
+        b = 0
+        for i in count(1):
+            b += self.unit * luby(i)
+            yield b
+
+
+@dataclass(frozen=True)
+class Explicit(Schedule):
+    horizons: Tuple[int, ...]
+
+    def bounds(self) -> Iterator[int]:
+        return iter(self.horizons)
+
+
+def luby(i: int) -> int:
+    # The i-th element of the Luby sequence, i >= 1.
+    k = i.bit_length()
+    while i != (1 << k) - 1:
+        i -= (1 << (k - 1)) - 1
+        k = i.bit_length()
+    return 1 << (k - 1)
+
+
+DOUBLING = Geometric(2, 1)
+
+SCHEDULES = ("doubling", "linear", "geometric", "luby", "list")
+
+
+def _is_increasing(schedule: Schedule) -> bool:
+    # Whether the bounds of a schedule read from the CLI are positive and
+    # increasing, as segments() requires.
+    if isinstance(schedule, Linear):
+        return schedule.step > 0 and schedule.start > 0
+    elif isinstance(schedule, Geometric):
+        return schedule.factor > 1 and schedule.start > 0
+    elif isinstance(schedule, Luby):
+        return schedule.unit > 0
+    elif isinstance(schedule, Explicit):
+        bounds = (0, *schedule.horizons)
+        return all(a < b for a, b in zip(bounds, bounds[1:]))
+    return True
+
+
+def parse_schedule(spec: str) -> Schedule:
+    """Read a schedule from the CLI: `doubling`, `linear[:step]`,
+    `geometric[:factor]`, `luby[:unit]` or `list:b1,b2,...`."""
+    name, _, argument = spec.partition(":")
+    schedule: Optional[Schedule] = None
+    try:
+        if name == "doubling" and argument == "":
+            schedule = DOUBLING
+        elif name == "linear":
+            schedule = Linear(int(argument or 1), int(argument or 1))
+        elif name == "geometric":
+            schedule = Geometric(float(argument or 2))
+        elif name == "luby":
+            schedule = Luby(int(argument or 1))
+        elif name == "list" and argument != "":
+            schedule = Explicit(tuple(int(x) for x in argument.split(",")))
+    except ValueError:
+        pass
+
+    if schedule is None:
+        raise ValueError("Unknown schedule: {}".format(spec))
+    if not _is_increasing(schedule):
+        raise ValueError("Schedule bounds must be increasing: {}".format(spec))
+    return schedule
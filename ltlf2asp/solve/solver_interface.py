@@ -1,18 +1,84 @@
-from typing import Iterable
-
+from ltlf2asp.parser.reify_as_atoms import FormulaFacts
 from ltlf2asp.solve.decode_model import SolveResult
-from ltlf2asp.solve.incremental_solve_loop import solve as solve_incremental
-from ltlf2asp.solve.static_solve_loop import solve as solve_static
-import clingo  # type: ignore
+from ltlf2asp.solve.budget import UNLIMITED, Budget
+from ltlf2asp.solve.configuration import DEFAULT, SolverConfiguration
+from ltlf2asp.solve.schedule import DOUBLING, Schedule
 
 
 class Solver:
-    def __init__(self, is_incremental: bool, max_horizon: int) -> None:
+    def __init__(
+        self,
+        is_incremental: bool,
+        max_horizon: int,
+        shared: bool = False,
+        schedule: Schedule = DOUBLING,
+        configuration: SolverConfiguration = DEFAULT,
+        budget: Budget = UNLIMITED,
+        automata: bool = False,
+    ) -> None:
         self.max_horizon = max_horizon
+        self.schedule = schedule
+        self.configuration = configuration
+        self.budget = budget
         self.is_incremental = is_incremental
+        # Static solving in a single Control, see static_solve_loop.solve_shared
+        self.shared = shared
+        # Progression automata instead of ASP, see automata.Automata: the
+        # horizon does not apply, and the automata are kept across calls.
+        self.automata = None
+        if automata:
+            from ltlf2asp.solve.automata import Automata
+
+            self.automata = Automata()
+
+    def solve_automata(self, f: FormulaFacts) -> SolveResult:
+        from ltlf2asp.parser.syntax import FormulaContext
+        from ltlf2asp.solve.automata import formula_from_facts
+
+        assert self.automata is not None
+        if callable(f):
+            raise ValueError("The automata backend needs the formula facts.")
+        formula = formula_from_facts(f, FormulaContext())
+        return self.automata.solve(formula, self.budget)
 
-    def solve(self, f: Iterable[clingo.Symbol]) -> SolveResult:
-        if self.is_incremental:
-            return solve_incremental(f, self.max_horizon)
+    def solve(self, f: FormulaFacts) -> SolveResult:
+        args = (f, self.max_horizon, self.schedule, self.configuration, self.budget)
+        # Only the solve loop in use is imported.
+        if self.automata is not None:
+            return self.solve_automata(f)
+        elif self.is_incremental:
+            from ltlf2asp.solve.incremental_solve_loop import solve
+
+            return solve(*args)
+        elif self.shared:
+            from ltlf2asp.solve.static_solve_loop import solve_shared
+
+            return solve_shared(*args)
         else:
-            return solve_static(f, self.max_horizon)
+            from ltlf2asp.solve.static_solve_loop import solve
+
+            return solve(*args)
+
+    async def solve_async(self, f: FormulaFacts) -> SolveResult:
+        """As `solve`, without blocking the event loop: cancelling the task
+        stops the solver. The budget is not applied, see asyncio.wait_for.
+        The automata backend runs in a worker thread, which cancelling does
+        not stop: its budget applies."""
+        args = (f, self.max_horizon, self.schedule, self.configuration)
+        if self.automata is not None:
+            import asyncio
+
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.solve_automata, f)
+        elif self.is_incremental:
+            from ltlf2asp.solve.incremental_solve_loop import solve_async
+
+            return await solve_async(*args)
+        elif self.shared:
+            from ltlf2asp.solve.static_solve_loop import solve_shared_async
+
+            return await solve_shared_async(*args)
+        else:
+            from ltlf2asp.solve.static_solve_loop import solve_async
+
+            return await solve_async(*args)
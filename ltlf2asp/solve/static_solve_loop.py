@@ -1,15 +1,21 @@
-from typing import Optional, Iterable, Tuple
+from typing import Optional, Tuple
 from ltlf2asp.solve.decode_model import Model, State, SolveResult, SolveStatus
 import clingo  # type: ignore
-from ltlf2asp.solve import SOLVE_STATIC
+from ltlf2asp.parser.reify_as_atoms import FormulaFacts, add_facts
+from ltlf2asp.solve import SOLVE_STATIC, SOLVE_HORIZONS
+from ltlf2asp.solve.asynchronous import ground_async, solve_async as search_async
+from ltlf2asp.solve.budget import UNLIMITED, Budget, Spending
+from ltlf2asp.solve.configuration import DEFAULT, SolverConfiguration
+from ltlf2asp.solve.schedule import DOUBLING, Schedule
 
 
 class Catch:
-    def __init__(self) -> None:
+    def __init__(self, horizon: Optional[int] = None) -> None:
+        self.horizon = horizon
         self.states: Optional[Tuple[State, ...]] = None
 
     def __call__(self, model: clingo.Model) -> bool:
-        self.states = State.from_clingo_model(model)
+        self.states = State.from_clingo_model(model, self.horizon)
         return False
 
     def get(self) -> Tuple[State, ...]:
@@ -17,31 +23,164 @@ class Catch:
         return self.states
 
 
-def _solve(f: Iterable[clingo.Symbol], a: int, b: int) -> Optional[Model]:
-    ctl = clingo.Control([f"-c a={a}", f"-c b={b}"])
+def _control(
+    f: FormulaFacts, a: int, b: int, configuration: SolverConfiguration
+) -> clingo.Control:
+    ctl = clingo.Control([f"-c a={a}", f"-c b={b}", *configuration.arguments()])
     with ctl.backend() as backend:
-        for symbol in f:
-            lit = backend.add_atom(symbol)
-            backend.add_rule([lit], [])
+        add_facts(backend, f)
 
     ctl.load(SOLVE_STATIC)
-    ctl.ground([("base", [])])
+    return ctl
+
+
+def _solve(
+    f: FormulaFacts,
+    a: int,
+    b: int,
+    configuration: SolverConfiguration = DEFAULT,
+    spending: Optional[Spending] = None,
+) -> Optional[Model]:
+    ctl = _control(f, a, b, configuration)
+    return _search(ctl, spending or UNLIMITED.start())
+
+
+def _search(ctl: clingo.Control, spending: Spending) -> Optional[Model]:
+    if not spending.ground(ctl, [("base", [])]):
+        return None
 
     trap = Catch()
-    ans = ctl.solve(on_model=trap)
+    ans = spending.solve(ctl, trap)
+    if ans is not None and ans.satisfiable:
+        return Model(trap.get())
+
+    return None
+
+
+async def _solve_async(
+    f: FormulaFacts, a: int, b: int, configuration: SolverConfiguration = DEFAULT
+) -> Optional[Model]:
+    ctl = _control(f, a, b, configuration)
+    await ground_async(ctl, [("base", [])])
+
+    trap = Catch()
+    ans = await search_async(ctl, trap)
     if ans.satisfiable:
         return Model(trap.get())
 
     return None
 
 
-def solve(f: Iterable[clingo.Symbol], max_horizon: int) -> SolveResult:
-    a, b = 0, 1
-    while b <= max_horizon:
-        model = _solve(f, a, b)
+def solve(
+    f: FormulaFacts,
+    max_horizon: int,
+    schedule: Schedule = DOUBLING,
+    configuration: SolverConfiguration = DEFAULT,
+    budget: Budget = UNLIMITED,
+) -> SolveResult:
+    spending = budget.start()
+    k = 0
+    for a, b in schedule.segments(max_horizon):
+        model = _solve(f, a, b, configuration, spending)
+        if model is not None:
+            return SolveResult(SolveStatus.SATISFIABLE, b, model)
+        if spending.exhausted is not None:
+            return SolveResult(
+                SolveStatus.UNKNOWN, k, None, exhausted=spending.exhausted
+            )
+
+        k = b
+
+    return SolveResult(SolveStatus.UNKNOWN, k, None)
+
+
+async def solve_async(
+    f: FormulaFacts,
+    max_horizon: int,
+    schedule: Schedule = DOUBLING,
+    configuration: SolverConfiguration = DEFAULT,
+) -> SolveResult:
+    k = 0
+    for a, b in schedule.segments(max_horizon):
+        model = await _solve_async(f, a, b, configuration)
         if model is not None:
             return SolveResult(SolveStatus.SATISFIABLE, b, model)
 
-        a, b = b, b * 2
+        k = b
+
+    return SolveResult(SolveStatus.UNKNOWN, k, None)
+
+
+def _shared_control(
+    f: FormulaFacts, configuration: SolverConfiguration
+) -> clingo.Control:
+    ctl = clingo.Control(configuration.arguments())
+    with ctl.backend() as backend:
+        add_facts(backend, f)
+
+    ctl.load(SOLVE_HORIZONS)
+    return ctl
+
+
+def solve_shared(
+    f: FormulaFacts,
+    max_horizon: int,
+    schedule: Schedule = DOUBLING,
+    configuration: SolverConfiguration = DEFAULT,
+    budget: Budget = UNLIMITED,
+) -> SolveResult:
+    """Same search as `solve`, in a single Control: the facts and the encoding
+    are loaded and grounded once, each horizon only grounds its own part.
+    Atoms carry the horizon as an extra argument, which makes each part
+    somewhat slower to ground: this pays off for small horizons."""
+    spending = budget.start()
+    ctl = _shared_control(f, configuration)
+    if not spending.ground(ctl, [("base", [])]):
+        return SolveResult(SolveStatus.UNKNOWN, 0, None, exhausted=spending.exhausted)
+
+    k = 0
+    for a, b in schedule.segments(max_horizon):
+        part = ("horizon", [clingo.Number(a), clingo.Number(b)])
+        if not spending.ground(ctl, [part]):
+            break
+        horizon = clingo.Function("horizon", [clingo.Number(b)])
+        ctl.assign_external(horizon, True)
+
+        trap = Catch(b)
+        ans = spending.solve(ctl, trap)
+        if ans is None:
+            break
+        if ans.satisfiable:
+            return SolveResult(SolveStatus.SATISFIABLE, b, Model(trap.get()))
+
+        # The part of this horizon is false from now on, clingo drops it.
+        ctl.release_external(horizon)
+        k = b
+
+    return SolveResult(SolveStatus.UNKNOWN, k, None, exhausted=spending.exhausted)
+
+
+async def solve_shared_async(
+    f: FormulaFacts,
+    max_horizon: int,
+    schedule: Schedule = DOUBLING,
+    configuration: SolverConfiguration = DEFAULT,
+) -> SolveResult:
+    ctl = _shared_control(f, configuration)
+    await ground_async(ctl, [("base", [])])
+
+    k = 0
+    for a, b in schedule.segments(max_horizon):
+        await ground_async(ctl, [("horizon", [clingo.Number(a), clingo.Number(b)])])
+        horizon = clingo.Function("horizon", [clingo.Number(b)])
+        ctl.assign_external(horizon, True)
+
+        trap = Catch(b)
+        ans = await search_async(ctl, trap)
+        if ans.satisfiable:
+            return SolveResult(SolveStatus.SATISFIABLE, b, Model(trap.get()))
+
+        ctl.release_external(horizon)
+        k = b
 
-    return SolveResult(SolveStatus.UNKNOWN, a, None)
+    return SolveResult(SolveStatus.UNKNOWN, k, None)
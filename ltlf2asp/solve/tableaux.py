@@ -1,15 +1,22 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Iterable
+from typing import List, Optional
 import clingo
-from ltlf2asp.solve import REYNOLDS
+from ltlf2asp.parser.reify_as_atoms import FormulaFacts, add_facts
+from ltlf2asp.solve import REYNOLDS, REYNOLDS_INCREMENTAL
+from ltlf2asp.solve.asynchronous import Parts, ground_async, solve_async
 import json
 from ltlf2asp.solve.decode_model import SolveStatus
+from ltlf2asp.solve.budget import UNLIMITED, Budget, Spending
+from ltlf2asp.solve.configuration import DEFAULT, SolverConfiguration
 
 
 @dataclass(frozen=True)
 class TableauxResult:
     k: int
     status: SolveStatus
+    # The budget that ran out, for UNKNOWN results (see budget.py)
+    exhausted: Optional[str] = None
 
     @property
     def satisfiable(self):
@@ -24,7 +31,19 @@ class TableauxResult:
         return self.status == SolveStatus.UNKNOWN
 
     def json(self):
-        return json.dumps({"max_depth": self.k, "result": self.status.value}, indent=2)
+        result = {"max_depth": self.k, "result": self.status.value}
+        if self.exhausted is not None:
+            result["exhausted"] = self.exhausted
+        return json.dumps(result, indent=2)
+
+
+def print_branch(model: clingo.Model) -> None:
+    print(" Branch #{} ".format(model.number).center(80, "%"))
+    sorted_symbols = sorted(
+        model.symbols(shown=True), key=lambda x: x.arguments[0].number
+    )
+    print("\n".join(str(x) for x in sorted_symbols))
+    print("".center(80, "%"))
 
 
 class Catch:
@@ -34,12 +53,7 @@ class Catch:
 
     def __call__(self, model: clingo.Model) -> bool:
         if self.verbose:
-            print(" Branch #{} ".format(model.number).center(80, "%"))
-            sorted_symbols = sorted(
-                model.symbols(shown=True), key=lambda x: x.arguments[0].number
-            )
-            print("\n".join(str(x) for x in sorted_symbols))
-            print("".center(80, "%"))
+            print_branch(model)
 
         if model.optimality_proven:
             if model.cost == [0]:
@@ -54,22 +68,191 @@ class Catch:
         return self.status_
 
 
+class FirstBranch:
+    def __init__(self, verbose) -> None:
+        self.verbose = verbose
+
+    def __call__(self, model: clingo.Model) -> bool:
+        if self.verbose:
+            print_branch(model)
+        return False
+
+
 class Reynolds:
-    def __init__(self, verbose: bool) -> None:
+    # Arity of result/N in the encoding.
+    result_arity = 1
+
+    def __init__(
+        self,
+        verbose: bool,
+        configuration: SolverConfiguration = DEFAULT,
+        budget: Budget = UNLIMITED,
+        targeted: bool = False,
+    ) -> None:
         self.verbose = verbose
+        self.configuration = configuration
+        self.budget = budget
+        # Ask for one branch at a time instead of enumerating optimal
+        # branches, see `decide`.
+        self.targeted = targeted
+
+    def arguments(self) -> List[str]:
+        if self.targeted:
+            search = ["--opt-mode=ignore", "--models=1"]
+        else:
+            search = ["--opt-mode=optN", "--models=0"]
+        return [*search, *self.configuration.arguments()]
 
-    def solve(self, f: Iterable[clingo.Symbol], depth: int) -> TableauxResult:
-        ctl = clingo.Control(
-            ["-c depth={}".format(depth), "--opt-mode=optN", "--models=0"]
-        )
+    def control(self, f: FormulaFacts, depth: int) -> clingo.Control:
+        ctl = clingo.Control(["-c depth={}".format(depth), *self.arguments()])
         ctl.load(REYNOLDS)
 
         with ctl.backend() as be:
-            for symbol in f:
-                be.add_rule([be.add_atom(symbol)], [])
+            add_facts(be, f)
+
+        return ctl
+
+    def solve(
+        self, f: FormulaFacts, depth: int, spending: Optional[Spending] = None
+    ) -> TableauxResult:
+        # By default the call has its own budget; the hybrid loop shares one.
+        ctl = self.control(f, depth)
+        return self.search(ctl, depth, spending or self.budget.start())
+
+    def search(
+        self, ctl: clingo.Control, depth: int, spending: Spending
+    ) -> TableauxResult:
+        status = SolveStatus.UNKNOWN
+        if spending.ground(ctl, [("base", [])]):
+            status = self.decide(ctl, spending)
+
+        if spending.exhausted is not None:
+            return TableauxResult(depth, SolveStatus.UNKNOWN, spending.exhausted)
+        return TableauxResult(depth, status)
+
+    def decide(self, ctl: clingo.Control, spending: Spending) -> SolveStatus:
+        if not self.targeted:
+            cb = Catch(self.verbose)
+            _ = spending.solve(ctl, cb)
+            return cb.status
+
+        # SAT if a branch closes without result(unsat), else UNSAT if any
+        # branch closes at all.
+        cb = FirstBranch(self.verbose)
+        ans = spending.solve(ctl, cb, self.no_unsat(ctl))
+        if ans is None or ans.unknown:
+            return SolveStatus.UNKNOWN
+        if ans.satisfiable:
+            return SolveStatus.SATISFIABLE
+
+        ans = spending.solve(ctl, cb)
+        if ans is not None and ans.satisfiable:
+            return SolveStatus.UNSATISFIABLE
+        return SolveStatus.UNKNOWN
+
+    async def decide_async(self, ctl: clingo.Control) -> SolveStatus:
+        if not self.targeted:
+            cb = Catch(self.verbose)
+            _ = await solve_async(ctl, cb)
+            return cb.status
+
+        cb = FirstBranch(self.verbose)
+        ans = await solve_async(ctl, cb, self.no_unsat(ctl))
+        if ans.unknown:
+            return SolveStatus.UNKNOWN
+        if ans.satisfiable:
+            return SolveStatus.SATISFIABLE
+
+        ans = await solve_async(ctl, cb)
+        if ans.satisfiable:
+            return SolveStatus.UNSATISFIABLE
+        return SolveStatus.UNKNOWN
+
+    def no_unsat(self, ctl: clingo.Control) -> List[int]:
+        # Assumptions making every result(unsat, ...) atom false.
+        return [
+            -x.literal
+            for x in ctl.symbolic_atoms.by_signature("result", self.result_arity)
+            if x.symbol.arguments[0].name == "unsat"
+        ]
+
+    async def solve_async(self, f: FormulaFacts, depth: int) -> TableauxResult:
+        ctl = self.control(f, depth)
+        await ground_async(ctl, [("base", [])])
+        return TableauxResult(depth, await self.decide_async(ctl))
+
+
+class ReynoldsIncremental(Reynolds):
+    """Reynolds on the multi-shot encoding (reynolds_incremental.lp). The
+    Control of the last formula is kept: a deeper call on the same formula
+    only grounds the steps it adds, and keeps the nogoods learned so far."""
+
+    result_arity = 2
+
+    def __init__(
+        self,
+        verbose: bool,
+        configuration: SolverConfiguration = DEFAULT,
+        budget: Budget = UNLIMITED,
+        targeted: bool = False,
+    ) -> None:
+        super().__init__(verbose, configuration, budget, targeted)
+        self.formula: Optional[FormulaFacts] = None
+        self.ctl: Optional[clingo.Control] = None
+        # Steps grounded in ctl, the last one being queried.
+        self.depth = 0
+
+    def control(self, f: FormulaFacts, depth: int) -> clingo.Control:
+        if self.ctl is not None and depth >= self.depth and f == self.formula:
+            return self.ctl
+
+        ctl = clingo.Control(self.arguments())
+        ctl.load(REYNOLDS_INCREMENTAL)
+        with ctl.backend() as be:
+            add_facts(be, f)
+
+        # Base is grounded with the first steps, within the budget.
+        self.formula, self.ctl, self.depth = f, ctl, 0
+        return ctl
+
+    def steps(self, ctl: clingo.Control, depth: int) -> Parts:
+        # The steps missing for `depth`, whose query replaces the current one.
+        if depth == self.depth:
+            return []
+        parts = [("step", [clingo.Number(t)]) for t in range(self.depth, depth)]
+        if self.depth > 0:
+            ctl.release_external(_query(self.depth - 1))
+        else:
+            parts.insert(0, ("base", []))
+        self.depth = depth
+        return parts
+
+    def search(
+        self, ctl: clingo.Control, depth: int, spending: Spending
+    ) -> TableauxResult:
+        status = SolveStatus.UNKNOWN
+        if spending.ground(ctl, self.steps(ctl, depth)):
+            ctl.assign_external(_query(depth - 1), True)
+            status = self.decide(ctl, spending)
+
+        if spending.exhausted is not None:
+            # Possibly grounded halfway: start over on the next call.
+            self.ctl = None
+            return TableauxResult(depth, SolveStatus.UNKNOWN, spending.exhausted)
+        return TableauxResult(depth, status)
+
+    async def solve_async(self, f: FormulaFacts, depth: int) -> TableauxResult:
+        ctl = self.control(f, depth)
+        try:
+            await ground_async(ctl, self.steps(ctl, depth))
+            ctl.assign_external(_query(depth - 1), True)
+            return TableauxResult(depth, await self.decide_async(ctl))
+        except asyncio.CancelledError:
+            # The Control may still be grounding in the background: the
+            # next call starts over.
+            self.ctl = None
+            raise
 
-        cb = Catch(self.verbose)
-        ctl.ground([("base", [])])
-        _ = ctl.solve(on_model=cb)
 
-        return TableauxResult(depth, cb.status)
+def _query(t: int) -> clingo.Symbol:
+    return clingo.Function("query", [clingo.Number(t)])
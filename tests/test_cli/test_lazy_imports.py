@@ -0,0 +1,56 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Run a subcommand in a fresh interpreter, then print the loaded modules.
+RUN = """
+import json, sys
+from ltlf2asp.cli import run
+sys.argv = sys.argv[:1] + {!r}
+run()
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def loaded_modules(argv):
+    command = [sys.executable, "-c", RUN.format(argv)]
+    p = subprocess.run(command, capture_output=True, text=True, check=True)
+    return set(json.loads(p.stdout.splitlines()[-1]))
+
+
+@pytest.fixture
+def formula(tmp_path):
+    path = tmp_path / "formula.ltl"
+    path.write_text("G(a -> X b) & F(c)")
+    return path
+
+
+def test_writing_a_formula_file_loads_neither_clingo_nor_lark(formula, tmp_path):
+    output = str(tmp_path / "f.bin")
+    modules = loaded_modules(["parse", str(formula), "-o", output, "-e", "pratt"])
+    assert "clingo" not in modules
+    assert "lark" not in modules
+
+
+def test_solve_loads_only_what_it_uses(formula):
+    modules = loaded_modules(["solve", str(formula), "4", "-q", "-e", "pratt"])
+    assert "clingo" in modules
+    assert "ltlf2asp.solve.static_solve_loop" in modules
+    assert "lark" not in modules
+    assert "ltlf2asp.parser.syntax" not in modules
+    assert "ltlf2asp.solve.incremental_solve_loop" not in modules
+    assert "ltlf2asp.solve.tableaux" not in modules
+
+
+def test_lark_is_the_default_engine(formula):
+    modules = loaded_modules(["solve", str(formula), "4", "-q"])
+    assert "lark" in modules
+
+
+def test_parser_package_is_lazy():
+    code = "import sys, ltlf2asp.parser.pratt; print(sorted(sys.modules))"
+    p = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert "'lark'" not in p.stdout
+    assert "'ltlf2asp.parser.syntax'" not in p.stdout
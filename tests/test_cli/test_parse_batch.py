@@ -0,0 +1,14 @@
+import io
+import sys
+
+from ltlf2asp.cli import run
+
+
+def test_batch_leaves_stdin_open(monkeypatch, capsys):
+    stdin = io.StringIO("G(a -> X b)\nF(c)\n")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    monkeypatch.setattr(sys, "argv", ["ltlf2asp", "parse", "-", "-b"])
+    run()
+
+    assert len(capsys.readouterr().out.splitlines()) == 2
+    assert not stdin.closed
@@ -0,0 +1,45 @@
+import pytest
+
+from ltlf2asp.exceptions import ParsingError
+from ltlf2asp.parser import FormulaContext, parse_formula_arrays, parse_formula_object
+from ltlf2asp.parser.binary_format import dump_arrays, is_formula_file, load_arrays
+
+
+def test_round_trip(tmp_path):
+    formula_string = 'G(a -> X "b") & F(c) & (c | d | WX(last)) & ~(a U false)'
+    arrays = parse_formula_arrays(formula_string)
+    dump_arrays(arrays, tmp_path / "f.bin")
+
+    assert is_formula_file(tmp_path / "f.bin")
+    loaded = load_arrays(tmp_path / "f.bin")
+
+    assert len(loaded) == len(arrays)
+    assert loaded.root == arrays.root
+    assert loaded.propositions == arrays.propositions
+    assert list(loaded.children) == list(arrays.children)
+    assert loaded.to_facts() == arrays.to_facts()
+
+    context = FormulaContext()
+    expected = parse_formula_object(formula_string, context)
+    assert loaded.to_formula(context) is expected
+
+
+def test_text_is_not_a_formula_file(tmp_path):
+    (tmp_path / "f.ltl").write_text("G(a)")
+    assert not is_formula_file(tmp_path / "f.ltl")
+
+    with pytest.raises(ParsingError):
+        load_arrays(tmp_path / "f.ltl")
+
+    (tmp_path / "empty.bin").write_bytes(b"")
+    with pytest.raises(ParsingError):
+        load_arrays(tmp_path / "empty.bin")
+
+
+def test_truncated_file(tmp_path):
+    dump_arrays(parse_formula_arrays("a U (b & c)"), tmp_path / "f.bin")
+    data = (tmp_path / "f.bin").read_bytes()
+    (tmp_path / "f.bin").write_bytes(data[: len(data) - 16])
+
+    with pytest.raises(ParsingError):
+        load_arrays(tmp_path / "f.bin")
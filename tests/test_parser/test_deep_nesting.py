@@ -0,0 +1,30 @@
+import sys
+
+import pytest
+
+from ltlf2asp.parser import parse_formula, parse_formula_object, tableaux_reify
+
+DEPTH = 5 * sys.getrecursionlimit()
+
+
+@pytest.mark.parametrize(
+    "formula_string",
+    (
+        "X " * DEPTH + "a",
+        "X(" * DEPTH + "a" + ")" * DEPTH,
+        "a U (" * DEPTH + "b" + ")" * DEPTH,
+        "~" * DEPTH + "a",
+    ),
+)
+def test_deeply_nested_formulas(formula_string):
+    limit = sys.getrecursionlimit()
+    assert len(parse_formula(formula_string)) > 0
+
+    f = parse_formula_object(formula_string)
+    assert len(tableaux_reify(f.negate().to_nnf())) > 0
+    assert sys.getrecursionlimit() == limit
+
+
+def test_negation_is_pushed_to_atoms():
+    f = parse_formula_object("~(a U X b) & ~~c")
+    assert str(f) == "((~a R (WX ~b)) & c)"
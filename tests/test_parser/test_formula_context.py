@@ -0,0 +1,88 @@
+import gc
+import pickle
+import threading
+import weakref
+
+import pytest
+
+from ltlf2asp.parser import FormulaContext, parse_formula_object, tableaux_reify
+from ltlf2asp.parser.syntax import Conjunction, Proposition
+
+
+def test_ids_do_not_depend_on_history():
+    parse_formula_object("G(x -> X y) & F(z)")
+    f = parse_formula_object("a U b", FormulaContext())
+    g = parse_formula_object("a U b", FormulaContext())
+
+    assert f is not g
+    assert [str(x) for x in tableaux_reify(f)] == [str(x) for x in tableaux_reify(g)]
+
+
+def test_tableaux_reify_in_context():
+    f = parse_formula_object("G(a -> X b) & F(c)")
+    facts = [str(x) for x in tableaux_reify(f, FormulaContext())]
+
+    assert facts == [str(x) for x in tableaux_reify(f, FormulaContext())]
+    assert facts[0] == "root(10)"
+
+
+def test_context_can_be_reset_and_dropped():
+    context = FormulaContext()
+    f = parse_formula_object("a & X b", context)
+    assert len(context) == 4
+
+    context.reset()
+    assert len(context) == 0
+
+    ref = weakref.ref(f)
+    del f, context
+    gc.collect()
+    assert ref() is None
+
+
+def test_formulas_from_different_contexts_do_not_mix():
+    a = Proposition("a", context=FormulaContext())
+    b = Proposition("b", context=FormulaContext())
+
+    with pytest.raises(ValueError):
+        Conjunction([a, b])
+
+
+def test_activate_sets_leaves_context():
+    context = FormulaContext()
+    with context.activate():
+        f = Conjunction([Proposition("a"), Proposition("b")])
+
+    assert f.context is context
+    assert Proposition("a").context is not context
+
+
+def test_pickle_rebuilds_in_current_context():
+    f = parse_formula_object("G(a -> X b)", FormulaContext())
+    data = pickle.dumps(f)
+
+    context = FormulaContext()
+    with context.activate():
+        g = pickle.loads(data)
+
+    assert g.context is context
+    assert str(g) == str(f)
+    assert [str(x) for x in tableaux_reify(g)] == [
+        str(x) for x in tableaux_reify(f, FormulaContext())
+    ]
+
+
+def test_concurrent_construction_builds_formulas_once():
+    context = FormulaContext()
+    results = []
+
+    def build():
+        results.append(parse_formula_object("G(a -> X b) & F(a U c)", context))
+
+    threads = [threading.Thread(target=build) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert all(f is results[0] for f in results)
@@ -0,0 +1,82 @@
+import pickle
+import sys
+
+from ltlf2asp.parser import FormulaContext, parse_formula_object, tableaux_reify
+from ltlf2asp.parser.syntax import (
+    Conjunction,
+    FormulaBuilder,
+    Next,
+    Proposition,
+    Truth,
+    Until,
+)
+
+
+def test_equal_formulas_are_built_once():
+    f = Conjunction([Until(Truth(), Proposition("a")), Next(Proposition("a"))])
+    g = Conjunction((Until(Truth(), Proposition("a")), Next(Proposition("a"))))
+
+    assert f is g
+    assert f.uid == g.uid
+    assert f.fs[0].rhs is f.fs[1].f
+
+
+def test_parsed_formulas_share_subformulas():
+    f = parse_formula_object("(a U b) & X(a U b)")
+    g = parse_formula_object("X(a U b) & (a U b)")
+
+    assert f.fs[0] is f.fs[1].f
+    assert f.fs[0] is g.fs[1]
+    assert f is not g
+
+
+def test_equivalence_stores_operands_once():
+    a, b = Proposition("a"), Proposition("b")
+    f = FormulaBuilder.equivalence(a, b).to_nnf()
+
+    assert f.fs[0].fs[1] is f.fs[1].fs[0].negate()
+    assert f.fs[0].fs[0] is f.fs[1].fs[1].negate()
+
+
+def test_deep_formulas_compare_in_constant_time():
+    depth = 5 * sys.getrecursionlimit()
+    f = parse_formula_object("X " * depth + "a")
+    g = parse_formula_object("X " * depth + "a")
+
+    assert f == g
+    assert len({f, g}) == 1
+
+
+def test_pickling_preserves_identity():
+    f = parse_formula_object("G(a -> X b) & F(c)")
+    assert pickle.loads(pickle.dumps(f)) is f
+
+
+def test_nnf_is_linear_in_dag_size():
+    context = FormulaContext()
+    f = FormulaBuilder.proposition("p0", context)
+    for i in range(1, 60):
+        f = FormulaBuilder.equivalence(f, FormulaBuilder.proposition(f"p{i}", context))
+
+    before = len(context)
+    g = f.to_nnf()
+    assert len(context) - before <= 4 * before
+    assert g.to_nnf() is g
+    assert f.negate() is g.negate()
+
+
+def test_tableaux_reify_emits_shared_subformulas_once():
+    context = FormulaContext()
+    f = parse_formula_object("(a U b) & X(a U b) & G(a U b)", context)
+    facts = [str(x) for x in tableaux_reify(f)]
+
+    assert len(facts) == len(set(facts))
+    assert len([x for x in facts if x.startswith("until")]) == 1
+    assert len([x for x in facts if x.startswith("atomic")]) == 2
+    assert facts == [str(x) for x in tableaux_reify(f)]
+
+
+def test_propositions():
+    f = parse_formula_object("G(a -> X ~b) & (c U (a | last))")
+    assert f.propositions() == {"a", "b", "c"}
+    assert f.to_nnf().propositions() == {"a", "b", "c"}
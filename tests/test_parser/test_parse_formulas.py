@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from ltlf2asp.parser import parse_formula, parse_formulas
+from ltlf2asp.parser.reify_as_object import ReifyFormulaAsObject
+
+CORPUS = Path(__file__).parent.parent / "test_solve_random_sample" / "formulas.txt"
+
+
+def test_batch_agrees_with_single_formula_parsing():
+    lines = CORPUS.read_text().splitlines()[:200]
+    parsed = list(parse_formulas(lines))
+
+    assert len(parsed) == len(lines)
+    for x in parsed:
+        assert x.ok
+        assert x.result == parse_formula(x.formula)
+
+
+def test_errors_do_not_abort_the_stream():
+    lines = ["a & b", "a U b U c", "", "% comment", ")", "X(a)"]
+    parsed = list(parse_formulas(lines))
+
+    assert [x.line for x in parsed] == [1, 2, 5, 6]
+    assert [x.ok for x in parsed] == [True, False, False, True]
+
+
+def test_batch_is_lazy():
+    def lines():
+        yield "a"
+        raise AssertionError("Consumed more lines than requested.")
+
+    assert next(parse_formulas(lines())).ok
+
+
+def test_batch_with_object_reification():
+    parsed = list(parse_formulas(["G(a)", "F(a)"], ReifyFormulaAsObject))
+    assert [str(x.result) for x in parsed] == ["(#false R a)", "(#true U a)"]
@@ -0,0 +1,16 @@
+from ltlf2asp.parser import parse_formula
+from ltlf2asp.parser.parser import CACHE_DIR_VARIABLE, _build_parser, get_parser
+
+
+def test_parser_is_built_once():
+    assert get_parser("start") is get_parser("start")
+
+
+def test_parser_tables_are_persisted(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_VARIABLE, str(tmp_path))
+    _build_parser.cache_clear()
+    parse_formula("G(a -> X b)")
+    assert len(list(tmp_path.iterdir())) == 1
+
+    _build_parser.cache_clear()
+    assert parse_formula("G(a -> X b)") == parse_formula("G(a -> X b)")
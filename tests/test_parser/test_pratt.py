@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+
+import lark
+import pytest
+
+from ltlf2asp.exceptions import ParsingError, UnsupportedOperator
+from ltlf2asp.parser import FormulaContext, parse_formula, parse_formula_object
+from ltlf2asp.parser import parse_formulas
+
+CORPUS = Path(__file__).parent.parent / "test_solve_random_sample" / "formulas.txt"
+
+
+def test_agrees_with_lark_on_corpus():
+    for line in CORPUS.read_text().splitlines()[:1000]:
+        assert parse_formula(line, engine="pratt") == parse_formula(line), line
+
+
+@pytest.mark.parametrize(
+    "formula_string",
+    (
+        "a <=> b",
+        "a = b",
+        "a || b && c",
+        "a & b & c | d -> e",
+        "U1",
+        "G1",
+        "X_a",
+        "WXa",
+        "wX a",
+        "W",
+        "' abc '",
+        "\"a-b\" & 'b'",
+        "tRuE | END | False",
+        "?x & a?b",
+        "X(a)U b",
+        "a\nU\tb",
+        "G(a -> X(b U (c | ~d)))",
+        "a & (b | c) & d R e M f W g U h",
+        "!~(((a)))",
+    ),
+)
+def test_agrees_with_lark(formula_string):
+    context = FormulaContext()
+    expected = parse_formula_object(formula_string, context)
+    assert parse_formula_object(formula_string, context, engine="pratt") is expected
+
+
+@pytest.mark.parametrize(
+    "formula_string",
+    ("", "a => b", "a | | b", "a WX b", "'a\"", "G", "G(", "a)", "()", "aU b", "a-b"),
+)
+def test_rejects_what_lark_rejects(formula_string):
+    with pytest.raises(lark.exceptions.LarkError):
+        parse_formula(formula_string)
+
+    with pytest.raises(ParsingError):
+        parse_formula(formula_string, engine="pratt")
+
+
+@pytest.mark.parametrize("formula_string", ("a U b U c", "a -> b -> c", "a M b M c"))
+def test_unsupported_operators(formula_string):
+    with pytest.raises(UnsupportedOperator):
+        parse_formula(formula_string, engine="pratt")
+
+
+def test_deeply_nested_formulas():
+    depth = 5 * sys.getrecursionlimit()
+    formula_string = "a U (" * depth + "X b" + ")" * depth
+    assert parse_formula(formula_string, engine="pratt") == parse_formula(
+        formula_string
+    )
+
+
+def test_batch():
+    lines = ["a & b", "a U b U c", ")", "X(a)"]
+    parsed = list(parse_formulas(lines, engine="pratt"))
+    assert [x.ok for x in parsed] == [True, False, False, True]
+    assert parsed[3].result == parse_formula("X(a)")
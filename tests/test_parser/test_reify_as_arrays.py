@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+
+from ltlf2asp.parser import (
+    FormulaContext,
+    parse_formula,
+    parse_formula_arrays,
+    parse_formula_object,
+)
+from ltlf2asp.parser.reify_as_arrays import NONE, Op
+
+CORPUS = Path(__file__).parent.parent / "test_solve_random_sample" / "formulas.txt"
+
+
+def test_layout():
+    arrays = parse_formula_arrays("(a U b) & X(a) & (a U b) & (c | d | e)")
+
+    assert arrays.propositions == ["a", "b", "c", "d", "e"]
+    assert len(arrays) == 9
+    assert arrays.opcode[arrays.root] == Op.CONJUNCTION
+    # Operands are kept as written, shared subformulas are stored once.
+    operands = arrays.operands(arrays.root)
+    assert len(operands) == 4 and operands[0] == operands[2]
+
+    until = arrays.opcode.index(Op.UNTIL)
+    assert arrays.propositions[arrays.lhs[arrays.lhs[until]]] == "a"
+    assert arrays.propositions[arrays.lhs[arrays.rhs[until]]] == "b"
+
+    disjunction = arrays.opcode.index(Op.DISJUNCTION)
+    assert arrays.lhs[disjunction] == arrays.rhs[disjunction] == NONE
+    assert len(arrays.operands(disjunction)) == 3
+
+    # Children come before their parents.
+    for i in range(len(arrays)):
+        for j in (arrays.lhs[i], arrays.rhs[i], *arrays.operands(i)):
+            assert arrays.opcode[i] == Op.ATOMIC or j < i
+
+
+@pytest.mark.parametrize(
+    "formula_string",
+    (
+        "a",
+        "G(a -> X b) & F(c)",
+        "(a W b) <-> (b M c)",
+        "WX(last) | a & a & b | true | ~false",
+    ),
+)
+def test_converts_to_facts_and_objects(formula_string):
+    arrays = parse_formula_arrays(formula_string)
+    assert arrays.to_facts() == parse_formula(formula_string)
+
+    context = FormulaContext()
+    expected = parse_formula_object(formula_string, context)
+    assert arrays.to_formula(context) is expected
+
+
+def test_agrees_with_facts_on_corpus():
+    for line in CORPUS.read_text().splitlines()[:200]:
+        assert parse_formula_arrays(line).to_facts() == parse_formula(line)
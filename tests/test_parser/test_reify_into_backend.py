@@ -0,0 +1,34 @@
+import clingo
+import pytest
+
+from ltlf2asp.parser import formula_loader, parse_formula, parse_formula_into_backend
+from ltlf2asp.solve.check_model import check_trace
+from ltlf2asp.solve.decode_model import SolveStatus, State
+from ltlf2asp.solve.incremental_solve_loop import solve
+
+
+def grounded_facts(add):
+    ctl = clingo.Control()
+    with ctl.backend() as backend:
+        add(backend)
+    ctl.ground([("base", [])])
+    return {x.symbol for x in ctl.symbolic_atoms if x.is_fact}
+
+
+@pytest.mark.parametrize(
+    "formula_string",
+    ("a", "G(a -> X b) & F(c)", "(a W b) <-> (b M c)", "WX(last) | a & a & b"),
+)
+def test_backend_gets_the_same_facts(formula_string):
+    facts = parse_formula(formula_string)
+    streamed = grounded_facts(lambda b: parse_formula_into_backend(formula_string, b))
+    assert streamed == facts
+
+
+def test_solvers_accept_loaders():
+    result = solve(formula_loader("a & X(~a) & X(X(a))"), 8)
+    assert result.status == SolveStatus.SATISFIABLE
+    assert check_trace(result.model.pi, parse_formula("a & X(~a) & X(X(a))"))
+
+    trace = (State({"a": True}), State({"a": False}))
+    assert check_trace(trace, formula_loader("a & X(~a)"))
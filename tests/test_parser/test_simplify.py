@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pytest
+
+from ltlf2asp.parser import FormulaContext, parse_formula, parse_formula_object
+from ltlf2asp.solve.incremental_solve_loop import solve
+
+CORPUS = Path(__file__).parent.parent / "test_solve_random_sample" / "formulas.txt"
+
+
+@pytest.mark.parametrize(
+    "formula_string, simplified",
+    (
+        ("a & true", "a"),
+        ("a & false", "false"),
+        ("a | true", "true"),
+        ("(a & b) & (c & (a & true))", "a & b & c"),
+        ("a | (b | ~a)", "true"),
+        ("~~a", "a"),
+        ("G G a", "G a"),
+        ("F F a", "F a"),
+        ("False R (X(p9))", "G(X(p9))"),
+        ("true U a", "F a"),
+        ("a U a", "a"),
+        ("a R false", "false"),
+        ("a W false", "G a"),
+        ("false M a", "false"),
+        ("a M true", "F a"),
+        ("X false", "false"),
+        ("WX true", "true"),
+        ("a -> false", "~a"),
+        ("(a <-> a) & b", "b"),
+        ("false <-> (a U b)", "~(a U b)"),
+    ),
+)
+def test_rewritings(formula_string, simplified):
+    context = FormulaContext()
+    expected = parse_formula_object(simplified, context)
+    assert parse_formula_object(formula_string, context, simplify=True) is expected
+
+
+def test_facts_of_simplified_formulas_are_reachable():
+    facts = parse_formula("(a | true) & (b U (c & false)) | d", simplify=True)
+    assert {str(x) for x in facts} == {'atomic(1,"d")', "root(1)"}
+
+
+def test_equisatisfiable_on_corpus():
+    for line in CORPUS.read_text().splitlines()[:60]:
+        expected = solve(parse_formula(line), 8).status
+        assert solve(parse_formula(line, simplify=True), 8).status == expected, line
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from ltlf2asp.parser import parse_formula_object, tableaux_reify
+from ltlf2asp.solve.budget import ATOMS, TIME, Budget
+from ltlf2asp.solve.decode_model import SolveStatus
+from ltlf2asp.solve.tableaux import Reynolds, ReynoldsIncremental
+
+FORMULAS = (
+    "a",
+    "WX a",
+    "(a U b) & (~a) & X(~a)",
+    "F(a) & F(~a)",
+    "G(WX(a))",
+    "a & (a -> G(~b)) & F(b)",
+    "X(True) & (WX a) & G(a -> X(a))",
+    "G(a -> X b) & G(b -> X a) & F(a)",
+    "F(X(X(X(X(X(X(a)))))))",
+)
+
+
+def facts(formula_string):
+    return tableaux_reify(parse_formula_object(formula_string).to_nnf())
+
+
+@pytest.mark.parametrize("formula_string", FORMULAS)
+def test_agrees_with_reynolds_at_every_depth(formula_string):
+    g = facts(formula_string)
+    tableaux = ReynoldsIncremental(False)
+    for depth in range(1, 12):
+        assert tableaux.solve(g, depth) == Reynolds(False).solve(g, depth)
+
+
+def test_control_is_kept_while_deepening():
+    g = facts("F(X(X(X(X(X(X(a)))))))")
+    tableaux = ReynoldsIncremental(False)
+    assert tableaux.solve(g, 4).unsatisfiable
+    ctl = tableaux.ctl
+    assert tableaux.solve(g, 8).satisfiable
+    assert tableaux.solve(g, 8).satisfiable
+    assert tableaux.ctl is ctl
+
+    # A shallower depth, or another formula, starts over.
+    assert tableaux.solve(g, 4).unsatisfiable
+    assert tableaux.ctl is not ctl
+    assert tableaux.solve(facts("a"), 8).satisfiable
+
+
+def test_budget_and_async():
+    g = facts("G(a -> X b) & G(b -> X a) & F(a)")
+    tableaux = ReynoldsIncremental(False, budget=Budget(atoms=10))
+    result = tableaux.solve(g, 8)
+    assert (result.status, result.exhausted) == (SolveStatus.UNKNOWN, ATOMS)
+    assert tableaux.ctl is None
+
+    # Base is not grounded past the budget either.
+    ctl = tableaux.control(g, 8)
+    result = tableaux.search(ctl, 8, Budget(time=0).start())
+    assert (result.status, result.exhausted) == (SolveStatus.UNKNOWN, TIME)
+    facts_only = Reynolds(False).control(g, 8)
+    assert len(ctl.symbolic_atoms) == len(facts_only.symbolic_atoms)
+
+    async def deepen():
+        tableaux = ReynoldsIncremental(False)
+        return [await tableaux.solve_async(g, depth) for depth in (2, 4, 8)]
+
+    assert asyncio.run(deepen()) == [Reynolds(False).solve(g, d) for d in (2, 4, 8)]
+
+
+def test_cancelled_async_starts_over():
+    g = facts("G(a -> X b) & G(b -> X a) & F(a)")
+    tableaux = ReynoldsIncremental(False)
+
+    async def cancel_then_deepen():
+        await tableaux.solve_async(g, 2)
+        ctl = tableaux.ctl
+        task = asyncio.create_task(tableaux.solve_async(g, 64))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert tableaux.ctl is None
+        result = await tableaux.solve_async(g, 8)
+        assert tableaux.ctl is not ctl
+        return result
+
+    assert asyncio.run(cancel_then_deepen()) == Reynolds(False).solve(g, 8)
@@ -0,0 +1,53 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from ltlf2asp.parser import parse_formula_object, tableaux_reify
+from ltlf2asp.solve.budget import CONFLICTS, Budget
+from ltlf2asp.solve.decode_model import SolveStatus
+from ltlf2asp.solve.tableaux import Reynolds, ReynoldsIncremental
+
+CORPUS = Path(__file__).parent.parent / "test_solve_random_sample" / "formulas.txt"
+
+
+def facts(formula_string):
+    return tableaux_reify(parse_formula_object(formula_string).to_nnf())
+
+
+@pytest.mark.parametrize(
+    "formula_string, status",
+    [
+        ("(a U b) & (~a) & X(~a)", SolveStatus.SATISFIABLE),
+        ("F(a) & F(~a)", SolveStatus.SATISFIABLE),
+        ("G(true)", SolveStatus.SATISFIABLE),
+        ("a & (a -> G(~b)) & F(b)", SolveStatus.UNSATISFIABLE),
+        ("G(a -> X b) & G(b -> X a) & F(a)", SolveStatus.UNSATISFIABLE),
+        ("F(false)", SolveStatus.UNSATISFIABLE),
+    ],
+)
+def test_targeted_search(formula_string, status):
+    g = facts(formula_string)
+    assert Reynolds(False, targeted=True).solve(g, 20).status == status
+    assert ReynoldsIncremental(False, targeted=True).solve(g, 20).status == status
+
+
+def test_agrees_with_optimal_branches():
+    for formula_string in CORPUS.read_text().splitlines()[:40]:
+        g = facts(formula_string)
+        tableaux = ReynoldsIncremental(False, targeted=True)
+        for depth in (4, 8, 16):
+            expected = Reynolds(False).solve(g, depth)
+            assert Reynolds(False, targeted=True).solve(g, depth) == expected
+            assert tableaux.solve(g, depth) == expected
+
+
+def test_budget_and_async():
+    g = facts("G(a -> X b) & G(b -> X a) & F(a)")
+    tableaux = Reynolds(False, budget=Budget(conflicts=0), targeted=True)
+    assert tableaux.solve(g, 8).exhausted == CONFLICTS
+
+    async def run():
+        return await Reynolds(False, targeted=True).solve_async(g, 8)
+
+    assert asyncio.run(run()).unsatisfiable
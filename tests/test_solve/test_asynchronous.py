@@ -0,0 +1,98 @@
+import asyncio
+import time
+from pathlib import Path
+
+import clingo
+import pytest
+
+from ltlf2asp.parser import parse_formula, parse_formula_object, tableaux_reify
+from ltlf2asp.solve.asynchronous import solve_async
+from ltlf2asp.solve.check_model import check_trace, check_trace_async
+from ltlf2asp.solve.hybrid_solve import solve as hybrid_solve
+from ltlf2asp.solve.hybrid_solve import solve_async as hybrid_solve_async
+from ltlf2asp.solve.solver_interface import Solver
+from ltlf2asp.solve.tableaux import Reynolds
+
+CORPUS = Path(__file__).parent.parent / "test_solve_random_sample" / "formulas.txt"
+FORMULAS = CORPUS.read_text().splitlines()[:40]
+
+# Pigeonhole: 11 pigeons in 10 holes, far too long to refute.
+PIGEONHOLE = """
+pigeon(1..11). hole(1..10).
+1 { in(P,H): hole(H) } 1 :- pigeon(P).
+:- hole(H), 2 { in(P,H): pigeon(P) }.
+"""
+
+
+@pytest.mark.parametrize(
+    "incremental, shared", [(False, False), (False, True), (True, False)]
+)
+def test_async_solver_agrees_with_solver(incremental, shared):
+    solver = Solver(incremental, 16, shared)
+
+    async def solve_all():
+        return await asyncio.gather(
+            *(solver.solve_async(parse_formula(x)) for x in FORMULAS)
+        )
+
+    results = asyncio.run(solve_all())
+    for formula_string, result in zip(FORMULAS, results):
+        expected = solver.solve(parse_formula(formula_string))
+        assert (result.status, result.k) == (expected.status, expected.k)
+
+
+def test_async_reynolds_hybrid_and_check():
+    facts = parse_formula("G(a -> X b) & F a")
+    tableaux = tableaux_reify(parse_formula_object("G(a -> X b) & F a"))
+    model = Solver(False, 16).solve(facts).model
+
+    async def run():
+        return (
+            await Reynolds(False).solve_async(tableaux, 8),
+            await hybrid_solve_async(facts, tableaux, 16),
+            await check_trace_async(model.pi, facts),
+        )
+
+    reynolds, hybrid, check = asyncio.run(run())
+    assert reynolds == Reynolds(False).solve(tableaux, 8)
+    assert hybrid.status == hybrid_solve(facts, tableaux, 16).status
+    assert check == check_trace(model.pi, facts)
+
+
+def test_cancellation_interrupts_the_search():
+    ctl = clingo.Control()
+    ctl.add("base", [], PIGEONHOLE)
+    ctl.ground([("base", [])])
+
+    async def run():
+        ticks = 0
+        task = asyncio.create_task(solve_async(ctl, lambda _: True))
+        # The event loop keeps running while clingo searches.
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+            ticks += 1
+        assert not task.done()
+
+        start = time.perf_counter()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return ticks, time.perf_counter() - start
+
+    ticks, elapsed = asyncio.run(run())
+    assert ticks == 10
+    assert elapsed < 1
+
+
+def test_cancelled_solver():
+    facts = parse_formula("G(a <-> X ~a) & F(b & X(b U c)) & G ~c")
+    solver = Solver(True, 4096)
+
+    async def run():
+        task = asyncio.create_task(solver.solve_async(facts))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
@@ -0,0 +1,146 @@
+import gc
+import sys
+import weakref
+from pathlib import Path
+
+import pytest
+
+from ltlf2asp.parser import parse_formula, parse_formula_object
+from ltlf2asp.parser.syntax import Conjunction, FormulaContext, Negate
+from ltlf2asp.solve.automata import Automata, formula_from_facts
+from ltlf2asp.solve.budget import TIME, Budget
+from ltlf2asp.solve.check_model import check_trace
+from ltlf2asp.solve.decode_model import SolveStatus
+from ltlf2asp.solve.explicit_tableaux import solve as solve_explicit
+from ltlf2asp.solve.solver_interface import Solver
+from ltlf2asp.solve.static_solve_loop import solve as solve_static
+
+CORPUS = Path(__file__).parent.parent / "test_solve_random_sample" / "formulas.txt"
+
+
+@pytest.mark.parametrize(
+    "formula_string, k",
+    (
+        ("a", 1),
+        ("~a", 1),
+        ("WX a", 1),
+        ("X a", 2),
+        ("(a U b) & (~a) & X(~a)", 2),
+        ("F(a) & F(~a)", 2),
+        ("G(a -> X b) & F(a) & G(b -> ~a)", 2),
+        ("G(WX(a))", 1),
+        ("X X X X X X X X X X X X X X X X X X X X a", 21),
+    ),
+)
+def test_satisfiable(formula_string, k):
+    result = Automata().solve(parse_formula_object(formula_string))
+    assert (result.status, result.k, len(result.model)) == (
+        SolveStatus.SATISFIABLE,
+        k,
+        k,
+    )
+    assert check_trace(result.model.pi, parse_formula(formula_string))
+
+
+@pytest.mark.parametrize(
+    "formula_string",
+    (
+        "~a & a",
+        "a & (a -> G(~b)) & F(b)",
+        "X(True) & (WX a) & G(a -> X(a))",
+        "G(X(a))",
+        "G(a -> X a) & F(a)",
+        "F(false)",
+        "G(a -> X b) & G(b -> X a) & F(a)",
+    ),
+)
+def test_unsatisfiable(formula_string):
+    result = Automata().solve(parse_formula_object(formula_string))
+    assert result.status == SolveStatus.UNSATISFIABLE
+
+
+def test_agrees_with_explicit_tableaux():
+    automata = Automata()
+    for formula_string in CORPUS.read_text().splitlines()[:60]:
+        formula = parse_formula_object(formula_string)
+        result = automata.solve(formula)
+        expected = solve_explicit(formula)
+        assert result.status == expected.status
+        if result.status == SolveStatus.SATISFIABLE:
+            assert check_trace(result.model.pi, parse_formula(formula_string))
+            assert result.k <= expected.k
+
+
+def test_witness_is_shortest():
+    for formula_string in CORPUS.read_text().splitlines()[:20]:
+        result = Automata().solve(parse_formula_object(formula_string))
+        if result.status != SolveStatus.SATISFIABLE or result.k == 1:
+            continue
+        shorter = solve_static(parse_formula(formula_string), result.k - 1)
+        assert shorter.status != SolveStatus.SATISFIABLE
+
+
+def test_cache_is_per_formula_and_bounded():
+    automata = Automata()
+    automata.solve(parse_formula_object("G(a -> X b) & F(a)"))
+    (automaton,) = automata.automata.values()
+    states = len(automaton.steps)
+    result = automata.solve(parse_formula_object("G(a -> X b) & F(a)"))
+    assert result.status == SolveStatus.SATISFIABLE
+    assert list(automata.automata.values()) == [automaton]
+    assert len(automaton.steps) == states
+
+    # Evicted automata free their states.
+    bounded = Automata(maxsize=2)
+    contexts = []
+    for formula_string in CORPUS.read_text().splitlines()[:10]:
+        formula = parse_formula_object(formula_string)
+        assert bounded.solve(formula).status == solve_explicit(formula).status
+        assert len(bounded.automata) <= 2
+        contexts.extend(weakref.ref(x.context) for x in bounded.automata.values())
+    gc.collect()
+    alive = {x() for x in contexts} - {None}
+    assert alive == {x.context for x in bounded.automata.values()}
+
+
+def test_disk_cache(tmp_path):
+    formula = parse_formula_object("G(a -> X b) & F(a) & G(b -> ~a)")
+    automata = Automata(cache_dir=tmp_path)
+    expected = automata.solve(formula)
+    automata.solve(parse_formula_object("F(a) & G(~a | X b)"))
+    automata.save()
+
+    loaded = Automata(cache_dir=tmp_path)
+    assert len(loaded.automata) == 2
+    for x, y in zip(automata.automata.values(), loaded.automata.values()):
+        assert len(y.steps) == len(x.steps)
+        assert all(f.context is y.context for f in y.steps)
+    assert len({x.context for x in loaded.automata.values()}) == 2
+    assert loaded.solve(formula) == expected
+
+
+def test_solver_backend():
+    solver = Solver(False, 1, automata=True)
+    for formula_string in CORPUS.read_text().splitlines()[:20]:
+        facts = parse_formula(formula_string)
+        expected = solve_explicit(parse_formula_object(formula_string))
+        assert solver.solve(facts).status == expected.status
+
+    # Decoded native facts are equivalent to the parsed formula.
+    formula_string = "(a W b) & (a <-> X b) & (b M a) & F(last)"
+    context = FormulaContext()
+    f = formula_from_facts(parse_formula(formula_string, native=True), context)
+    g = context.adopt(parse_formula_object(formula_string))
+    for x, y in ((f, g), (g, f)):
+        result = Automata().solve(Conjunction([x, Negate(y)]))
+        assert result.status == SolveStatus.UNSATISFIABLE
+
+
+def test_deep_formula_and_budget():
+    depth = 2 * sys.getrecursionlimit()
+    result = Automata().solve(parse_formula_object("X " * depth + "a"))
+    assert (result.status, result.k) == (SolveStatus.SATISFIABLE, depth + 1)
+
+    formula = parse_formula_object("G(F a) & G(F ~a)")
+    result = Automata().solve(formula, Budget(time=0))
+    assert (result.status, result.exhausted) == (SolveStatus.UNKNOWN, TIME)
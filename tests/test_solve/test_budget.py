@@ -0,0 +1,68 @@
+import pytest
+
+from ltlf2asp.parser import parse_formula, parse_formula_object, tableaux_reify
+from ltlf2asp.solve.budget import ATOMS, CONFLICTS, TIME, Budget
+from ltlf2asp.solve.decode_model import SolveStatus
+from ltlf2asp.solve.hybrid_solve import solve as hybrid_solve
+from ltlf2asp.solve.solver_interface import Solver
+from ltlf2asp.solve.tableaux import Reynolds
+
+# Unsatisfiable, but refuted at every horizon: the loops run to the end.
+UNSAT = "G(a <-> X !a) & G(b <-> X !b) & F(a & b) & G(!a | !b)"
+SAT = "G(a -> X b) & F a"
+
+
+@pytest.mark.parametrize(
+    "incremental, shared", [(False, False), (False, True), (True, False)]
+)
+@pytest.mark.parametrize(
+    "budget, exhausted",
+    [
+        (Budget(conflicts=1), CONFLICTS),
+        (Budget(time=0), TIME),
+        (Budget(atoms=10), ATOMS),
+    ],
+)
+def test_exhausted_budget_is_reported(incremental, shared, budget, exhausted):
+    solver = Solver(incremental, 64, shared, budget=budget)
+    result = solver.solve(parse_formula(UNSAT))
+    assert result.status == SolveStatus.UNKNOWN
+    assert result.exhausted == exhausted
+    assert result.k < 64
+
+
+@pytest.mark.parametrize(
+    "incremental, shared", [(False, False), (False, True), (True, False)]
+)
+def test_large_budget_changes_nothing(incremental, shared):
+    budget = Budget(time=60, conflicts=10**6, restarts=10**6, atoms=10**7)
+    for formula in (SAT, UNSAT):
+        expected = Solver(incremental, 64, shared).solve(parse_formula(formula))
+        result = Solver(incremental, 64, shared, budget=budget).solve(
+            parse_formula(formula)
+        )
+        assert (result.status, result.k) == (expected.status, expected.k)
+        assert result.exhausted is None
+
+
+def test_reynolds_and_hybrid_budgets():
+    facts = parse_formula("G a & F !a")
+    tableaux = tableaux_reify(parse_formula_object("G a & F !a"))
+
+    result = Reynolds(False, budget=Budget(atoms=10)).solve(tableaux, 8)
+    assert (result.status, result.exhausted) == (SolveStatus.UNKNOWN, ATOMS)
+    assert Reynolds(False, budget=Budget(time=60)).solve(tableaux, 8).unsatisfiable
+
+    result = hybrid_solve(facts, tableaux, 64, budget=Budget(time=0))
+    assert (result.status, result.exhausted) == (SolveStatus.UNKNOWN, TIME)
+
+
+def test_shared_base_exhausts_the_budget():
+    result = Solver(False, 64, True, budget=Budget(atoms=10)).solve(
+        parse_formula(UNSAT)
+    )
+    assert (result.status, result.exhausted, result.k) == (
+        SolveStatus.UNKNOWN,
+        ATOMS,
+        0,
+    )
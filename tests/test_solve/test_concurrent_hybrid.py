@@ -0,0 +1,75 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from ltlf2asp.parser import parse_formula, parse_formula_object, tableaux_reify
+from ltlf2asp.solve.budget import TIME, Budget
+from ltlf2asp.solve.decode_model import SolveStatus
+from ltlf2asp.solve.hybrid_solve import solve, solve_concurrent
+from ltlf2asp.solve.schedule import DOUBLING, Linear
+
+CORPUS = Path(__file__).parent.parent / "test_solve_random_sample" / "formulas.txt"
+
+
+def formulas(formula_string):
+    obj = parse_formula_object(formula_string).to_nnf()
+    return parse_formula(formula_string), tableaux_reify(obj)
+
+
+@pytest.mark.parametrize(
+    "formula_string, status",
+    [
+        ("G(a -> X b) & F a", SolveStatus.SATISFIABLE),
+        ("F(a) & F(~a)", SolveStatus.SATISFIABLE),
+        ("G a & F ~a", SolveStatus.UNSATISFIABLE),
+        ("G(a -> X b) & G(b -> X a) & F(a)", SolveStatus.UNSATISFIABLE),
+        ("X(True) & (WX a) & G(a -> X(a))", SolveStatus.UNSATISFIABLE),
+    ],
+)
+def test_concurrent_hybrid(formula_string, status):
+    result = solve_concurrent(*formulas(formula_string), 64)
+    assert result.status == status
+    assert (result.model is not None) == (status == SolveStatus.SATISFIABLE)
+
+
+def test_models_agree_with_hybrid():
+    for formula_string in CORPUS.read_text().splitlines()[:40]:
+        f, g = formulas(formula_string)
+        expected = solve(f, g, 32)
+        result = solve_concurrent(f, g, 32)
+        if expected.status == SolveStatus.SATISFIABLE:
+            assert result.status == SolveStatus.SATISFIABLE
+
+
+# Satisfiable formulas the tableaux refutes at some depths.
+REFUTED = [
+    "True U (X(X(X((X(p0)) & (X(p17))))))",
+    "(p13) M (X(X(X((p15) <-> ((p21) & (X((X(X(p17))) W (p6))))))))",
+]
+
+
+@pytest.mark.parametrize("schedule", [DOUBLING, Linear(1, 1)])
+@pytest.mark.parametrize("formula_string", REFUTED)
+def test_no_shallow_tableaux(formula_string, schedule):
+    f, g = formulas(formula_string)
+    assert solve(f, g, 64, schedule).status == SolveStatus.SATISFIABLE
+
+
+@pytest.mark.parametrize("schedule", [DOUBLING, Linear(1, 1)])
+@pytest.mark.parametrize("formula_string", REFUTED)
+def test_tableaux_waits_for_the_models(formula_string, schedule):
+    # Whichever side is ahead, the answer is the same.
+    f, g = formulas(formula_string)
+    for _ in range(5):
+        result = solve_concurrent(f, g, 64, schedule)
+        assert result.status == SolveStatus.SATISFIABLE
+
+
+def test_no_thread_left_behind():
+    before = threading.active_count()
+    solve_concurrent(*formulas("G(a -> X b) & F a"), 64)
+    assert solve_concurrent(*formulas("X X X X X X X X X X a"), 8).k == 8
+    result = solve_concurrent(*formulas("G a & F ~a"), 64, budget=Budget(time=0))
+    assert (result.status, result.exhausted) == (SolveStatus.UNKNOWN, TIME)
+    assert threading.active_count() == before
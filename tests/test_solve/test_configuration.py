@@ -0,0 +1,52 @@
+import pytest
+
+from ltlf2asp.cli import parse_solve_args
+from ltlf2asp.parser import parse_formula, parse_formula_object, tableaux_reify
+from ltlf2asp.solve.configuration import PRESETS, SolverConfiguration
+from ltlf2asp.solve.decode_model import SolveStatus
+from ltlf2asp.solve.solver_interface import Solver
+from ltlf2asp.solve.tableaux import Reynolds
+
+
+def test_arguments():
+    assert SolverConfiguration().arguments() == []
+    assert SolverConfiguration(4, "split", "trendy").arguments() == [
+        "--parallel-mode=4,split",
+        "--configuration=trendy",
+    ]
+
+
+@pytest.mark.parametrize(
+    "threads, mode, preset",
+    [(0, "compete", None), (2, "race", None), (1, "split", "x")],
+)
+def test_invalid_configuration(threads, mode, preset):
+    with pytest.raises(ValueError):
+        SolverConfiguration(threads, mode, preset)
+
+
+@pytest.mark.parametrize("incremental", (False, True))
+@pytest.mark.parametrize(
+    "configuration",
+    [SolverConfiguration(2, "compete"), SolverConfiguration(2, "split", "crafty")]
+    + [SolverConfiguration(preset=x) for x in PRESETS],
+)
+def test_solvers_accept_configurations(incremental, configuration):
+    solver = Solver(incremental, 16, configuration=configuration)
+    result = solver.solve(parse_formula("G(a -> X b) & F a"))
+    assert result.status == SolveStatus.SATISFIABLE
+    assert solver.solve(parse_formula("X X X X X a")).k == 8
+
+    facts = tableaux_reify(parse_formula_object("G a & F ~a"))
+    assert Reynolds(False, configuration).solve(facts, 8).unsatisfiable
+
+
+def test_cli_configuration(tmp_path):
+    formula = tmp_path / "formula.ltl"
+    formula.write_text("F a")
+    args = parse_solve_args(
+        [str(formula), "8", "-t", "4", "--parallel-mode", "split"]
+        + ["--configuration", "handy"]
+    )
+    assert args.configuration == SolverConfiguration(4, "split", "handy")
+    assert parse_solve_args([str(formula), "8"]).configuration == SolverConfiguration()
@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from ltlf2asp.parser import parse_formula, parse_formula_object
+from ltlf2asp.solve.budget import TIME, Budget
+from ltlf2asp.solve.check_model import check_trace
+from ltlf2asp.solve.decode_model import SolveStatus
+from ltlf2asp.solve.explicit_tableaux import solve
+from ltlf2asp.solve.static_solve_loop import solve as solve_static
+
+CORPUS = Path(__file__).parent.parent / "test_solve_random_sample" / "formulas.txt"
+
+
+@pytest.mark.parametrize(
+    "formula_string",
+    (
+        "a",
+        "~a",
+        "WX a",
+        "(a U b) & (~a) & X(~a)",
+        "F(a) & F(~a)",
+        "G(a) & F(a)",
+        "G(WX(a))",
+        "G(true)",
+        "X X X X X X X X X X X X X X X X X X X X a",
+    ),
+)
+def test_satisfiable(formula_string):
+    result = solve(parse_formula_object(formula_string))
+    assert result.status == SolveStatus.SATISFIABLE
+    assert len(result.model) == result.k
+    assert check_trace(result.model.pi, parse_formula(formula_string))
+
+
+@pytest.mark.parametrize(
+    "formula_string",
+    (
+        "~a & a",
+        "a & (a -> G(~b)) & F(b)",
+        "X(True) & (WX a) & G(a -> X(a))",
+        "G(X(a))",
+        "G(a -> X a) & F(a)",
+        "F(false)",
+        "G(a -> X b) & G(b -> X a) & F(a)",
+    ),
+)
+def test_unsatisfiable(formula_string):
+    result = solve(parse_formula_object(formula_string))
+    assert result.status == SolveStatus.UNSATISFIABLE
+
+
+def test_agrees_with_static_solving():
+    for formula_string in CORPUS.read_text().splitlines()[:60]:
+        facts = parse_formula(formula_string)
+        result = solve(parse_formula_object(formula_string))
+        expected = solve_static(facts, 32)
+        if result.status == SolveStatus.SATISFIABLE:
+            assert check_trace(result.model.pi, facts)
+        else:
+            assert expected.status != SolveStatus.SATISFIABLE
+
+
+def test_deep_formula_and_budget():
+    depth = 2 * sys.getrecursionlimit()
+    result = solve(parse_formula_object("X " * depth + "a"))
+    assert (result.status, result.k) == (SolveStatus.SATISFIABLE, depth + 1)
+
+    result = solve(parse_formula_object("G(F a) & G(F ~a)"), Budget(time=0))
+    assert (result.status, result.exhausted) == (SolveStatus.UNKNOWN, TIME)
@@ -0,0 +1,71 @@
+from itertools import product
+from pathlib import Path
+
+import clingo
+import pytest
+
+from ltlf2asp.parser import parse_formula
+from ltlf2asp.parser.reify_as_atoms import add_facts
+from ltlf2asp.solve import CHECK
+from ltlf2asp.solve.incremental_solve_loop import solve as solve_incremental
+from ltlf2asp.solve.static_solve_loop import solve as solve_static
+
+CORPUS = Path(__file__).parent.parent / "test_solve_random_sample" / "formulas.txt"
+
+FORMULAS = (
+    "WX a",
+    "F a",
+    "G a",
+    "a W b",
+    "a M b",
+    "a -> b",
+    "a <-> b",
+    "G(a -> WX b)",
+    "(a W b) <-> F(a M b)",
+    "~(G a) | WX(X b)",
+)
+
+
+def traces(length):
+    states = list(product((True, False), repeat=2))
+    return product(states, repeat=length)
+
+
+def holds_at_start(facts, trace):
+    ctl = clingo.Control()
+    ctl.load(CHECK)
+    with ctl.backend() as backend:
+        add_facts(backend, facts)
+        for t, (a, b) in enumerate(trace):
+            time = backend.add_atom(clingo.Function("time", [clingo.Number(t)]))
+            backend.add_rule([time])
+            for name, value in (("a", a), ("b", b)):
+                symbol = clingo.Function(
+                    "trace", [clingo.Number(t), clingo.String(name)], value
+                )
+                backend.add_rule([backend.add_atom(symbol)])
+
+    ctl.ground([("base", [])])
+    root = next(x for x in facts if x.name == "root").arguments[0]
+    with ctl.solve(yield_=True) as models:
+        model = next(iter(models))
+        return model.contains(clingo.Function("holds", [clingo.Number(0), root]))
+
+
+@pytest.mark.parametrize("formula_string", FORMULAS)
+def test_native_facts_have_the_same_semantics(formula_string):
+    desugared = parse_formula(formula_string)
+    native = parse_formula(formula_string, native=True)
+    assert len(native) < len(desugared)
+
+    for length in (1, 2, 3):
+        for trace in traces(length):
+            expected = holds_at_start(desugared, trace)
+            assert holds_at_start(native, trace) == expected, trace
+
+
+@pytest.mark.parametrize("solve", (solve_static, solve_incremental))
+def test_native_facts_are_equisatisfiable_on_corpus(solve):
+    for line in CORPUS.read_text().splitlines()[:60]:
+        expected = solve(parse_formula(line), 8).status
+        assert solve(parse_formula(line, native=True), 8).status == expected, line
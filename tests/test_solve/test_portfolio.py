@@ -0,0 +1,75 @@
+import pytest
+
+from ltlf2asp.parser.parser import parse_formula_arrays
+from ltlf2asp.solve import portfolio
+from ltlf2asp.solve.decode_model import SolveStatus
+from ltlf2asp.solve.portfolio import INCREMENTAL, REYNOLDS, STATIC, solve
+
+
+def test_satisfiable_comes_with_a_model():
+    result = solve(parse_formula_arrays("G(a -> X b) & F a"), 16)
+    assert result.status == SolveStatus.SATISFIABLE
+    assert result.engine in (STATIC, INCREMENTAL)
+    assert result.model is not None and len(result.model) >= 2
+
+
+@pytest.mark.parametrize("formula_string", ["G a & F ~a", "a U b & G ~b"])
+def test_unsatisfiable_comes_from_the_tableaux(formula_string):
+    result = solve(parse_formula_arrays(formula_string), 16)
+    assert result.status == SolveStatus.UNSATISFIABLE
+    assert result.engine == REYNOLDS
+
+
+def test_single_engine():
+    result = solve(parse_formula_arrays("F a"), 16, engines=[INCREMENTAL])
+    assert result.engine == INCREMENTAL
+
+
+def test_inconclusive_engines():
+    # Needs 11 states, and only the ASP loops run: unknown at depth 8.
+    formula = parse_formula_arrays("X X X X X X X X X X a")
+    result = solve(formula, 8, engines=[STATIC, INCREMENTAL])
+    assert result.status == SolveStatus.UNKNOWN
+    assert result.k == 8
+    assert '"engine"' in result.json()
+
+
+@pytest.mark.parametrize(
+    "formula_string",
+    [
+        "(p13) M (X(X(X((p15) <-> ((p21) & (X((X(X(p17))) W (p6))))))))",
+        "(p15) R (X((X(p15)) & (X((X(False)) U (X(F((p8) R (p16))))))))",
+    ],
+)
+def test_tableaux_waits_for_the_models(formula_string):
+    # Satisfiable, but refuted by the tableaux at depth 8: whichever engine
+    # finishes first, the answer is the same.
+    formula = parse_formula_arrays(formula_string)
+    for _ in range(10):
+        assert solve(formula, 64).status == SolveStatus.SATISFIABLE
+
+
+def test_no_shallow_tableaux():
+    # Satisfiable, but refuted by the tableaux at depth 4.
+    formula = parse_formula_arrays("True U (X(X(X((X(p0)) & (X(p17))))))")
+    result = solve(formula, 64, engines=[REYNOLDS])
+    assert result.status == SolveStatus.UNKNOWN
+
+    # A satisfiable tableaux has no model to report.
+    result = solve(parse_formula_arrays("a & X b"), 8, engines=[REYNOLDS])
+    assert result.status == SolveStatus.UNKNOWN
+    assert '"UNKNOWN"' in result.json()
+
+
+def _fail(*args):
+    raise RuntimeError("engine failure")
+
+
+def test_failing_engine(monkeypatch):
+    monkeypatch.setitem(portfolio.SOLVERS, STATIC, _fail)
+    formula = parse_formula_arrays("F a")
+    result = solve(formula, 16, engines=[STATIC, INCREMENTAL])
+    assert (result.status, result.engine) == (SolveStatus.SATISFIABLE, INCREMENTAL)
+
+    with pytest.raises(RuntimeError, match="engine failure"):
+        solve(formula, 16, engines=[STATIC])
@@ -0,0 +1,92 @@
+import pytest
+
+from ltlf2asp.parser import parse_formula
+from ltlf2asp.solve.decode_model import SolveStatus
+from ltlf2asp.solve.incremental_solve_loop import solve as solve_incremental
+from ltlf2asp.solve.schedule import (
+    DOUBLING,
+    Explicit,
+    Geometric,
+    Linear,
+    Luby,
+    luby,
+    parse_schedule,
+)
+from ltlf2asp.solve.static_solve_loop import solve as solve_static
+from ltlf2asp.solve.static_solve_loop import solve_shared
+
+
+def test_luby_sequence():
+    expected = [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8, 1]
+    assert [luby(i) for i in range(1, 17)] == expected
+
+
+def test_segments():
+    assert list(DOUBLING.segments(10)) == [(0, 1), (1, 2), (2, 4), (4, 8)]
+    assert list(Linear(3, 3).segments(10)) == [(0, 3), (3, 6), (6, 9)]
+    assert list(Geometric(1.5, 2).segments(8)) == [(0, 2), (2, 3), (3, 5), (5, 8)]
+    assert list(Luby(2).segments(16)) == [
+        (0, 2),
+        (2, 4),
+        (4, 8),
+        (8, 10),
+        (10, 12),
+        (12, 16),
+    ]
+    assert list(Explicit((1, 5, 20)).segments(16)) == [(0, 1), (1, 5)]
+
+
+def test_segments_must_increase():
+    with pytest.raises(ValueError):
+        list(Explicit((4, 2)).segments(16))
+
+
+@pytest.mark.parametrize(
+    "spec, schedule",
+    [
+        ("doubling", DOUBLING),
+        ("linear", Linear(1, 1)),
+        ("linear:4", Linear(4, 4)),
+        ("geometric:1.5", Geometric(1.5)),
+        ("luby:3", Luby(3)),
+        ("list:1,2,10", Explicit((1, 2, 10))),
+    ],
+)
+def test_parse_schedule(spec, schedule):
+    assert parse_schedule(spec) == schedule
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "",
+        "list",
+        "linear:x",
+        "fibonacci",
+        "linear:0",
+        "geometric:0.5",
+        "geometric:1",
+        "luby:0",
+        "list:4,2",
+        "list:0,2",
+    ],
+)
+def test_parse_unknown_schedule(spec):
+    with pytest.raises(ValueError):
+        parse_schedule(spec)
+
+
+@pytest.mark.parametrize("solve", [solve_static, solve_shared, solve_incremental])
+@pytest.mark.parametrize("schedule", [Linear(1), Geometric(3), Luby(1)])
+def test_loops_follow_the_schedule(solve, schedule):
+    # The shortest model has 6 states: the first segment containing 5 wins.
+    facts = parse_formula("X X X X X a & G(a -> WX b)")
+    result = solve(facts, 32, schedule)
+    a, b = next((a, b) for a, b in schedule.segments(32) if a <= 5 < b)
+    assert result.status == SolveStatus.SATISFIABLE
+    assert result.k == b
+    assert a + 1 <= len(result.model) <= b
+
+    # Unknown past the last segment that fits in the maximum horizon.
+    *_, (_, last) = schedule.segments(4)
+    assert solve(parse_formula("X X X X X a"), 4, schedule).k == last
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+import pytest
+
+from ltlf2asp.parser import parse_formula
+from ltlf2asp.solve.decode_model import SolveStatus
+from ltlf2asp.solve.static_solve_loop import solve, solve_shared
+
+CORPUS = Path(__file__).parent.parent / "test_solve_random_sample" / "formulas.txt"
+FORMULAS = CORPUS.read_text().splitlines()[:100]
+
+
+@pytest.mark.parametrize("native", (False, True))
+def test_shared_control_agrees_with_static_loop(native):
+    for formula_string in FORMULAS:
+        facts = parse_formula(formula_string, native=native)
+        expected, result = solve(facts, 16), solve_shared(facts, 16)
+        assert (result.status, result.k) == (expected.status, expected.k)
+
+        if result.status == SolveStatus.SATISFIABLE:
+            assert result.model is not None
+            assert result.k // 2 <= len(result.model) <= result.k
+
+
+def test_later_horizons_see_no_atoms_of_previous_ones():
+    # Unsatisfiable below 8 states: the model must come from horizon(4, 8).
+    facts = parse_formula("X X X X X a & G(a -> X b)")
+    result = solve_shared(facts, 16)
+    assert result.status == SolveStatus.SATISFIABLE
+    assert result.k == 8
+    assert 6 <= len(result.model) < 8
+    assert result.model.state(5).sigma["a"]
+    assert result.model.state(6).sigma["b"]
+
+
+def test_unknown_past_max_horizon():
+    facts = parse_formula("X X X X a")
+    assert solve_shared(facts, 4).status == SolveStatus.UNKNOWN